@@ -0,0 +1,3 @@
+-- Supports the legacy duplicate-name report (GROUP BY full_name over born_date)
+-- so it is resolved from the index instead of a players self-join.
+CREATE INDEX idx_players_full_name_born_date ON players (full_name, born_date);
@@ -0,0 +1,8 @@
+-- Make raw_html.sha256 UNIQUE so the fetcher can store a batch of pages with one
+-- INSERT ... ON DUPLICATE KEY UPDATE instead of a SELECT-then-INSERT per page
+-- (which also raced between concurrent fetchers).
+-- Resolve duplicates first or the ALTER will fail, e.g. keep the oldest copy:
+--   DELETE r FROM raw_html r JOIN raw_html k ON k.sha256 = r.sha256 AND k.id < r.id;
+
+ALTER TABLE raw_html
+    ADD UNIQUE KEY uq_raw_html_sha256 (sha256);
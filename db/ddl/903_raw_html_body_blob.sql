@@ -0,0 +1,6 @@
+-- raw_html.body holds zlib-compressed page bytes written by the raw fetcher, so it
+-- must be binary. Existing TEXT bodies convert to their UTF-8 bytes, which readers
+-- (parse_load.decode_raw_body) still accept uncompressed.
+
+ALTER TABLE raw_html
+    MODIFY body LONGBLOB;
@@ -0,0 +1,6 @@
+-- With RAW_BODY_DIR set, page bodies live in the external content-addressed store
+-- (etl/raw_store.py) and raw_html rows keep only url/sha256/etag/status metadata,
+-- so body must accept NULL.
+
+ALTER TABLE raw_html
+    MODIFY body LONGBLOB NULL;
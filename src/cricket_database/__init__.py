@@ -1,6 +1,6 @@
 """Cricket Database System - Core package."""
 
-from .config import settings
+from .config import get_settings, settings
 from .database import get_database_engine, get_session
 
-__all__ = ["settings", "get_database_engine", "get_session"]
+__all__ = ["settings", "get_settings", "get_database_engine", "get_session"]
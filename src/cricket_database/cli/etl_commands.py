@@ -0,0 +1,159 @@
+"""ETL commands (fetch, parse-load, scrape, update).
+
+The app's click group builds these the first time one of them is looked up
+(see ``_LazyETLGroup`` in ``main``), so the lightweight commands skip them.
+"""
+
+from typing import Optional
+
+import click
+import typer
+
+from .main import display_scraping_results, display_update_results
+from .state import _cli_errors, _fail, _print_table, _progress, app_state, console, run_sync
+
+
+def fetch(
+    series_key: Optional[str] = typer.Option(None, "--series-key", help="Year or competition key"),
+    from_date: Optional[str] = typer.Option(None, "--from-date", help="Start date YYYY-MM-DD"),
+    max_pages: Optional[int] = typer.Option(None, "--max-pages", help="Limit pages"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Do not persist (informational only)"),
+    use_browser: bool = typer.Option(False, "--browser", help="Use Playwright (Chromium)"),
+    headers_only: bool = typer.Option(False, "--headers-only", help="HEAD requests only; do not download bodies"),
+    max_new_matches: Optional[int] = typer.Option(None, "--max-new-matches", help="Safety cap on new matches/pages per run")
+):
+    """Polite raw fetcher for index/match lists/scorecards."""
+    try:
+        from ..etl.raw_fetch import cli_fetch as raw_cli_fetch
+        run_sync(raw_cli_fetch(series_key, from_date, max_pages, dry_run, use_browser, headers_only, max_new_matches))
+        console.print("[green]✅ Fetch completed[/green]")
+    except _cli_errors() as e:
+        _fail("Fetch failed", e)
+
+
+def parse_load(
+    limit: int = typer.Option(10, "--limit", help="Number of raw_html rows to parse"),
+    days_back: Optional[int] = typer.Option(None, "--days-back", help="Only parse rows fetched in the last N days"),
+    dry_run: bool = typer.Option(True, "--dry-run/--no-dry-run", help="Skip DB writes (default: dry-run)"),
+    workers: int = typer.Option(1, "--workers", help="Parser processes to run in parallel (0 = one per CPU)"),
+):
+    """Parse recent raw_html scorecards and print a summary. DB upserts are off by default."""
+    try:
+        from ..etl.parse_load import run_parse_load
+        summaries = run_parse_load(limit=limit, days_back=days_back, dry_run=dry_run, workers=workers)
+        rows = (
+            (
+                str(s.get("raw_id")),
+                str(s.get("source_match_key")),
+                ", ".join(s.get("teams", [])),
+                str(s.get("innings")),
+                str(len(s.get("warnings", []))),
+            )
+            for s in summaries
+        )
+        _print_table(
+            "Parse Summaries",
+            [("raw_id", "cyan"), ("match_key", "magenta"), ("teams", "green"), ("innings", "yellow"), ("warnings", "red")],
+            rows,
+        )
+        if dry_run:
+            console.print("[yellow]Dry-run: no DB writes performed[/yellow]")
+        else:
+            console.print("[green]✅ Parsed and loaded[/green]")
+    except _cli_errors() as e:
+        _fail("Parse-load failed", e)
+
+
+def scrape(
+    source: str = typer.Option("all", "--source", help="Data source to scrape from", 
+                              click_type=click.Choice(['all', 'espn', 'cricket_api'])),
+    data_type: str = typer.Option("all", "--data-type", help="Type of data to scrape",
+                                 click_type=click.Choice(['all', 'teams', 'players', 'matches'])),
+    limit: Optional[int] = typer.Option(None, "--limit", help="Limit number of records to scrape")
+):
+    """Scrape cricket data from sources."""
+    dry_run = app_state['dry_run']
+    
+    if dry_run:
+        console.print("[yellow]🔍 Running in dry-run mode - no data will be saved[/yellow]")
+    
+    console.print(f"[bold]Scraping {data_type} data from {source}...[/bold]")
+    
+    from ..etl import ETLPipeline
+
+    async def run_scraping():
+        pipeline = ETLPipeline(dry_run=dry_run)
+        
+        with _progress() as progress:
+            task = progress.add_task("Scraping data...", total=None)
+            
+            try:
+                if data_type == 'all':
+                    results = await pipeline.run_full_pipeline()
+                else:
+                    # Run specific data type scraping
+                    results = await pipeline._extract_data()
+                    if limit:
+                        results[data_type] = results.get(data_type, [])[:limit]
+                
+                progress.update(task, description="✅ Scraping completed")
+                
+                # Display results
+                display_scraping_results(results)
+                
+            except _cli_errors() as e:
+                progress.update(task, description="❌ Scraping failed")
+                _fail("Scraping failed", e)
+    
+    run_sync(run_scraping())
+
+
+def update(
+    incremental: bool = typer.Option(False, "--incremental", help="Run incremental update"),
+    days_back: int = typer.Option(7, "--days-back", help="Days back for incremental update"),
+    full: bool = typer.Option(False, "--full", help="Run full data refresh")
+):
+    """Update cricket database with latest data."""
+    dry_run = app_state['dry_run']
+    
+    if dry_run:
+        console.print("[yellow]🔍 Running in dry-run mode - no data will be saved[/yellow]")
+    
+    if not (incremental or full):
+        console.print("[red]❌ Please specify either --incremental or --full[/red]")
+        raise typer.Exit(1)
+    
+    console.print("[bold]Updating cricket database...[/bold]")
+    
+    from ..etl import ETLPipeline
+
+    async def run_update():
+        pipeline = ETLPipeline(dry_run=dry_run)
+        
+        with _progress() as progress:
+            task = progress.add_task("Updating data...", total=None)
+            
+            try:
+                if incremental:
+                    results = await pipeline.run_incremental_update(days_back)
+                else:
+                    results = await pipeline.run_full_pipeline()
+                
+                progress.update(task, description="✅ Update completed")
+                
+                # Display results
+                display_update_results(results)
+                
+            except _cli_errors() as e:
+                progress.update(task, description="❌ Update failed")
+                _fail("Update failed", e)
+    
+    run_sync(run_update())
+
+
+def register(app: typer.Typer) -> None:
+    """Attach the ETL commands to ``app``."""
+    app.command("fetch")(fetch)
+    app.command("parse-load")(parse_load)
+    app.command()(scrape)
+    app.command()(update)
@@ -1,74 +1,109 @@
 """Main CLI interface for cricket database system."""
 
 import asyncio
+import atexit
 import logging
-import sys
+import queue
+import re
 from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
+import click
 import typer
-from rich.console import Console
+from typer.core import TyperGroup
 from rich.logging import RichHandler
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-from ..etl import ETLPipeline
-from ..etl.raw_fetch import cli_fetch as raw_cli_fetch
-from ..etl.parse_load import run_parse_load
-from ..etl.parse_scorecard import parse_scorecard
-from ..etl.transform import to_rows
-from ..etl.load import load_rows
-from ..etl.config import get_etl_config
-from ..database import get_database_engine
-from ..etl.reconcile import reconcile_main
+
+# Heavy ETL modules (scrapers, lxml, Playwright) are imported inside the commands
+# that need them so `--help` and light commands start fast.
 from ..database import create_tables, drop_tables, get_database_engine
 from ..config import settings
-from ..utils.migrate_sql import migrate as run_sql_migrations
+from .state import _cli_errors, _fail, _print_table, _progress, app_state, console, run_sync
+
+_REPORT_SPLIT_RE = re.compile(r"\s*,\s*")
 
-# Initialize rich console
-console = Console()
 
 # Configure logging
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_LOGGING_CONFIGURED: Optional[tuple] = None
+_LOG_LISTENER: Optional[QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Flush and stop the background file-logging thread, if one is running."""
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        for handler in _LOG_LISTENER.handlers:
+            handler.close()
+        _LOG_LISTENER = None
+
+
+atexit.register(_stop_log_listener)
+
+
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None):
-    """Setup logging configuration."""
+    """Setup logging configuration (no-op if already configured the same way)."""
+    global _LOGGING_CONFIGURED, _LOG_LISTENER
     log_level = getattr(logging, level.upper(), logging.INFO)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    key = (log_level, log_file)
+    if _LOGGING_CONFIGURED == key:
+        return
     
     # Setup console handler with rich
     console_handler = RichHandler(console=console, show_time=True, show_path=False)
     console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_LOG_FORMATTER)
     
-    # Setup file handler if specified
+    # Setup file handler if specified; disk writes happen on a listener thread
+    _stop_log_listener()
     handlers = [console_handler]
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(log_file, maxBytes=64 << 20, backupCount=5)
         file_handler.setLevel(log_level)
-        file_handler.setFormatter(formatter)
-        handlers.append(file_handler)
+        file_handler.setFormatter(_LOG_FORMATTER)
+        log_queue: queue.Queue = queue.Queue(-1)
+        _LOG_LISTENER = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _LOG_LISTENER.start()
+        handlers.append(QueueHandler(log_queue))
     
-    # Configure root logger
+    # Configure root logger (force=True closes handlers from a previous configuration)
     logging.basicConfig(
         level=log_level,
         handlers=handlers,
         force=True
     )
+    _LOGGING_CONFIGURED = key
+
+
+# Commands defined in cli/etl_commands.py, attached the first time click looks one up
+_ETL_COMMANDS = ("fetch", "parse-load", "scrape", "update")
+
+
+class _LazyETLGroup(TyperGroup):
+    """Click group that builds the ETL commands on first lookup instead of at import."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in _ETL_COMMANDS if name not in names]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in _ETL_COMMANDS and cmd_name not in self.commands:
+            from .etl_commands import register as register_etl_commands
+            etl_app = typer.Typer()
+            register_etl_commands(etl_app)
+            self.commands.update(typer.main.get_group(etl_app).commands)
+        return super().get_command(ctx, cmd_name)
 
 
 app = typer.Typer(
     name="cricket-database",
     help="Cricket Database System - Production-grade cricket data ETL pipeline",
+    cls=_LazyETLGroup,
     no_args_is_help=True
 )
 
-# Global state
-app_state = {"dry_run": False, "verbose": False}
-
 @app.callback()
 def main(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging"),
@@ -105,9 +140,8 @@ def setup_db(force: bool = typer.Option(False, "--force", help="Force recreation
         
         console.print("[green]✅ Database schema initialized successfully![/green]")
         
-    except Exception as e:
-        console.print(f"[red]❌ Database setup failed: {e}[/red]")
-        raise typer.Exit(1)
+    except _cli_errors() as e:
+        _fail("Database setup failed", e)
 
 
 @app.command("migrate-sql")
@@ -117,19 +151,17 @@ def migrate_sql(
     """Apply SQL migrations from db/ddl in lexical order."""
     console.print("[bold]Applying SQL migrations...[/bold]")
     try:
+        from ..utils.migrate_sql import migrate as run_sql_migrations
         engine = get_database_engine()
         results = run_sql_migrations(engine, force_reapply=force_reapply)
-        table = Table(title="SQL Migrations Applied")
-        table.add_column("File", style="cyan")
-        table.add_column("Statements", style="green")
-        table.add_column("Status", style="magenta")
-        for filename, count, status in results:
-            table.add_row(filename, str(count), status)
-        console.print(table)
+        _print_table(
+            "SQL Migrations Applied",
+            [("File", "cyan"), ("Statements", "green"), ("Status", "magenta")],
+            [(filename, str(count), status) for filename, count, status in results],
+        )
         console.print("[green]✅ SQL migrations completed[/green]")
-    except Exception as e:
-        console.print(f"[red]❌ SQL migrations failed: {e}[/red]")
-        raise typer.Exit(1)
+    except _cli_errors() as e:
+        _fail("SQL migrations failed", e)
 
 
 @app.command("refresh-season-all")
@@ -137,221 +169,102 @@ def refresh_season_all(season_id: int = typer.Argument(..., help="Season ID to r
     """Run stored procedure to refresh all season summaries and series leaders."""
     console.print(f"[bold]Refreshing season summaries for season_id={season_id}...[/bold]")
     try:
-        engine = get_database_engine()
-        with engine.begin() as conn:
-            conn.exec_driver_sql("CALL refresh_season_all(%s)", (season_id,))
-        console.print("[green]✅ Season summaries refreshed[/green]")
-    except Exception as e:
-        console.print(f"[red]❌ Refresh failed: {e}[/red]")
-        raise typer.Exit(1)
-
-
-@app.command("fetch")
-def fetch(
-    series_key: Optional[str] = typer.Option(None, "--series-key", help="Year or competition key"),
-    from_date: Optional[str] = typer.Option(None, "--from-date", help="Start date YYYY-MM-DD"),
-    max_pages: Optional[int] = typer.Option(None, "--max-pages", help="Limit pages"),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Do not persist (informational only)"),
-    use_browser: bool = typer.Option(False, "--browser", help="Use Playwright (Chromium)"),
-    headers_only: bool = typer.Option(False, "--headers-only", help="HEAD requests only; do not download bodies"),
-    max_new_matches: Optional[int] = typer.Option(None, "--max-new-matches", help="Safety cap on new matches/pages per run")
-):
-    """Polite raw fetcher for index/match lists/scorecards."""
-    try:
-        asyncio.run(raw_cli_fetch(series_key, from_date, max_pages, dry_run, use_browser, headers_only, max_new_matches))
-        console.print("[green]✅ Fetch completed[/green]")
-    except Exception as e:
-        console.print(f"[red]❌ Fetch failed: {e}[/red]")
-        raise typer.Exit(1)
+        from ..database import get_async_database_engine
 
+        async def refresh():
+            async with get_async_database_engine().begin() as conn:
+                await conn.exec_driver_sql("CALL refresh_season_all(%s)", (season_id,))
 
-@app.command("parse-load")
-def parse_load(
-    limit: int = typer.Option(10, "--limit", help="Number of raw_html rows to parse"),
-    days_back: Optional[int] = typer.Option(None, "--days-back", help="Only parse rows fetched in the last N days"),
-    dry_run: bool = typer.Option(True, "--dry-run/--no-dry-run", help="Skip DB writes (default: dry-run)")
-):
-    """Parse recent raw_html scorecards and print a summary. DB upserts are off by default."""
-    try:
-        summaries = run_parse_load(limit=limit, days_back=days_back, dry_run=dry_run)
-        table = Table(title="Parse Summaries")
-        table.add_column("raw_id", style="cyan")
-        table.add_column("match_key", style="magenta")
-        table.add_column("teams", style="green")
-        table.add_column("innings", style="yellow")
-        table.add_column("warnings", style="red")
-        for s in summaries:
-            teams = ", ".join(s.get("teams", []))
-            warns = str(len(s.get("warnings", [])))
-            table.add_row(str(s.get("raw_id")), str(s.get("source_match_key")), teams, str(s.get("innings")), warns)
-        console.print(table)
-        if dry_run:
-            console.print("[yellow]Dry-run: no DB writes performed[/yellow]")
-        else:
-            console.print("[green]✅ Parsed and loaded[/green]")
-    except Exception as e:
-        console.print(f"[red]❌ Parse-load failed: {e}[/red]")
-        raise typer.Exit(1)
+        run_sync(refresh())
+        console.print("[green]✅ Season summaries refreshed[/green]")
+    except _cli_errors() as e:
+        _fail("Refresh failed", e)
 
 
 @app.command("load")
 def load(
-    match_url: Optional[str] = typer.Option(None, "--match-url", help="Absolute or relative URL to fetch and load"),
+    match_url: Optional[List[str]] = typer.Option(None, "--match-url", help="Absolute or relative URL to fetch and load (repeatable)"),
     from_raw: Optional[int] = typer.Option(None, "--from-raw", help="raw_html.id to parse and load"),
     use_browser: bool = typer.Option(False, "--browser", help="Use Playwright for JS pages"),
 ):
-    """Parse and load a single match by URL or existing raw_html id (transaction per match)."""
+    """Parse and load matches by URL or an existing raw_html id (transaction per match)."""
     if not match_url and not from_raw:
         console.print("[red]❌ Provide --match-url or --from-raw[/red]")
         raise typer.Exit(2)
+    from ..etl.config import get_etl_config
+    from ..etl.load import load_rows
+    from ..etl.parse_scorecard import parse_scorecard
+    from ..etl.transform import to_rows
+
     cfg = get_etl_config()
     engine = get_database_engine()
     try:
+        parsed = []
         if match_url:
-            # Reuse raw fetcher to get body
+            # Reuse one raw fetcher (and its pooled HTTP client) for every URL
             from ..etl.raw_fetch import RawFetcher
-            fetcher = RawFetcher(use_browser=use_browser)
-            status, body, etag = awaitable_fetch(fetcher, match_url)
-            html_text = body.decode("utf-8", errors="ignore")
+
+            async def fetch_and_parse(fetcher, url):
+                _status, body, _etag = await fetcher._fetch(url)
+                # Parse in a worker thread so the loop keeps serving the other fetches
+                return await asyncio.to_thread(parse_scorecard, body, url)
+
+            async def fetch_all():
+                async with RawFetcher(use_browser=use_browser) as fetcher:
+                    return await _bounded_gather(
+                        [fetch_and_parse(fetcher, u) for u in match_url], limit=cfg.scraper.concurrency
+                    )
+
+            parsed = list(zip(match_url, run_sync(fetch_all())))
         else:
-            with engine.connect() as conn:
-                row = conn.exec_driver_sql("SELECT url, body FROM raw_html WHERE id=%s", (from_raw,)).fetchone()
+            from sqlalchemy import text
+            from ..etl.parse_load import decode_raw_body
+            stmt = text("SELECT url, body, sha256 FROM raw_html WHERE id=:id").bindparams(id=from_raw)
+            with engine.connect().execution_options(stream_results=True, yield_per=1) as conn:
+                row = conn.execute(stmt).fetchone()
                 if not row:
                     console.print("[red]❌ raw_html not found[/red]")
                     raise typer.Exit(3)
-                match_url, html_text = str(row[0]), str(row[1])
-
-        match, warnings = parse_scorecard(html_text, page_url=match_url)
-        rows = to_rows(match, cfg.sources.cricketarchive_source_id)
-        load_rows(engine, rows)
-        console.print("[green]✅ Match loaded successfully[/green]")
-        if warnings:
-            console.print(f"[yellow]Warnings: {len(warnings)}[/yellow]")
-    except Exception as e:
-        console.print(f"[red]❌ Load failed: {e}[/red]")
-        raise typer.Exit(1)
+                parsed.append((row.url, parse_scorecard(decode_raw_body(row.body, row.sha256), page_url=row.url)))
+
+        for url, (match, warnings) in parsed:
+            rows = to_rows(match, cfg.sources.cricketarchive_source_id)
+            load_rows(engine, rows)
+            console.print(f"[green]✅ Match loaded successfully[/green] {url}")
+            if warnings:
+                console.print(f"[yellow]Warnings: {len(warnings)}[/yellow]")
+    except _cli_errors() as e:
+        _fail("Load failed", e)
+
 
+async def _bounded_gather(coros, limit: int):
+    """Gather coroutines concurrently with at most ``limit`` in flight."""
+    semaphore = asyncio.Semaphore(max(limit, 1))
 
-def awaitable_fetch(fetcher, url: str):
-    import asyncio
-    return asyncio.get_event_loop().run_until_complete(fetcher._fetch(url))
+    async def _run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(_run(c) for c in coros))
 
 
 @app.command("reconcile")
 def reconcile(
-    report: Optional[str] = typer.Option(None, "--report", help="Comma-separated report keys e.g. missing_matches,dup_players,counts")
+    report: Optional[str] = typer.Option(None, "--report", help="Comma-separated report keys e.g. missing_matches,dup_players,counts"),
+    refresh: bool = typer.Option(False, "--refresh", help="Regenerate reports even if a fresh cached copy exists"),
+    exact: bool = typer.Option(False, "--exact", help="Counts report: exact COUNT(*) per table instead of table statistics"),
 ):
     """Run reconciliation reports against the existing Cricinfo DB (CRICINFO_RO_DSN)."""
     if not report:
         console.print("[yellow]No report specified; defaulting to 'counts'[/yellow]")
         report = "counts"
-    keys = [k.strip() for k in report.split(",") if k.strip()]
+    keys = list(filter(None, _REPORT_SPLIT_RE.split(report.strip())))
     try:
-        outputs = reconcile_main(keys)
-        table = Table(title="Reconciliation Outputs")
-        table.add_column("Report", style="cyan")
-        table.add_column("Path", style="green")
-        for k, v in outputs.items():
-            table.add_row(k, v)
-        console.print(table)
-    except Exception as e:
-        console.print(f"[red]❌ Reconciliation failed: {e}[/red]")
-        raise typer.Exit(1)
-
-
-@app.command()
-def scrape(
-    source: str = typer.Option("all", "--source", help="Data source to scrape from", 
-                              click_type=typer.Choice(['all', 'espn', 'cricket_api'])),
-    data_type: str = typer.Option("all", "--data-type", help="Type of data to scrape",
-                                 click_type=typer.Choice(['all', 'teams', 'players', 'matches'])),
-    limit: Optional[int] = typer.Option(None, "--limit", help="Limit number of records to scrape")
-):
-    """Scrape cricket data from sources."""
-    dry_run = app_state['dry_run']
-    
-    if dry_run:
-        console.print("[yellow]🔍 Running in dry-run mode - no data will be saved[/yellow]")
-    
-    console.print(f"[bold]Scraping {data_type} data from {source}...[/bold]")
-    
-    async def run_scraping():
-        pipeline = ETLPipeline(dry_run=dry_run)
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Scraping data...", total=None)
-            
-            try:
-                if data_type == 'all':
-                    results = await pipeline.run_full_pipeline()
-                else:
-                    # Run specific data type scraping
-                    results = await pipeline._extract_data()
-                    if limit:
-                        results[data_type] = results.get(data_type, [])[:limit]
-                
-                progress.update(task, description="✅ Scraping completed")
-                
-                # Display results
-                display_scraping_results(results)
-                
-            except Exception as e:
-                progress.update(task, description=f"❌ Scraping failed: {e}")
-                console.print(f"[red]Scraping failed: {e}[/red]")
-                raise typer.Exit(1)
-    
-    asyncio.run(run_scraping())
-
-
-@app.command()
-def update(
-    incremental: bool = typer.Option(False, "--incremental", help="Run incremental update"),
-    days_back: int = typer.Option(7, "--days-back", help="Days back for incremental update"),
-    full: bool = typer.Option(False, "--full", help="Run full data refresh")
-):
-    """Update cricket database with latest data."""
-    dry_run = app_state['dry_run']
-    
-    if dry_run:
-        console.print("[yellow]🔍 Running in dry-run mode - no data will be saved[/yellow]")
-    
-    if not (incremental or full):
-        console.print("[red]❌ Please specify either --incremental or --full[/red]")
-        raise typer.Exit(1)
-    
-    console.print("[bold]Updating cricket database...[/bold]")
-    
-    async def run_update():
-        pipeline = ETLPipeline(dry_run=dry_run)
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Updating data...", total=None)
-            
-            try:
-                if incremental:
-                    results = await pipeline.run_incremental_update(days_back)
-                else:
-                    results = await pipeline.run_full_pipeline()
-                
-                progress.update(task, description="✅ Update completed")
-                
-                # Display results
-                display_update_results(results)
-                
-            except Exception as e:
-                progress.update(task, description=f"❌ Update failed: {e}")
-                console.print(f"[red]Update failed: {e}[/red]")
-                raise typer.Exit(1)
-    
-    asyncio.run(run_update())
+        from ..etl.reconcile import reconcile_main
+        outputs = reconcile_main(keys, refresh=refresh, exact=exact)
+        _print_table("Reconciliation Outputs", [("Report", "cyan"), ("Path", "green")], list(outputs.items()))
+    except _cli_errors() as e:
+        _fail("Reconciliation failed", e)
 
 
 @app.command()
@@ -359,14 +272,12 @@ def quality_check():
     """Run data quality checks."""
     console.print("[bold]Running data quality checks...[/bold]")
     
+    from ..etl import ETLPipeline
+
     async def run_quality_checks():
         pipeline = ETLPipeline()
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("Checking data quality...", total=None)
             
             try:
@@ -376,12 +287,11 @@ def quality_check():
                 # Display results
                 display_quality_results(results)
                 
-            except Exception as e:
-                progress.update(task, description=f"❌ Quality checks failed: {e}")
-                console.print(f"[red]Quality checks failed: {e}[/red]")
-                raise typer.Exit(1)
+            except _cli_errors() as e:
+                progress.update(task, description="❌ Quality checks failed")
+                _fail("Quality checks failed", e)
     
-    asyncio.run(run_quality_checks())
+    run_sync(run_quality_checks())
 
 
 @app.command()
@@ -389,14 +299,12 @@ def validate_sources():
     """Validate data sources connectivity."""
     console.print("[bold]Validating data sources...[/bold]")
     
+    from ..etl import ETLPipeline
+
     async def run_validation():
         pipeline = ETLPipeline()
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("Validating sources...", total=None)
             
             try:
@@ -406,12 +314,11 @@ def validate_sources():
                 # Display results
                 display_validation_results(results)
                 
-            except Exception as e:
-                progress.update(task, description=f"❌ Validation failed: {e}")
-                console.print(f"[red]Validation failed: {e}[/red]")
-                raise typer.Exit(1)
+            except _cli_errors() as e:
+                progress.update(task, description="❌ Validation failed")
+                _fail("Validation failed", e)
     
-    asyncio.run(run_validation())
+    run_sync(run_validation())
 
 
 @app.command()
@@ -419,41 +326,18 @@ def status():
     """Show system status and configuration."""
     console.print("[bold]System Status[/bold]")
     
-    async def show_status():
-        pipeline = ETLPipeline()
-        status_info = await pipeline.get_pipeline_status()
-        
-        # Display configuration
-        config_table = Table(title="Pipeline Configuration")
-        config_table.add_column("Setting", style="cyan")
-        config_table.add_column("Value", style="green")
-        
-        for key, value in status_info["pipeline_config"].items():
-            config_table.add_row(key, str(value))
-        
-        console.print(config_table)
-        
-        # Display scraper configuration
-        scraper_table = Table(title="Scraper Configuration")
-        scraper_table.add_column("Setting", style="cyan")
-        scraper_table.add_column("Value", style="green")
-        
-        for key, value in status_info["scraper_config"].items():
-            scraper_table.add_row(key, str(value))
-        
-        console.print(scraper_table)
-        
-        # Display data quality configuration
-        quality_table = Table(title="Data Quality Configuration")
-        quality_table.add_column("Setting", style="cyan")
-        quality_table.add_column("Value", style="green")
-        
-        for key, value in status_info["data_quality_config"].items():
-            quality_table.add_row(key, str(value))
-        
-        console.print(quality_table)
-    
-    asyncio.run(show_status())
+    from ..etl import ETLPipeline
+
+    pipeline = ETLPipeline()
+    status_info = pipeline.get_pipeline_status()
+
+    columns = [("Setting", "cyan"), ("Value", "green")]
+    for title, key in (
+        ("Pipeline Configuration", "pipeline_config"),
+        ("Scraper Configuration", "scraper_config"),
+        ("Data Quality Configuration", "data_quality_config"),
+    ):
+        _print_table(title, columns, [(k, str(v)) for k, v in status_info[key].items()])
 
 
 @app.command()
@@ -466,81 +350,68 @@ def schedule(
     console.print(f"[bold]Scheduling automated updates with cron: {schedule}[/bold]")
     
     try:
-        import schedule
-        import time
-        
-        def run_update():
-            """Run the update process."""
-            console.print(f"[blue]🕐 Running scheduled update at {datetime.now()}[/blue]")
-            
-            async def update_task():
-                pipeline = ETLPipeline()
-                if incremental:
-                    results = await pipeline.run_incremental_update(days_back)
-                else:
-                    results = await pipeline.run_full_pipeline()
-                
-                if results["status"] == "success":
-                    console.print("[green]✅ Scheduled update completed successfully[/green]")
-                else:
-                    console.print(f"[red]❌ Scheduled update failed: {results.get('error', 'Unknown error')}[/red]")
-            
-            asyncio.run(update_task())
+        from croniter import croniter
+    except ImportError:
+        console.print("[red]❌ croniter not installed. Install with: pip install croniter[/red]")
+        raise typer.Exit(1)
+    
+    if not croniter.is_valid(schedule):
+        console.print(f"[red]❌ Invalid cron expression: {schedule}[/red]")
+        raise typer.Exit(1)
+    
+    from ..etl import ETLPipeline
+    
+    async def update_task():
+        console.print(f"[blue]🕐 Running scheduled update at {datetime.now()}[/blue]")
+        pipeline = ETLPipeline()
+        if incremental:
+            results = await pipeline.run_incremental_update(days_back)
+        else:
+            results = await pipeline.run_full_pipeline()
         
-        # Schedule the job
-        if schedule == '0 2 * * *':  # Daily at 2 AM
-            schedule.every().day.at("02:00").do(run_update)
-        elif schedule == '0 */6 * * *':  # Every 6 hours
-            schedule.every(6).hours.do(run_update)
-        elif schedule == '0 */1 * * *':  # Every hour
-            schedule.every().hour.do(run_update)
+        if results["status"] == "success":
+            console.print("[green]✅ Scheduled update completed successfully[/green]")
         else:
-            console.print("[red]❌ Unsupported schedule format. Use standard cron format.[/red]")
-            raise typer.Exit(1)
+            console.print(f"[red]❌ Scheduled update failed: {results.get('error', 'Unknown error')}[/red]")
+    
+    async def scheduler():
+        # Sleep until the next cron fire time instead of polling every minute
+        cron = croniter(schedule, datetime.now())
+        while True:
+            next_fire = cron.get_next(datetime)
+            delta = (next_fire - datetime.now()).total_seconds()
+            await asyncio.sleep(max(0.0, delta))
+            await update_task()
+    
+    try:
+        # Open the pool once up front so every tick reuses warm connections
+        engine = get_database_engine()
+        with engine.connect():
+            pass
         
         console.print("[green]✅ Scheduler started. Press Ctrl+C to stop.[/green]")
-        
-        # Keep the scheduler running
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
-            
+        run_sync(scheduler())
     except KeyboardInterrupt:
         console.print("\n[yellow]⏹️ Scheduler stopped by user[/yellow]")
-    except ImportError:
-        console.print("[red]❌ Schedule library not installed. Install with: pip install schedule[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]❌ Scheduler failed: {e}[/red]")
-        raise typer.Exit(1)
+    except _cli_errors() as e:
+        _fail("Scheduler failed", e)
 
 
 def display_scraping_results(results):
     """Display scraping results in a formatted table."""
+    columns = [("Data Type", "cyan"), ("Records", "green")]
     if isinstance(results, dict) and "extraction" in results:
         # Full pipeline results
-        table = Table(title="Scraping Results")
-        table.add_column("Data Type", style="cyan")
-        table.add_column("Records", style="green")
-        
-        for data_type, count in results["extraction"].items():
-            table.add_row(data_type.title(), str(count))
-        
-        console.print(table)
+        rows = [(data_type.title(), str(count)) for data_type, count in results["extraction"].items()]
+        _print_table("Scraping Results", columns, rows)
         
         # Show duration
         if "duration_seconds" in results:
             console.print(f"[blue]⏱️ Total duration: {results['duration_seconds']:.2f} seconds[/blue]")
     else:
         # Raw extraction results
-        table = Table(title="Scraping Results")
-        table.add_column("Data Type", style="cyan")
-        table.add_column("Records", style="green")
-        
-        for data_type, records in results.items():
-            table.add_row(data_type.title(), str(len(records)))
-        
-        console.print(table)
+        rows = [(data_type.title(), str(len(records))) for data_type, records in results.items()]
+        _print_table("Scraping Results", columns, rows)
 
 
 def display_update_results(results):
@@ -550,33 +421,25 @@ def display_update_results(results):
         
         # Show extraction results
         if "extraction" in results:
-            table = Table(title="Data Extracted")
-            table.add_column("Data Type", style="cyan")
-            table.add_column("Records", style="green")
-            
-            for data_type, count in results["extraction"].items():
-                table.add_row(data_type.title(), str(count))
-            
-            console.print(table)
+            rows = [(data_type.title(), str(count)) for data_type, count in results["extraction"].items()]
+            _print_table("Data Extracted", [("Data Type", "cyan"), ("Records", "green")], rows)
         
         # Show loading results
         if "loading" in results and not results["loading"].get("dry_run"):
-            table = Table(title="Data Loaded")
-            table.add_column("Data Type", style="cyan")
-            table.add_column("Inserted", style="green")
-            table.add_column("Updated", style="yellow")
-            table.add_column("Errors", style="red")
-            
-            for data_type, stats in results["loading"].items():
-                if isinstance(stats, dict):
-                    table.add_row(
-                        data_type.title(),
-                        str(stats.get("inserted", 0)),
-                        str(stats.get("updated", 0)),
-                        str(stats.get("errors", 0))
-                    )
-            
-            console.print(table)
+            rows = [
+                (
+                    data_type.title(),
+                    str(stats.get("upserted", 0)),
+                    str(stats.get("errors", 0)),
+                )
+                for data_type, stats in results["loading"].items()
+                if isinstance(stats, dict)
+            ]
+            _print_table(
+                "Data Loaded",
+                [("Data Type", "cyan"), ("Upserted", "green"), ("Errors", "red")],
+                rows,
+            )
         
         # Show duration
         if "duration_seconds" in results:
@@ -585,6 +448,10 @@ def display_update_results(results):
         console.print(f"[red]❌ Update failed: {results.get('error', 'Unknown error')}[/red]")
 
 
+# Record-count key reported by each quality check, in lookup order
+_COUNT_KEYS = ("total_teams", "total_players", "total_matches", "total_innings", "total_balls", "total_stats")
+
+
 def display_quality_results(results):
     """Display quality check results."""
     if results.get("status") == "disabled":
@@ -594,40 +461,24 @@ def display_quality_results(results):
     console.print(f"[bold]Overall Quality Score: {results.get('overall_score', 0)}/100[/bold]")
     
     if "checks" in results:
-        table = Table(title="Quality Check Results")
-        table.add_column("Data Type", style="cyan")
-        table.add_column("Total Records", style="blue")
-        table.add_column("Issues", style="red")
-        table.add_column("Quality Score", style="green")
-        
+        rows = []
         for check_name, check_result in results["checks"].items():
             if isinstance(check_result, dict):
-                total_records = check_result.get("total_teams", 
-                                               check_result.get("total_players",
-                                               check_result.get("total_matches",
-                                               check_result.get("total_innings",
-                                               check_result.get("total_balls",
-                                               check_result.get("total_stats", 0))))))
+                total_records = next((check_result[k] for k in _COUNT_KEYS if k in check_result), 0)
                 issues_count = len(check_result.get("issues", []))
                 quality_score = check_result.get("quality_score", 0)
-                
-                table.add_row(
-                    check_name.title(),
-                    str(total_records),
-                    str(issues_count),
-                    f"{quality_score}/100"
-                )
+                rows.append((check_name.title(), str(total_records), str(issues_count), f"{quality_score}/100"))
         
-        console.print(table)
+        _print_table(
+            "Quality Check Results",
+            [("Data Type", "cyan"), ("Total Records", "blue"), ("Issues", "red"), ("Quality Score", "green")],
+            rows,
+        )
 
 
 def display_validation_results(results):
     """Display validation results."""
-    table = Table(title="Data Source Validation")
-    table.add_column("Source", style="cyan")
-    table.add_column("Status", style="green")
-    table.add_column("Details", style="blue")
-    
+    rows = []
     for source, result in results.items():
         status = result.get("status", "unknown")
         details = ""
@@ -643,9 +494,9 @@ def display_validation_results(results):
             status_style = "yellow"
             details = "Unknown status"
         
-        table.add_row(source.title(), f"[{status_style}]{status}[/{status_style}]", details)
+        rows.append((source.title(), f"[{status_style}]{status}[/{status_style}]", details))
     
-    console.print(table)
+    _print_table("Data Source Validation", [("Source", "cyan"), ("Status", "green"), ("Details", "blue")], rows)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,74 @@
+"""Process-wide CLI state shared by the command modules.
+
+Lives apart from ``main`` so that running ``python -m cricket_database.cli.main``
+(where ``main`` is also loaded a second time as ``__main__``) still leaves one
+console, one event loop and one ``app_state`` for every command.
+"""
+
+import asyncio
+from typing import NoReturn
+
+import typer
+from rich.console import Console
+from rich.table import Table
+from rich.progress import Progress, SpinnerColumn, TextColumn
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Initialize rich console
+console = Console()
+
+# Global options set by the app callback (--dry-run, --verbose)
+app_state = {"dry_run": False, "verbose": False}
+
+# One event loop for the whole process so HTTP connection pools, DNS cache and
+# keep-alive sockets survive across commands (and across `schedule` ticks).
+_LOOP = asyncio.new_event_loop()
+asyncio.set_event_loop(_LOOP)
+
+
+def run_sync(coro):
+    """Run a coroutine to completion on the shared CLI event loop."""
+    return _LOOP.run_until_complete(coro)
+
+
+def _progress() -> Progress:
+    """Spinner progress for interactive terminals; a disabled, spinner-less one under cron/CI."""
+    interactive = console.is_terminal
+    columns = [TextColumn("[progress.description]{task.description}")]
+    if interactive:
+        columns.insert(0, SpinnerColumn())
+    return Progress(*columns, console=console, transient=True, disable=not interactive, refresh_per_second=4)
+
+
+def _cli_errors() -> tuple:
+    """Operational errors a command reports and exits on; anything else is a bug and propagates.
+
+    Only evaluated when an exception is actually raised, so httpx stays a lazy import.
+    """
+    import httpx
+    from sqlalchemy.exc import SQLAlchemyError
+    return (SQLAlchemyError, httpx.HTTPError, OSError, ValueError)
+
+
+def _fail(message: str, error: Exception) -> NoReturn:
+    """Print a failure message (with details under --verbose) and exit with status 1."""
+    if app_state["verbose"]:
+        console.print(f"[red]❌ {message}: {error}[/red]")
+    else:
+        console.print(f"[red]❌ {message} (use --verbose for details)[/red]")
+    raise typer.Exit(1)
+
+
+def _print_table(title: str, columns, rows) -> None:
+    """Build a table from pre-computed rows and write it to the console once."""
+    table = Table(title=title, highlight=False)
+    for name, style in columns:
+        table.add_column(name, style=style)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table, soft_wrap=True)
@@ -1,70 +1,112 @@
 """Configuration management for the cricket database system."""
 
-import os
+from functools import cached_property, lru_cache
 from typing import Optional
 
-from pydantic import BaseSettings, Field
+from pydantic import Field
+from sqlalchemy import URL
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-class DatabaseSettings(BaseSettings):
+class _EnvSettings(BaseSettings):
+    """Shared settings behaviour: read from the environment and `.env`, immutable once built."""
+    
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class DatabaseSettings(_EnvSettings):
     """Database configuration settings."""
     
-    host: str = Field(default="localhost", env="DB_HOST")
-    port: int = Field(default=3306, env="DB_PORT")
-    name: str = Field(default="cricket_db", env="DB_NAME")
-    user: str = Field(default="cricket_user", env="DB_USER")
-    password: str = Field(default="", env="DB_PASSWORD")
+    host: str = Field(default="localhost", validation_alias="DB_HOST")
+    port: int = Field(default=3306, validation_alias="DB_PORT")
+    name: str = Field(default="cricket_db", validation_alias="DB_NAME")
+    user: str = Field(default="cricket_user", validation_alias="DB_USER")
+    password: str = Field(default="", validation_alias="DB_PASSWORD")
+    
+    # DBAPI drivers: mysqlclient (C extension) for sync engines, asyncmy for asyncio
+    driver: str = Field(default="mysqldb", validation_alias="DB_DRIVER")
+    async_driver: str = Field(default="asyncmy", validation_alias="DB_ASYNC_DRIVER")
+    
+    # Connection pool
+    pool_size: int = Field(default=20, validation_alias="DB_POOL_SIZE")
+    max_overflow: int = Field(default=30, validation_alias="DB_MAX_OVERFLOW")
+    pool_timeout: int = Field(default=30, validation_alias="DB_POOL_TIMEOUT")
+    pool_recycle: int = Field(default=1800, validation_alias="DB_POOL_RECYCLE")
+    pool_pre_ping: bool = Field(default=True, validation_alias="DB_POOL_PRE_PING")
     
-    @property
-    def url(self) -> str:
-        """Get database URL for SQLAlchemy."""
-        return f"mysql+mysqlconnector://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
+    # Allow LOAD DATA LOCAL INFILE from the async engine (server needs local_infile=1 too)
+    local_infile: bool = Field(default=False, validation_alias="DB_LOCAL_INFILE")
+    
+    @cached_property
+    def url(self) -> URL:
+        """Get database URL for SQLAlchemy (built once; its repr masks the password)."""
+        return URL.create(
+            f"mysql+{self.driver}",
+            username=self.user,
+            password=self.password,
+            host=self.host,
+            port=self.port,
+            database=self.name,
+            query={"charset": "utf8mb4"},
+        )
+    
+    @cached_property
+    def async_url(self) -> URL:
+        """Get database URL for the asyncio engine."""
+        return self.url.set(drivername=f"mysql+{self.async_driver}")
 
 
-class ScraperSettings(BaseSettings):
+class ScraperSettings(_EnvSettings):
     """Scraper configuration settings."""
     
-    rate_limit: float = Field(default=1.0, env="SCRAPER_RATE_LIMIT")
-    retry_attempts: int = Field(default=3, env="SCRAPER_RETRY_ATTEMPTS")
-    timeout: int = Field(default=30, env="SCRAPER_TIMEOUT")
-    user_agent: str = Field(default="CricketDataBot/1.0", env="SCRAPER_USER_AGENT")
+    rate_limit: float = Field(default=1.0, validation_alias="SCRAPER_RATE_LIMIT")
+    retry_attempts: int = Field(default=3, validation_alias="SCRAPER_RETRY_ATTEMPTS")
+    timeout: int = Field(default=30, validation_alias="SCRAPER_TIMEOUT")
+    user_agent: str = Field(default="CricketDataBot/1.0", validation_alias="SCRAPER_USER_AGENT")
     
     # Rate limiting
-    max_requests_per_minute: int = Field(default=60, env="MAX_REQUESTS_PER_MINUTE")
-    max_requests_per_hour: int = Field(default=1000, env="MAX_REQUESTS_PER_HOUR")
+    max_requests_per_minute: int = Field(default=60, validation_alias="MAX_REQUESTS_PER_MINUTE")
+    max_requests_per_hour: int = Field(default=1000, validation_alias="MAX_REQUESTS_PER_HOUR")
 
 
-class DataQualitySettings(BaseSettings):
+class DataQualitySettings(_EnvSettings):
     """Data quality configuration settings."""
     
-    enable_validation: bool = Field(default=True, env="ENABLE_DATA_VALIDATION")
-    enable_duplicate_check: bool = Field(default=True, env="ENABLE_DUPLICATE_CHECK")
-    batch_size: int = Field(default=1000, env="BATCH_SIZE")
+    enable_validation: bool = Field(default=True, validation_alias="ENABLE_DATA_VALIDATION")
+    enable_duplicate_check: bool = Field(default=True, validation_alias="ENABLE_DUPLICATE_CHECK")
+    batch_size: int = Field(default=1000, validation_alias="BATCH_SIZE")
 
 
-class LoggingSettings(BaseSettings):
+class LoggingSettings(_EnvSettings):
     """Logging configuration settings."""
     
-    level: str = Field(default="INFO", env="LOG_LEVEL")
-    file: Optional[str] = Field(default="logs/cricket_scraper.log", env="LOG_FILE")
+    level: str = Field(default="INFO", validation_alias="LOG_LEVEL")
+    file: Optional[str] = Field(default="logs/cricket_scraper.log", validation_alias="LOG_FILE")
 
 
-class Settings(BaseSettings):
+class Settings(_EnvSettings):
     """Main application settings."""
     
-    database: DatabaseSettings = DatabaseSettings()
-    scraper: ScraperSettings = ScraperSettings()
-    data_quality: DataQualitySettings = DataQualitySettings()
-    logging: LoggingSettings = LoggingSettings()
+    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
+    scraper: ScraperSettings = Field(default_factory=ScraperSettings)
+    data_quality: DataQualitySettings = Field(default_factory=DataQualitySettings)
+    logging: LoggingSettings = Field(default_factory=LoggingSettings)
     
     # Data sources
-    cricket_api_base_url: str = Field(default="https://api.cricket.com", env="CRICKET_API_BASE_URL")
-    espn_cricket_base_url: str = Field(default="https://www.espncricinfo.com", env="ESPN_CRICKET_BASE_URL")
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    cricket_api_base_url: str = Field(default="https://api.cricket.com", validation_alias="CRICKET_API_BASE_URL")
+    espn_cricket_base_url: str = Field(default="https://www.espncricinfo.com", validation_alias="ESPN_CRICKET_BASE_URL")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, built from the environment on first use."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
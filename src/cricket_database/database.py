@@ -1,9 +1,10 @@
 """Database connection and session management."""
 
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from .config import settings
@@ -11,22 +12,46 @@ from .config import settings
 
 # Global engine instance
 _engine: Engine | None = None
+_async_engine: AsyncEngine | None = None
 _SessionLocal: sessionmaker | None = None
+_AsyncSessionLocal: async_sessionmaker | None = None
 
 
 def get_database_engine() -> Engine:
-    """Get or create the database engine."""
+    """Get or create the database engine (one pooled engine per process)."""
     global _engine
     if _engine is None:
+        db = settings.database
         _engine = create_engine(
-            settings.database.url,
-            pool_pre_ping=True,
-            pool_recycle=3600,
+            db.url,
+            pool_size=db.pool_size,
+            max_overflow=db.max_overflow,
+            pool_timeout=db.pool_timeout,
+            pool_pre_ping=db.pool_pre_ping,
+            pool_recycle=db.pool_recycle,
             echo=False,  # Set to True for SQL debugging
         )
     return _engine
 
 
+def get_async_database_engine() -> AsyncEngine:
+    """Get or create the asyncio database engine, for code running on the event loop."""
+    global _async_engine
+    if _async_engine is None:
+        db = settings.database
+        _async_engine = create_async_engine(
+            db.async_url,
+            pool_size=db.pool_size,
+            max_overflow=db.max_overflow,
+            pool_timeout=db.pool_timeout,
+            pool_pre_ping=db.pool_pre_ping,
+            pool_recycle=db.pool_recycle,
+            connect_args={"local_infile": True} if db.local_infile else {},
+            echo=False,
+        )
+    return _async_engine
+
+
 def get_session_local() -> sessionmaker:
     """Get or create the session factory."""
     global _SessionLocal
@@ -54,13 +79,47 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+def get_async_session_local() -> async_sessionmaker:
+    """Get or create the asyncio session factory."""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=get_async_database_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _AsyncSessionLocal
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get an asyncio database session with automatic commit/rollback."""
+    session = get_async_session_local()()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
 def create_tables() -> None:
     """Create all database tables."""
     from .models import Base
-    Base.metadata.create_all(bind=get_database_engine())
+    with get_database_engine().begin() as conn:
+        Base.metadata.create_all(conn, checkfirst=True)
 
 
 def drop_tables() -> None:
-    """Drop all database tables."""
+    """Drop all database tables in a single DROP statement."""
     from .models import Base
-    Base.metadata.drop_all(bind=get_database_engine())
+    engine = get_database_engine()
+    preparer = engine.dialect.identifier_preparer
+    # Children before parents; MySQL resolves the list in one round-trip
+    names = [preparer.format_table(t) for t in reversed(Base.metadata.sorted_tables)]
+    if not names:
+        return
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"DROP TABLE IF EXISTS {', '.join(names)}")
@@ -1,9 +1,17 @@
 """ETL pipeline for cricket data processing."""
 
-from .pipeline import ETLPipeline
-from .transformers import DataTransformer, DataValidator
-from .loaders import DatabaseLoader
-from .quality_checks import DataQualityChecker
+from importlib import import_module
+from typing import Any
+
+# Resolved lazily so that importing a light submodule (e.g. ``etl.config``) does
+# not drag in the scrapers, Playwright and lxml.
+_EXPORTS = {
+    "ETLPipeline": ".pipeline",
+    "DataTransformer": ".transformers",
+    "DataValidator": ".transformers",
+    "DatabaseLoader": ".loaders",
+    "DataQualityChecker": ".quality_checks",
+}
 
 __all__ = [
     "ETLPipeline",
@@ -12,3 +20,12 @@ __all__ = [
     "DatabaseLoader",
     "DataQualityChecker",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
+
+
+# Rows per executemany call when writing the large lists (e.g. deliveries)
+BATCH_SIZE = 1000
 
 
 def _values_clause(cols: List[str]) -> str:
@@ -16,11 +20,24 @@ def _insert_on_dup(table: str, cols: List[str], update_cols: List[str]) -> str:
     return f"INSERT INTO {table}({cols_sql}) VALUES({vals_sql}) ON DUPLICATE KEY UPDATE {updates}"
 
 
+def _player_id(conn: Connection, cache: Dict[str, Optional[int]], full_name: Optional[str]) -> Optional[int]:
+    """players.id for a name, looked up once per load (the same few players fill every row)."""
+    if not full_name:
+        return None
+    if full_name not in cache:
+        row = conn.exec_driver_sql("SELECT id FROM players WHERE full_name=%s", (full_name,)).fetchone()
+        cache[full_name] = int(row[0]) if row else None
+    return cache[full_name]
+
+
 def load_rows(engine: Engine, rows: Dict[str, List[dict]]) -> None:
     """Bulk upsert rows in correct order using SQLAlchemy Core connections.
 
-    Expects rows generated by transform.to_rows().
+    Expects rows generated by transform.to_rows(). Deliveries are written with
+    executemany in chunks of ``BATCH_SIZE``, which the MySQL drivers send as
+    multi-row INSERTs.
     """
+    player_ids: Dict[str, Optional[int]] = {}
     with engine.begin() as conn:
         # Countries (by name)
         for r in rows.get("countries", []):
@@ -182,9 +199,9 @@ def load_rows(engine: Engine, rows: Dict[str, List[dict]]) -> None:
 
         # Batting innings
         for idx, r in enumerate(rows.get("batting_innings", []), start=1):
-            pid = conn.exec_driver_sql("SELECT id FROM players WHERE full_name=%s", (r["player_full_name"],)).fetchone()
-            bow_id = conn.exec_driver_sql("SELECT id FROM players WHERE full_name=%s", (r["bowler_full_name"],)).fetchone() if r.get("bowler_full_name") else None
-            fld_id = conn.exec_driver_sql("SELECT id FROM players WHERE full_name=%s", (r["fielder_full_name"],)).fetchone() if r.get("fielder_full_name") else None
+            pid = _player_id(conn, player_ids, r["player_full_name"])
+            bow_id = _player_id(conn, player_ids, r.get("bowler_full_name"))
+            fld_id = _player_id(conn, player_ids, r.get("fielder_full_name"))
             conn.exec_driver_sql(
                 _insert_on_dup(
                     "batting_innings",
@@ -192,14 +209,14 @@ def load_rows(engine: Engine, rows: Dict[str, List[dict]]) -> None:
                     ["position", "runs", "balls", "minutes", "fours", "sixes", "how_out", "bowler_id", "fielder_id"],
                 ),
                 (
-                    inning_ids[0], int(pid[0]) if pid else None, r.get("position"), r.get("runs"), r.get("balls"), r.get("minutes"), r.get("fours"), r.get("sixes"), r.get("how_out"),
-                    int(bow_id[0]) if bow_id else None, int(fld_id[0]) if fld_id else None,
+                    inning_ids[0], pid, r.get("position"), r.get("runs"), r.get("balls"), r.get("minutes"), r.get("fours"), r.get("sixes"), r.get("how_out"),
+                    bow_id, fld_id,
                 ),
             )
 
         # Bowling innings
         for r in rows.get("bowling_innings", []):
-            pid = conn.exec_driver_sql("SELECT id FROM players WHERE full_name=%s", (r["player_full_name"],)).fetchone()
+            pid = _player_id(conn, player_ids, r["player_full_name"])
             conn.exec_driver_sql(
                 _insert_on_dup(
                     "bowling_innings",
@@ -207,35 +224,37 @@ def load_rows(engine: Engine, rows: Dict[str, List[dict]]) -> None:
                     ["overs", "maidens", "runs", "wickets", "wides", "no_balls", "econ"],
                 ),
                 (
-                    inning_ids[0], int(pid[0]) if pid else None, r.get("overs"), r.get("maidens"), r.get("runs"), r.get("wickets"), r.get("wides"), r.get("no_balls"), r.get("econ"),
+                    inning_ids[0], pid, r.get("overs"), r.get("maidens"), r.get("runs"), r.get("wickets"), r.get("wides"), r.get("no_balls"), r.get("econ"),
                 ),
             )
 
-        # Deliveries
-        for r in rows.get("deliveries", []):
-            sid = conn.exec_driver_sql("SELECT id FROM players WHERE full_name=%s", (r["striker_full_name"],)).fetchone()
-            nsid = conn.exec_driver_sql("SELECT id FROM players WHERE full_name=%s", (r["non_striker_full_name"],)).fetchone()
-            bid = conn.exec_driver_sql("SELECT id FROM players WHERE full_name=%s", (r["bowler_full_name"],)).fetchone()
-            did = conn.exec_driver_sql("SELECT id FROM players WHERE full_name=%s", (r["dismissal_full_name"],)).fetchone() if r.get("dismissal_full_name") else None
+        # Deliveries: one executemany per BATCH_SIZE rows instead of a round trip per ball
+        deliveries_sql = _insert_on_dup(
+            "deliveries",
+            [
+                "match_id", "innings_id", "over_no", "ball_no", "striker_id", "non_striker_id", "bowler_id",
+                "runs_off_bat", "extras_bye", "extras_legbye", "extras_wide", "extras_noball", "extras_penalty",
+                "wicket_type", "dismissal_player_id"
+            ],
+            [
+                "striker_id", "non_striker_id", "bowler_id",
+                "runs_off_bat", "extras_bye", "extras_legbye", "extras_wide", "extras_noball", "extras_penalty",
+                "wicket_type", "dismissal_player_id"
+            ],
+        )
+        deliveries = rows.get("deliveries", [])
+        for start in range(0, len(deliveries), BATCH_SIZE):
             conn.exec_driver_sql(
-                _insert_on_dup(
-                    "deliveries",
-                    [
-                        "match_id", "innings_id", "over_no", "ball_no", "striker_id", "non_striker_id", "bowler_id",
-                        "runs_off_bat", "extras_bye", "extras_legbye", "extras_wide", "extras_noball", "extras_penalty",
-                        "wicket_type", "dismissal_player_id"
-                    ],
-                    [
-                        "striker_id", "non_striker_id", "bowler_id",
-                        "runs_off_bat", "extras_bye", "extras_legbye", "extras_wide", "extras_noball", "extras_penalty",
-                        "wicket_type", "dismissal_player_id"
-                    ],
-                ),
-                (
-                    match_id, inning_ids[0], r["over_no"], r["ball_no"], int(sid[0]) if sid else None, int(nsid[0]) if nsid else None, int(bid[0]) if bid else None,
-                    r.get("runs_off_bat", 0), r.get("extras_bye", 0), r.get("extras_legbye", 0), r.get("extras_wide", 0), r.get("extras_noball", 0), r.get("extras_penalty", 0),
-                    r.get("wicket_type"), int(did[0]) if did else None,
-                ),
+                deliveries_sql,
+                [
+                    (
+                        match_id, inning_ids[0], r["over_no"], r["ball_no"],
+                        _player_id(conn, player_ids, r["striker_full_name"]),
+                        _player_id(conn, player_ids, r["non_striker_full_name"]),
+                        _player_id(conn, player_ids, r["bowler_full_name"]),
+                        r.get("runs_off_bat", 0), r.get("extras_bye", 0), r.get("extras_legbye", 0), r.get("extras_wide", 0), r.get("extras_noball", 0), r.get("extras_penalty", 0),
+                        r.get("wicket_type"), _player_id(conn, player_ids, r.get("dismissal_full_name")),
+                    )
+                    for r in deliveries[start:start + BATCH_SIZE]
+                ],
             )
-
-
@@ -1,325 +1,339 @@
 """Database loading components with idempotent upserts."""
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
-from sqlalchemy import select, update, insert
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
+import os
+import tempfile
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import bindparam, func, insert, or_, select, text, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.exc import SQLAlchemyError
 
-from ..database import get_session
-from ..models import (
-    Team, Player, Match, Inning, BallByBall, PlayerMatchStats, PlayerCareerStats
-)
-from ..schemas import (
-    TeamCreate, PlayerCreate, MatchCreate, InningCreate, BallByBallCreate,
-    PlayerMatchStatsCreate
-)
+from ..config import settings
+from ..database import get_async_session
+from .config import get_etl_config
+from ..models import Base
 
 logger = logging.getLogger(__name__)
 
 
+# Columns never written by an upsert: the surrogate key and the creation timestamp
+_UPSERT_SKIP_COLUMNS = frozenset({"id", "created_at"})
+
+# Core tables: loads never instantiate ORM objects
+_TEAMS = Base.metadata.tables["teams"]
+_PLAYERS = Base.metadata.tables["players"]
+_MATCHES = Base.metadata.tables["matches"]
+_INNINGS = Base.metadata.tables["innings"]
+_BALL_BY_BALL = Base.metadata.tables["ball_by_ball"]
+_PLAYER_MATCH_STATS = Base.metadata.tables["player_match_stats"]
+
+# Unique natural key of each table; rows repeating a key within one load collapse to the last
+_NATURAL_KEYS = {
+    _TEAMS: ("name",),
+    _PLAYERS: ("name", "team_id"),
+    _MATCHES: ("home_team_id", "away_team_id", "match_date"),
+    _INNINGS: ("match_id", "inning_number"),
+    _BALL_BY_BALL: ("inning_id", "over_number", "ball_number"),
+    _PLAYER_MATCH_STATS: ("player_id", "match_id"),
+}
+
+# Columns a payload may set, per table (payload keys outside this are dropped)
+_WRITABLE_COLUMNS = {
+    table: frozenset(c.name for c in table.columns if c.name != "id")
+    for table in _NATURAL_KEYS
+}
+
+# Team statements are built once and bound per batch
+_SELECT_EXISTING_TEAMS = select(_TEAMS.c.id, _TEAMS.c.name, _TEAMS.c.short_name).where(
+    or_(
+        _TEAMS.c.name.in_(bindparam("names", expanding=True)),
+        _TEAMS.c.short_name.in_(bindparam("short_names", expanding=True)),
+    )
+)
+_INSERT_TEAMS = insert(_TEAMS)
+_UPDATE_TEAM_BY_ID = update(_TEAMS).where(_TEAMS.c.id == bindparam("_id"))
+
+
+def _tsv_field(value: Any) -> str:
+    """Encode one value for LOAD DATA's default tab-separated, backslash-escaped format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def _write_tsv(columns: Tuple[str, ...], rows: List[Dict[str, Any]]) -> str:
+    """Write ``rows`` to a temporary TSV file and return its path (the caller removes it)."""
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".tsv", delete=False, encoding="utf-8", newline=""
+    ) as f:
+        for row in rows:
+            f.write("\t".join(_tsv_field(row[c]) for c in columns))
+            f.write("\n")
+        return f.name
+
+
+@lru_cache(maxsize=None)
+def _load_data_statements(table, columns: Tuple[str, ...]):
+    """Build the staged LOAD DATA statements for one column set, once.
+
+    The file is loaded into an index-less temporary copy of the columns and then
+    merged with ``INSERT ... SELECT ... ON DUPLICATE KEY UPDATE``, using the same
+    SET list as ``_upsert_statement``. (``LOAD DATA ... REPLACE`` would delete and
+    re-insert conflicting rows, giving them new ids and ``created_at`` values.)
+    Returns ``(create_stage, load, merge, drop_stage)``.
+    """
+    stage = f"_stage_{table.name}"
+    column_list = ", ".join(columns)
+    updates = [f"{c} = s.{c}" for c in columns if c not in _UPSERT_SKIP_COLUMNS and c != "updated_at"]
+    updates.append("updated_at = NOW()")
+    return (
+        text(f"CREATE TEMPORARY TABLE {stage} SELECT {column_list} FROM {table.name} LIMIT 0"),
+        text(
+            f"LOAD DATA LOCAL INFILE :path INTO TABLE {stage} "
+            f"CHARACTER SET utf8mb4 FIELDS TERMINATED BY '\\t' ({column_list})"
+        ),
+        text(
+            f"INSERT INTO {table.name} ({column_list}) SELECT {column_list} FROM {stage} AS s "
+            f"ON DUPLICATE KEY UPDATE {', '.join(updates)}"
+        ),
+        text(f"DROP TEMPORARY TABLE IF EXISTS {stage}"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _upsert_statement(table, columns: Tuple[str, ...]):
+    """Build the ON DUPLICATE KEY UPDATE statement for one column set, once.
+    
+    Rows are bound as executemany parameters, so the statement (and its compiled
+    form) is identical for every batch with the same columns.
+    """
+    stmt = mysql_insert(table)
+    updates = {
+        key: stmt.inserted[key]
+        for key in columns
+        if key not in _UPSERT_SKIP_COLUMNS
+    }
+    # onupdate defaults are not applied to ON DUPLICATE KEY UPDATE automatically
+    updates["updated_at"] = func.now()
+    return stmt.on_duplicate_key_update(updates)
+
+
 class DatabaseLoader:
-    """Database loader with idempotent upsert functionality."""
+    """Database loader with idempotent upsert functionality.
+    
+    Each ``load_*`` method sends ``INSERT ... ON DUPLICATE KEY UPDATE`` as an
+    executemany of up to ``batch_size`` rows, relying on the unique natural keys
+    declared on the models (e.g. ``(inning_id, over_number, ball_number)``).
     
-    def __init__(self, batch_size: int = 1000):
+    With ``use_load_data`` (on by default when ``DB_LOCAL_INFILE=true``) ball-by-ball
+    rows are bulk-loaded through ``LOAD DATA LOCAL INFILE`` into a staging table and
+    merged with the same upsert instead; the server needs ``local_infile=1`` too.
+    """
+    
+    def __init__(
+        self,
+        batch_size: int = 1000,
+        concurrency: Optional[int] = None,
+        use_load_data: Optional[bool] = None,
+    ):
         self.batch_size = batch_size
+        self.concurrency = concurrency or get_etl_config().scraper.concurrency
+        # Follows DB_LOCAL_INFILE unless set explicitly: the path only works when the
+        # engine was created with local_infile enabled
+        self.use_load_data = settings.database.local_infile if use_load_data is None else use_load_data
     
     async def load_teams(self, teams_data: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Load teams data with idempotent upserts."""
-        logger.info(f"Loading {len(teams_data)} teams")
+        """Load teams data with idempotent upserts.
         
-        stats = {"inserted": 0, "updated": 0, "errors": 0}
+        Teams carry two unique keys (name and short_name), where ON DUPLICATE KEY
+        UPDATE may pick either conflicting row. Instead, existing ids are fetched with
+        one SELECT per batch and the batch is split into inserts and updates.
+        """
+        logger.info(f"Loading {len(teams_data)} teams")
         
-        with get_session() as session:
-            for team_data in teams_data:
+        stats = {"upserted": 0, "inserted": 0, "updated": 0, "errors": 0}
+        
+        # One transaction per call, committed once by get_async_session()
+        async with get_async_session() as session:
+            for chunk in self._chunks(_TEAMS, teams_data):
+                names = {row["name"] for row in chunk}
+                short_names = {row["short_name"] for row in chunk if row.get("short_name")}
+                existing = await session.execute(
+                    _SELECT_EXISTING_TEAMS, {"names": list(names), "short_names": list(short_names)}
+                )
+                by_name, by_short_name = {}, {}
+                for team_id, name, short_name in existing:
+                    by_name[name] = team_id
+                    by_short_name[short_name] = team_id
+                
+                to_insert, to_update = [], []
+                for row in chunk:
+                    team_id = by_name.get(row["name"]) or by_short_name.get(row.get("short_name"))
+                    if team_id is None:
+                        to_insert.append(row)
+                    else:
+                        # Same SET list as the upserts: never rewrite created_at
+                        update_row = {k: v for k, v in row.items() if k not in _UPSERT_SKIP_COLUMNS}
+                        update_row["_id"] = team_id
+                        to_update.append(update_row)
+                
                 try:
-                    result = await self._upsert_team(session, team_data)
-                    if result == "inserted":
-                        stats["inserted"] += 1
-                    elif result == "updated":
-                        stats["updated"] += 1
-                except Exception as e:
-                    logger.error(f"Failed to load team {team_data.get('name', 'Unknown')}: {e}")
-                    stats["errors"] += 1
-            
-            session.commit()
+                    # Core executemany: no ORM identity map or unit-of-work bookkeeping
+                    async with session.begin_nested():
+                        if to_insert:
+                            await session.execute(_INSERT_TEAMS, to_insert)
+                        if to_update:
+                            await session.execute(_UPDATE_TEAM_BY_ID, to_update)
+                    stats["inserted"] += len(to_insert)
+                    stats["updated"] += len(to_update)
+                    stats["upserted"] += len(chunk)
+                except SQLAlchemyError as e:
+                    logger.error(f"Failed to load batch of {len(chunk)} teams: {e}")
+                    stats["errors"] += len(chunk)
         
         logger.info(f"Teams loaded: {stats}")
         return stats
     
     async def load_players(self, players_data: List[Dict[str, Any]]) -> Dict[str, int]:
         """Load players data with idempotent upserts."""
-        logger.info(f"Loading {len(players_data)} players")
-        
-        stats = {"inserted": 0, "updated": 0, "errors": 0}
-        
-        with get_session() as session:
-            for player_data in players_data:
-                try:
-                    result = await self._upsert_player(session, player_data)
-                    if result == "inserted":
-                        stats["inserted"] += 1
-                    elif result == "updated":
-                        stats["updated"] += 1
-                except Exception as e:
-                    logger.error(f"Failed to load player {player_data.get('name', 'Unknown')}: {e}")
-                    stats["errors"] += 1
-            
-            session.commit()
-        
-        logger.info(f"Players loaded: {stats}")
-        return stats
+        return await self._bulk_upsert(_PLAYERS, players_data, "players")
     
     async def load_matches(self, matches_data: List[Dict[str, Any]]) -> Dict[str, int]:
         """Load matches data with idempotent upserts."""
-        logger.info(f"Loading {len(matches_data)} matches")
-        
-        stats = {"inserted": 0, "updated": 0, "errors": 0}
-        
-        with get_session() as session:
-            for match_data in matches_data:
-                try:
-                    result = await self._upsert_match(session, match_data)
-                    if result == "inserted":
-                        stats["inserted"] += 1
-                    elif result == "updated":
-                        stats["updated"] += 1
-                except Exception as e:
-                    logger.error(f"Failed to load match: {e}")
-                    stats["errors"] += 1
-            
-            session.commit()
-        
-        logger.info(f"Matches loaded: {stats}")
-        return stats
+        return await self._bulk_upsert(_MATCHES, matches_data, "matches")
     
     async def load_innings(self, innings_data: List[Dict[str, Any]]) -> Dict[str, int]:
         """Load innings data with idempotent upserts."""
-        logger.info(f"Loading {len(innings_data)} innings")
-        
-        stats = {"inserted": 0, "updated": 0, "errors": 0}
-        
-        with get_session() as session:
-            for inning_data in innings_data:
-                try:
-                    result = await self._upsert_inning(session, inning_data)
-                    if result == "inserted":
-                        stats["inserted"] += 1
-                    elif result == "updated":
-                        stats["updated"] += 1
-                except Exception as e:
-                    logger.error(f"Failed to load inning: {e}")
-                    stats["errors"] += 1
-            
-            session.commit()
-        
-        logger.info(f"Innings loaded: {stats}")
-        return stats
+        return await self._bulk_upsert(_INNINGS, innings_data, "innings")
     
     async def load_ball_by_ball(self, balls_data: List[Dict[str, Any]]) -> Dict[str, int]:
         """Load ball-by-ball data with idempotent upserts."""
-        logger.info(f"Loading {len(balls_data)} ball-by-ball records")
-        
-        stats = {"inserted": 0, "updated": 0, "errors": 0}
-        
-        with get_session() as session:
-            for ball_data in balls_data:
-                try:
-                    result = await self._upsert_ball_by_ball(session, ball_data)
-                    if result == "inserted":
-                        stats["inserted"] += 1
-                    elif result == "updated":
-                        stats["updated"] += 1
-                except Exception as e:
-                    logger.error(f"Failed to load ball-by-ball record: {e}")
-                    stats["errors"] += 1
-            
-            session.commit()
-        
-        logger.info(f"Ball-by-ball records loaded: {stats}")
-        return stats
+        if self.use_load_data:
+            return await self._load_data_infile(_BALL_BY_BALL, balls_data, "ball-by-ball records")
+        return await self._bulk_upsert(_BALL_BY_BALL, balls_data, "ball-by-ball records")
     
     async def load_player_stats(self, stats_data: List[Dict[str, Any]]) -> Dict[str, int]:
         """Load player statistics data with idempotent upserts."""
-        logger.info(f"Loading {len(stats_data)} player statistics records")
+        return await self._bulk_upsert(_PLAYER_MATCH_STATS, stats_data, "player statistics records")
+    
+    async def _bulk_upsert(self, table, rows: List[Dict[str, Any]], label: str) -> Dict[str, int]:
+        """Upsert ``rows`` into ``table`` in multi-row batches."""
+        logger.info(f"Loading {len(rows)} {label}")
         
-        stats = {"inserted": 0, "updated": 0, "errors": 0}
+        stats = {"upserted": 0, "errors": 0}
         
-        with get_session() as session:
-            for stat_data in stats_data:
+        # One transaction per call, committed once by get_async_session()
+        async with get_async_session() as session:
+            for chunk in self._chunks(table, rows):
                 try:
-                    result = await self._upsert_player_stats(session, stat_data)
-                    if result == "inserted":
-                        stats["inserted"] += 1
-                    elif result == "updated":
-                        stats["updated"] += 1
-                except Exception as e:
-                    logger.error(f"Failed to load player stats: {e}")
-                    stats["errors"] += 1
-            
-            session.commit()
-        
-        logger.info(f"Player statistics loaded: {stats}")
+                    async with session.begin_nested():
+                        await session.execute(_upsert_statement(table, tuple(sorted(chunk[0]))), chunk)
+                    stats["upserted"] += len(chunk)
+                except SQLAlchemyError as e:
+                    logger.error(f"Failed to load batch of {len(chunk)} {label}: {e}")
+                    stats["errors"] += len(chunk)
+        
+        logger.info(f"{label.capitalize()} loaded: {stats}")
         return stats
     
-    async def _upsert_team(self, session: Session, team_data: Dict[str, Any]) -> str:
-        """Upsert team data."""
-        # Try to find existing team by name or short_name
-        existing_team = session.execute(
-            select(Team).where(
-                (Team.name == team_data["name"]) | 
-                (Team.short_name == team_data["short_name"])
-            )
-        ).scalar_one_or_none()
-        
-        if existing_team:
-            # Update existing team
-            for key, value in team_data.items():
-                if hasattr(existing_team, key):
-                    setattr(existing_team, key, value)
-            return "updated"
-        else:
-            # Insert new team
-            team = Team(**team_data)
-            session.add(team)
-            return "inserted"
-    
-    async def _upsert_player(self, session: Session, player_data: Dict[str, Any]) -> str:
-        """Upsert player data."""
-        # Try to find existing player by name and team_id
-        existing_player = session.execute(
-            select(Player).where(
-                (Player.name == player_data["name"]) & 
-                (Player.team_id == player_data["team_id"])
-            )
-        ).scalar_one_or_none()
-        
-        if existing_player:
-            # Update existing player
-            for key, value in player_data.items():
-                if hasattr(existing_player, key):
-                    setattr(existing_player, key, value)
-            return "updated"
-        else:
-            # Insert new player
-            player = Player(**player_data)
-            session.add(player)
-            return "inserted"
-    
-    async def _upsert_match(self, session: Session, match_data: Dict[str, Any]) -> str:
-        """Upsert match data."""
-        # Try to find existing match by teams and date
-        existing_match = session.execute(
-            select(Match).where(
-                (Match.home_team_id == match_data["home_team_id"]) &
-                (Match.away_team_id == match_data["away_team_id"]) &
-                (Match.match_date == match_data["match_date"])
-            )
-        ).scalar_one_or_none()
-        
-        if existing_match:
-            # Update existing match
-            for key, value in match_data.items():
-                if hasattr(existing_match, key):
-                    setattr(existing_match, key, value)
-            return "updated"
-        else:
-            # Insert new match
-            match = Match(**match_data)
-            session.add(match)
-            return "inserted"
-    
-    async def _upsert_inning(self, session: Session, inning_data: Dict[str, Any]) -> str:
-        """Upsert inning data."""
-        # Try to find existing inning by match_id and inning_number
-        existing_inning = session.execute(
-            select(Inning).where(
-                (Inning.match_id == inning_data["match_id"]) &
-                (Inning.inning_number == inning_data["inning_number"])
-            )
-        ).scalar_one_or_none()
-        
-        if existing_inning:
-            # Update existing inning
-            for key, value in inning_data.items():
-                if hasattr(existing_inning, key):
-                    setattr(existing_inning, key, value)
-            return "updated"
-        else:
-            # Insert new inning
-            inning = Inning(**inning_data)
-            session.add(inning)
-            return "inserted"
+    async def _load_data_infile(self, table, rows: List[Dict[str, Any]], label: str) -> Dict[str, int]:
+        """Upsert ``rows`` into ``table`` with one staged LOAD DATA per column set."""
+        logger.info(f"Loading {len(rows)} {label} via LOAD DATA LOCAL INFILE")
+        
+        stats = {"upserted": 0, "errors": 0}
+        # Python-side column defaults are not applied by LOAD DATA, so fill them in
+        defaults = {
+            c.name: c.default.arg
+            for c in table.columns
+            if c.default is not None and c.default.is_scalar
+        }
+        
+        async with get_async_session() as session:
+            for columns, group in self._groups(table, rows):
+                missing = {k: v for k, v in defaults.items() if k not in columns}
+                if missing:
+                    group = [{**missing, **row} for row in group]
+                    columns = columns + tuple(missing)
+                create_stage, load, merge, drop_stage = _load_data_statements(table, columns)
+                path = await asyncio.to_thread(_write_tsv, columns, group)
+                try:
+                    # Temporary-table DDL does not commit implicitly, so the savepoint still applies
+                    async with session.begin_nested():
+                        await session.execute(drop_stage)
+                        await session.execute(create_stage)
+                        await session.execute(load, {"path": path})
+                        await session.execute(merge)
+                        await session.execute(drop_stage)
+                    stats["upserted"] += len(group)
+                except SQLAlchemyError as e:
+                    logger.error(f"Failed to load file of {len(group)} {label}: {e}")
+                    stats["errors"] += len(group)
+                finally:
+                    os.unlink(path)
+        
+        logger.info(f"{label.capitalize()} loaded: {stats}")
+        return stats
     
-    async def _upsert_ball_by_ball(self, session: Session, ball_data: Dict[str, Any]) -> str:
-        """Upsert ball-by-ball data."""
-        # Try to find existing ball by inning_id, over_number, and ball_number
-        existing_ball = session.execute(
-            select(BallByBall).where(
-                (BallByBall.inning_id == ball_data["inning_id"]) &
-                (BallByBall.over_number == ball_data["over_number"]) &
-                (BallByBall.ball_number == ball_data["ball_number"])
-            )
-        ).scalar_one_or_none()
-        
-        if existing_ball:
-            # Update existing ball
-            for key, value in ball_data.items():
-                if hasattr(existing_ball, key):
-                    setattr(existing_ball, key, value)
-            return "updated"
-        else:
-            # Insert new ball
-            ball = BallByBall(**ball_data)
-            session.add(ball)
-            return "inserted"
+    def _groups(self, table, rows: List[Dict[str, Any]]) -> Iterator[Tuple[Tuple[str, ...], List[Dict[str, Any]]]]:
+        """Yield ``(columns, rows)`` groups of deduplicated, column-filtered rows.
+        
+        Rows repeating a natural key are collapsed first (the last one wins, as with
+        sequential upserts). Executemany batches and LOAD DATA column lists need
+        identical columns in every row, so rows are then grouped by their keys.
+        """
+        key_columns = _NATURAL_KEYS[table]
+        columns = _WRITABLE_COLUMNS[table]
+        unique_rows = {tuple(row.get(c) for c in key_columns): row for row in rows}
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        unknown: set = set()
+        for row in unique_rows.values():
+            # Filter each payload once against the table's columns
+            clean = {k: v for k, v in row.items() if k in columns}
+            if len(clean) != len(row):
+                unknown.update(row.keys() - columns)
+            groups.setdefault(tuple(sorted(clean)), []).append(clean)
+        if unknown:
+            logger.warning(f"Ignoring unknown {table.name} fields: {sorted(unknown)}")
+        yield from groups.items()
     
-    async def _upsert_player_stats(self, session: Session, stats_data: Dict[str, Any]) -> str:
-        """Upsert player statistics data."""
-        # Try to find existing stats by player_id and match_id
-        existing_stats = session.execute(
-            select(PlayerMatchStats).where(
-                (PlayerMatchStats.player_id == stats_data["player_id"]) &
-                (PlayerMatchStats.match_id == stats_data["match_id"])
-            )
-        ).scalar_one_or_none()
-        
-        if existing_stats:
-            # Update existing stats
-            for key, value in stats_data.items():
-                if hasattr(existing_stats, key):
-                    setattr(existing_stats, key, value)
-            return "updated"
-        else:
-            # Insert new stats
-            stats = PlayerMatchStats(**stats_data)
-            session.add(stats)
-            return "inserted"
+    def _chunks(self, table, rows: List[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        """Yield batches of at most ``batch_size`` rows sharing the same key set."""
+        for _columns, group in self._groups(table, rows):
+            for start in range(0, len(group), self.batch_size):
+                yield group[start:start + self.batch_size]
     
     async def load_all_data(self, data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, int]]:
-        """Load all data types with proper dependency order."""
-        logger.info("Loading all data with dependency order")
-        
-        results = {}
-        
-        # Load in dependency order
-        if "teams" in data:
-            results["teams"] = await self.load_teams(data["teams"])
+        """Load all data types with proper dependency order.
         
-        if "players" in data:
-            results["players"] = await self.load_players(data["players"])
-        
-        if "matches" in data:
-            results["matches"] = await self.load_matches(data["matches"])
-        
-        if "innings" in data:
-            results["innings"] = await self.load_innings(data["innings"])
+        Tables that do not reference each other are loaded concurrently:
+        teams, then players and matches, then innings, then balls and stats.
+        """
+        logger.info("Loading all data with dependency order")
         
-        if "ball_by_ball" in data:
-            results["ball_by_ball"] = await self.load_ball_by_ball(data["ball_by_ball"])
+        loaders = {
+            "teams": self.load_teams,
+            "players": self.load_players,
+            "matches": self.load_matches,
+            "innings": self.load_innings,
+            "ball_by_ball": self.load_ball_by_ball,
+            "player_stats": self.load_player_stats,
+        }
+        stages = (("teams",), ("players", "matches"), ("innings",), ("ball_by_ball", "player_stats"))
+        semaphore = asyncio.Semaphore(max(self.concurrency, 1))
+        
+        async def run(key: str) -> Dict[str, int]:
+            async with semaphore:
+                return await loaders[key](data[key])
         
-        if "player_stats" in data:
-            results["player_stats"] = await self.load_player_stats(data["player_stats"])
+        results = {}
+        for stage in stages:
+            keys = [key for key in stage if key in data]
+            stage_results = await asyncio.gather(*(run(key) for key in keys))
+            results.update(zip(keys, stage_results))
         
         logger.info("All data loaded successfully")
         return results
@@ -21,7 +21,7 @@ from __future__ import annotations
 import csv
 import os
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 import typer
 from loguru import logger
@@ -33,7 +33,6 @@ from ..etl.config import get_etl_config
 app = typer.Typer(no_args_is_help=True, help="Legacy migration utilities")
 
 REPORTS_DIR = Path("docs/reports")
-REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def _get_engines():
@@ -88,153 +87,160 @@ def _truncate_staging(conn):
     conn.exec_driver_sql("TRUNCATE TABLE staging_matches")
 
 
+INSERT_CHUNK_SIZE = 5000
+STREAM_CHUNK_SIZE = 10_000
+
+# (count key, legacy SELECT, staging INSERT)
+_LEGACY_COPIES = (
+    (
+        "players_src",
+        """
+        SELECT id as legacy_player_id,
+               full_name,
+               known_as,
+               born_date,
+               country as country_name
+        FROM cricinfo_players
+        """,
+        """
+        INSERT INTO staging_players(legacy_player_id, full_name, known_as, born_date, country_name)
+        VALUES (:legacy_player_id, :full_name, :known_as, :born_date, :country_name)
+        """,
+    ),
+    (
+        "teams_src",
+        """
+        SELECT id as legacy_team_id,
+               name,
+               country as country_name
+        FROM cricinfo_teams
+        """,
+        """
+        INSERT INTO staging_teams(legacy_team_id, name, country_name)
+        VALUES (:legacy_team_id, :name, :country_name)
+        """,
+    ),
+    (
+        # Matches (minimal)
+        "matches_src",
+        """
+        SELECT id as legacy_match_id,
+               format,
+               start_date,
+               venue_name,
+               home_team,
+               away_team
+        FROM cricinfo_matches
+        """,
+        """
+        INSERT INTO staging_matches(legacy_match_id, format, start_date, venue_name, home_team, away_team)
+        VALUES (:legacy_match_id, :format, :start_date, :venue_name, :home_team, :away_team)
+        """,
+    ),
+)
+
+
+def _insert_chunked(tgt, stmt, payload: List[dict], chunk_size: int = INSERT_CHUNK_SIZE) -> None:
+    """Insert rows with one executemany per chunk instead of one round-trip per row."""
+    for i in range(0, len(payload), chunk_size):
+        tgt.execute(stmt, payload[i:i + chunk_size])
+
+
+def _copy_legacy_table(legacy_engine, tgt, select_sql: str, insert_sql: str, commit: bool) -> int:
+    """Stream a legacy table through a server-side cursor into staging; returns rows read."""
+    insert_stmt = text(insert_sql)
+    total = 0
+    chunk: List[dict] = []
+    with legacy_engine.connect() as src:
+        result = src.execution_options(stream_results=True, yield_per=STREAM_CHUNK_SIZE).execute(text(select_sql))
+        for r in result:
+            total += 1
+            if not commit:
+                continue
+            chunk.append(dict(r._mapping))
+            if len(chunk) >= STREAM_CHUNK_SIZE:
+                _insert_chunked(tgt, insert_stmt, chunk)
+                chunk.clear()
+    if chunk:
+        _insert_chunked(tgt, insert_stmt, chunk)
+    return total
+
+
 def _ingest_legacy(legacy_engine, target_engine, commit: bool) -> Dict[str, int]:
     counts: Dict[str, int] = {}
     with target_engine.begin() as tgt:
         _create_staging_tables(tgt)
         if commit:
             _truncate_staging(tgt)
-        # Players
-        with legacy_engine.connect() as src:
-            rows = src.execute(text(
-                """
-                SELECT id as legacy_player_id,
-                       full_name,
-                       known_as,
-                       born_date,
-                       country as country_name
-                FROM cricinfo_players
-                """
-            )).fetchall()
-        counts["players_src"] = len(rows)
-        if commit and rows:
-            for r in rows:
-                tgt.execute(
-                    text(
-                        """
-                        INSERT INTO staging_players(legacy_player_id, full_name, known_as, born_date, country_name)
-                        VALUES (:legacy_player_id, :full_name, :known_as, :born_date, :country_name)
-                        """
-                    ),
-                    dict(r._mapping),
-                )
-        # Teams
-        with legacy_engine.connect() as src:
-            rows = src.execute(text(
-                """
-                SELECT id as legacy_team_id,
-                       name,
-                       country as country_name
-                FROM cricinfo_teams
-                """
-            )).fetchall()
-        counts["teams_src"] = len(rows)
-        if commit and rows:
-            for r in rows:
-                tgt.execute(
-                    text(
-                        """
-                        INSERT INTO staging_teams(legacy_team_id, name, country_name)
-                        VALUES (:legacy_team_id, :name, :country_name)
-                        """
-                    ),
-                    dict(r._mapping),
-                )
-        # Matches (minimal)
-        with legacy_engine.connect() as src:
-            rows = src.execute(text(
-                """
-                SELECT id as legacy_match_id,
-                       format,
-                       start_date,
-                       venue_name,
-                       home_team,
-                       away_team
-                FROM cricinfo_matches
-                """
-            )).fetchall()
-        counts["matches_src"] = len(rows)
-        if commit and rows:
-            for r in rows:
-                tgt.execute(
-                    text(
-                        """
-                        INSERT INTO staging_matches(legacy_match_id, format, start_date, venue_name, home_team, away_team)
-                        VALUES (:legacy_match_id, :format, :start_date, :venue_name, :home_team, :away_team)
-                        """
-                    ),
-                    dict(r._mapping),
-                )
+        for key, select_sql, insert_sql in _LEGACY_COPIES:
+            counts[key] = _copy_legacy_table(legacy_engine, tgt, select_sql, insert_sql, commit)
     return counts
 
 
+_MAP_TO_CANONICAL = (
+    (
+        "countries",
+        """
+        INSERT INTO countries(name)
+        SELECT DISTINCT country_name FROM staging_players
+        WHERE country_name IS NOT NULL AND country_name<>''
+        ON DUPLICATE KEY UPDATE name=VALUES(name)
+        """,
+    ),
+    (
+        "teams",
+        """
+        INSERT INTO teams(name, country_id)
+        SELECT s.name, c.id
+        FROM staging_teams s
+        LEFT JOIN countries c ON c.name = s.country_name
+        ON DUPLICATE KEY UPDATE country_id=VALUES(country_id)
+        """,
+    ),
+    (
+        "players",
+        """
+        INSERT INTO players(full_name, born_date, country_id)
+        SELECT s.full_name, s.born_date, c.id
+        FROM staging_players s
+        LEFT JOIN countries c ON c.name = s.country_name
+        ON DUPLICATE KEY UPDATE country_id=VALUES(country_id)
+        """,
+    ),
+    (
+        # Lowest player id wins for duplicate names
+        "aliases",
+        """
+        INSERT INTO player_alias(player_id, alias_name)
+        SELECT p.id, TRIM(s.known_as)
+        FROM staging_players s
+        JOIN (SELECT full_name, MIN(id) AS id FROM players GROUP BY full_name) p
+          ON p.full_name = s.full_name
+        WHERE s.known_as IS NOT NULL AND TRIM(s.known_as)<>'' AND TRIM(s.known_as)<>s.full_name
+        ON DUPLICATE KEY UPDATE player_id=player_id
+        """,
+    ),
+)
+
+
 def _map_to_canonical(target_engine, commit: bool) -> Dict[str, int]:
     """Map staging to canonical minimal entities with aliasing.
 
     - Upsert countries, teams, players
     - Add aliases when names differ
+
+    Each step is a single INSERT ... SELECT run server-side; stats are MySQL's affected-row counts.
     """
-    stats: Dict[str, int] = {"countries": 0, "teams": 0, "players": 0, "aliases": 0}
+    stats: Dict[str, int] = {key: 0 for key, _sql in _MAP_TO_CANONICAL}
+    if not commit:
+        return stats
     with target_engine.begin() as conn:
-        # Countries from staging (distinct country_name)
-        countries = conn.execute(text("SELECT DISTINCT country_name FROM staging_players WHERE country_name IS NOT NULL AND country_name<>'' "))
-        for (country_name,) in countries:
-            if not commit:
-                continue
-            conn.exec_driver_sql(
-                """
-                INSERT INTO countries(name)
-                VALUES (%s)
-                ON DUPLICATE KEY UPDATE name=VALUES(name)
-                """,
-                (country_name,),
-            )
-            stats["countries"] += 1
-        # Teams
-        teams = conn.execute(text("SELECT name, country_name FROM staging_teams"))
-        for name, country_name in teams:
-            if not commit:
-                continue
-            country_id = conn.exec_driver_sql("SELECT id FROM countries WHERE name=%s LIMIT 1", (country_name,)).scalar()
-            conn.exec_driver_sql(
-                """
-                INSERT INTO teams(name, country_id)
-                VALUES (%s, %s)
-                ON DUPLICATE KEY UPDATE country_id=VALUES(country_id)
-                """,
-                (name, country_id),
-            )
-            stats["teams"] += 1
-        # Players
-        players = conn.execute(text("SELECT full_name, known_as, born_date, country_name FROM staging_players"))
-        for full_name, known_as, born_date, country_name in players:
-            if not commit:
-                continue
-            country_id = conn.exec_driver_sql("SELECT id FROM countries WHERE name=%s LIMIT 1", (country_name,)).scalar()
-            conn.exec_driver_sql(
-                """
-                INSERT INTO players(full_name, born_date, country_id)
-                VALUES (%s, %s, %s)
-                ON DUPLICATE KEY UPDATE country_id=VALUES(country_id)
-                """,
-                (full_name, born_date, country_id),
-            )
-            stats["players"] += 1
-            if known_as and known_as.strip() and known_as.strip() != full_name:
-                pid = conn.exec_driver_sql("SELECT id FROM players WHERE full_name=%s LIMIT 1", (full_name,)).scalar()
-                conn.exec_driver_sql(
-                    """
-                    INSERT INTO player_alias(player_id, alias_name)
-                    VALUES (%s, %s)
-                    ON DUPLICATE KEY UPDATE player_id=player_id
-                    """,
-                    (pid, known_as.strip()),
-                )
-                stats["aliases"] += 1
+        for key, sql in _MAP_TO_CANONICAL:
+            stats[key] = conn.execute(text(sql)).rowcount
     return stats
 
 
-def _write_csv(path: Path, headers: List[str], rows: List[Tuple]):
+def _write_csv(path: Path, headers: List[str], rows: Iterable[Tuple]):
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
@@ -246,18 +252,20 @@ def _write_csv(path: Path, headers: List[str], rows: List[Tuple]):
 def _reconciliation_reports(target_engine):
     """Emit simple reports: players with same name diff DOB; unmatched venues from staging."""
     with target_engine.connect() as conn:
-        dup_players = conn.exec_driver_sql(
+        # One row per duplicated name (not per pair), streamed straight into the CSV
+        dup_players = conn.execution_options(stream_results=True).exec_driver_sql(
             """
-            SELECT p1.full_name, p1.born_date, p2.born_date
-            FROM players p1
-            JOIN players p2 ON p1.full_name=p2.full_name AND p1.id<p2.id
-            WHERE p1.born_date IS NOT NULL AND p2.born_date IS NOT NULL AND p1.born_date<>p2.born_date
+            SELECT full_name, GROUP_CONCAT(DISTINCT born_date ORDER BY born_date) AS dobs
+            FROM players
+            WHERE born_date IS NOT NULL
+            GROUP BY full_name
+            HAVING COUNT(DISTINCT born_date) > 1
             LIMIT 500
             """
-        ).fetchall()
-        _write_csv(REPORTS_DIR / "legacy_dup_player_names.csv", ["full_name", "dob_1", "dob_2"], dup_players)
+        )
+        _write_csv(REPORTS_DIR / "legacy_dup_player_names.csv", ["full_name", "dobs"], dup_players)
 
-        unmatched_venues = conn.exec_driver_sql(
+        unmatched_venues = conn.execution_options(stream_results=True).exec_driver_sql(
             """
             SELECT DISTINCT s.venue_name
             FROM staging_matches s
@@ -265,7 +273,7 @@ def _reconciliation_reports(target_engine):
             WHERE v.id IS NULL
             ORDER BY s.venue_name
             """
-        ).fetchall()
+        )
         _write_csv(REPORTS_DIR / "legacy_unmatched_venues.csv", ["venue_name"], unmatched_venues)
 
 
@@ -1,28 +1,34 @@
 from __future__ import annotations
 
-from typing import List, Optional, Literal
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, List, Optional, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import TypeAdapter
 
 
-class PlayerRef(BaseModel):
+@dataclass(slots=True)
+class PlayerRef:
     name: str
     source_key: Optional[str] = None
 
 
-class TeamRef(BaseModel):
+@dataclass(slots=True)
+class TeamRef:
     name: str
     source_key: Optional[str] = None
 
 
-class VenueRef(BaseModel):
+@dataclass(slots=True)
+class VenueRef:
     name: str
     city: Optional[str] = None
     country: Optional[str] = None
     source_key: Optional[str] = None
 
 
-class BattingEntry(BaseModel):
+@dataclass(slots=True)
+class BattingEntry:
     player: PlayerRef
     position: Optional[int] = None
     runs: Optional[int] = None
@@ -35,7 +41,8 @@ class BattingEntry(BaseModel):
     fielder: Optional[PlayerRef] = None
 
 
-class BowlingEntry(BaseModel):
+@dataclass(slots=True)
+class BowlingEntry:
     player: PlayerRef
     overs: Optional[float] = None
     maidens: Optional[int] = None
@@ -46,14 +53,16 @@ class BowlingEntry(BaseModel):
     econ: Optional[float] = None
 
 
-class FieldingEntry(BaseModel):
+@dataclass(slots=True)
+class FieldingEntry:
     player: PlayerRef
     catches: Optional[int] = None
     stumpings: Optional[int] = None
     runouts: Optional[int] = None
 
 
-class Delivery(BaseModel):
+@dataclass(slots=True)
+class Delivery:
     over_no: int
     ball_no: int
     striker: PlayerRef
@@ -69,7 +78,8 @@ class Delivery(BaseModel):
     dismissal_player: Optional[PlayerRef] = None
 
 
-class InningsModel(BaseModel):
+@dataclass(slots=True)
+class InningsModel:
     innings_no: int
     batting_team: TeamRef
     bowling_team: TeamRef
@@ -78,29 +88,33 @@ class InningsModel(BaseModel):
     overs: Optional[float] = None
     declared: bool = False
     follow_on_enforced: bool = False
-    batting: List[BattingEntry] = Field(default_factory=list)
-    bowling: List[BowlingEntry] = Field(default_factory=list)
-    fielding: List[FieldingEntry] = Field(default_factory=list)
-    deliveries: List[Delivery] = Field(default_factory=list)
+    batting: List[BattingEntry] = field(default_factory=list)
+    bowling: List[BowlingEntry] = field(default_factory=list)
+    fielding: List[FieldingEntry] = field(default_factory=list)
+    deliveries: List[Delivery] = field(default_factory=list)
 
 
-class Officials(BaseModel):
-    umpires: List[PlayerRef] = Field(default_factory=list)
+@dataclass(slots=True)
+class Officials:
+    umpires: List[PlayerRef] = field(default_factory=list)
     third_umpire: Optional[PlayerRef] = None
     match_referee: Optional[PlayerRef] = None
 
 
-class TossInfo(BaseModel):
+@dataclass(slots=True)
+class TossInfo:
     winner: Optional[TeamRef] = None
     decision: Optional[Literal["bat", "bowl"]] = None
 
 
-class ResultInfo(BaseModel):
+@dataclass(slots=True)
+class ResultInfo:
     result_type: Optional[str] = None  # win/tie/draw/no_result
     winner: Optional[TeamRef] = None
 
 
-class MatchModel(BaseModel):
+@dataclass(slots=True)
+class MatchModel:
     source_match_key: Optional[str] = None
     format: Optional[str] = None
     start_date: Optional[str] = None  # ISO date
@@ -108,15 +122,33 @@ class MatchModel(BaseModel):
     venue: Optional[VenueRef] = None
     series_name: Optional[str] = None
     series_key: Optional[str] = None
-    teams: List[TeamRef] = Field(default_factory=list)
+    teams: List[TeamRef] = field(default_factory=list)
     day_night: bool = False
     follow_on: bool = False
     dl_method: bool = False
     reserve_day: bool = False
-    toss: TossInfo = Field(default_factory=TossInfo)
-    result: ResultInfo = Field(default_factory=ResultInfo)
-    officials: Officials = Field(default_factory=Officials)
-    innings: List[InningsModel] = Field(default_factory=list)
-    aliases: List[str] = Field(default_factory=list)  # names observed for later review
+    # Left as None until the page actually yields toss/result/official details
+    toss: Optional[TossInfo] = None
+    result: Optional[ResultInfo] = None
+    officials: Optional[Officials] = None
+    innings: List[InningsModel] = field(default_factory=list)
+    aliases: List[str] = field(default_factory=list)  # names observed for later review
 
 
+
+
+# Plain slotted dataclasses keep parsing cheap; Pydantic is only used at the
+# serialization boundary (cached JSON models) via a TypeAdapter.
+@lru_cache(maxsize=1)
+def _match_adapter() -> TypeAdapter:
+    return TypeAdapter(MatchModel)
+
+
+def validate_match(data: Any) -> MatchModel:
+    """Validate a plain dict (e.g. loaded JSON) into a MatchModel."""
+    return _match_adapter().validate_python(data)
+
+
+def dump_match_json(match: MatchModel, indent: Optional[int] = None) -> str:
+    """Serialize a MatchModel to JSON."""
+    return _match_adapter().dump_json(match, indent=indent).decode("utf-8")
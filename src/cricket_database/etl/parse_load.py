@@ -1,18 +1,48 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import List, Optional, Tuple
+import gzip
+import os
+import zlib
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import ExitStack, closing
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 
 from loguru import logger
 from sqlalchemy import text
 
+from .models import MatchModel
+from . import raw_store
 from .parse_scorecard import parse_scorecard
 from .upsert_scorecard import upsert_match_tree
 from ..database import get_database_engine
 from ..etl.config import get_etl_config
 
 
-def _select_raw_html(source_id: int, limit: int, days_back: Optional[int]) -> List[Tuple[int, str, str]]:
+RAW_HTML_YIELD_PER = 50
+# Pages handed to a worker per IPC round-trip
+PARSE_CHUNKSIZE = 8
+# Chunks in flight per worker; bounds how far ahead of the consumer rows are read
+PARSE_CHUNKS_IN_FLIGHT = 2
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# raw_html.body as returned by the driver: TEXT as str, BLOB as bytes
+RawBody = Union[str, bytes, None]
+
+
+def _select_raw_html(source_id: int, limit: int, days_back: Optional[int]) -> Iterator[Tuple[int, str, RawBody, str]]:
+    """Stream ``(id, url, body, sha256)`` rows through a server-side cursor, ``RAW_HTML_YIELD_PER`` at a time.
+
+    ``body`` is passed on exactly as the driver returns it; decoding and any
+    decompression (or external-store read) happen in ``_parse_one``, i.e. in the worker process.
+    """
     engine = get_database_engine()
     params = {"source_id": source_id, "limit": limit}
     where = "WHERE source_id = :source_id"
@@ -20,19 +50,88 @@ def _select_raw_html(source_id: int, limit: int, days_back: Optional[int]) -> Li
         where += " AND fetched_at >= :since"
         params["since"] = dt.datetime.utcnow() - dt.timedelta(days=days_back)
     sql = f"""
-        SELECT id, url, body
+        SELECT id, url, body, sha256
         FROM raw_html
         {where}
         ORDER BY fetched_at DESC
         LIMIT :limit
     """
     with engine.connect() as conn:
-        rows = conn.exec_driver_sql(sql, params).fetchall()
-    return [(int(r[0]), str(r[1]), str(r[2])) for r in rows]
+        result = conn.execution_options(stream_results=True, yield_per=RAW_HTML_YIELD_PER).execute(text(sql), params)
+        for r in result:
+            yield int(r[0]), str(r[1]), r[2], r[3]
+
+
+def decode_raw_body(body: RawBody, sha: Optional[str] = None) -> bytes:
+    """Stored ``raw_html.body`` as the plain HTML bytes the parser takes.
+
+    Handles legacy TEXT bodies, uncompressed BLOBs and the zlib/gzip-compressed
+    bodies written by the raw fetcher. A NULL body with its ``sha256`` is read
+    from the external body store (``RAW_BODY_DIR``).
+    """
+    if body is None and sha:
+        body = raw_store.read_body(sha)
+    # The parser takes bytes directly; no decode/re-encode round trip
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    body = bytes(body or b"")
+    # Bodies archived compressed are inflated here, in the worker that parses them.
+    # The headers are only sniffed, so a plain body that happens to start like one
+    # (e.g. "x ") is passed through when it does not inflate.
+    try:
+        if body[:2] == _GZIP_MAGIC:
+            return gzip.decompress(body)
+        if body[:1] == b"\x78" and int.from_bytes(body[:2], "big") % 31 == 0:
+            return zlib.decompress(body)
+    except (zlib.error, gzip.BadGzipFile, EOFError):
+        pass
+    return body
+
+
+def _parse_chunk(fn: Callable[[_T], _R], items: List[_T]) -> List[_R]:
+    return [fn(item) for item in items]
+
+
+def _bounded_map(ex: Executor, fn: Callable[[_T], _R], items: Iterable[_T], chunksize: int, window: int) -> Iterator[_R]:
+    """``ex.map(fn, items, chunksize=...)`` with at most ``window`` chunks submitted at a time.
+
+    ``Executor.map`` consumes its whole input up front; here the next chunk is only
+    read from ``items`` once an earlier one has been handed back, so a streaming
+    source stays streaming. Results come back in input order.
+    """
+    items = iter(items)
+    pending: deque = deque()
+
+    def submit_next() -> bool:
+        chunk = list(islice(items, chunksize))
+        if chunk:
+            pending.append(ex.submit(_parse_chunk, fn, chunk))
+        return bool(chunk)
+
+    while len(pending) < window and submit_next():
+        pass
+    while pending:
+        results = pending.popleft().result()
+        submit_next()
+        yield from results
+
 
+def _parse_one(row: Tuple[int, str, RawBody, str], keep_match: bool = True):
+    """Parse a single scorecard; top-level so it can run in a worker process.
 
-def summarize_parse(url: str, html: str) -> dict:
-    match, warnings = parse_scorecard(html, page_url=url)
+    Returns ``(raw_id, url, parsed, error)``. ``parsed`` is ``(match, warnings)``;
+    with ``keep_match=False`` (dry runs) it is just the summary dict, so workers do
+    not pickle the whole match.
+    """
+    rid, url, body, sha = row
+    try:
+        match, warnings = summarize_parse(url, decode_raw_body(body, sha))
+    except Exception as e:
+        return rid, url, None, str(e)
+    return rid, url, (match, warnings) if keep_match else _summary(match, warnings), None
+
+
+def _summary(match, warnings: List[str]) -> dict:
     return {
         "source_match_key": match.source_match_key,
         "teams": [t.name for t in match.teams],
@@ -43,26 +142,53 @@ def summarize_parse(url: str, html: str) -> dict:
     }
 
 
-def run_parse_load(limit: int = 10, days_back: Optional[int] = None, dry_run: bool = True, source_id: Optional[int] = None) -> List[dict]:
+def summarize_parse(url: str, html: Union[str, bytes]) -> Tuple[MatchModel, List[str]]:
+    """Parse once and return ``(match, warnings)``; build a summary with ``_summary`` only if needed."""
+    return parse_scorecard(html, page_url=url)
+
+
+def run_parse_load(limit: int = 10, days_back: Optional[int] = None, dry_run: bool = True, source_id: Optional[int] = None, workers: int = 1) -> Iterator[dict]:
+    """Parse (and unless dry-run, upsert) recent raw_html rows, yielding one summary per match.
+
+    ``workers > 1`` parses in that many processes (``0`` = one per CPU); DB writes stay
+    in this process so the single-transaction semantics are unchanged.
+    """
     cfg = get_etl_config()
     sid = source_id or cfg.sources.cricketarchive_source_id
-    rows = _select_raw_html(sid, limit, days_back)
-    summaries: List[dict] = []
-    engine = get_database_engine()
-    for rid, url, body in rows:
-        try:
-            summary = summarize_parse(url, body)
-            summary.update({"raw_id": rid, "url": url})
-            summaries.append(summary)
-            logger.info(f"parsed raw_id={rid} url={url} match_key={summary.get('source_match_key')}")
-            if not dry_run:
-                match, _warnings = parse_scorecard(body, page_url=url)
-                with engine.begin() as conn:
-                    match_id, stats = upsert_match_tree(conn, match)
-                summary["match_id"] = match_id
-                summary["upsert_stats"] = stats
-        except Exception as e:
-            logger.warning(f"parse_failed raw_id={rid} url={url} err={e}")
-    return summaries
+    with ExitStack() as stack:
+        # Rows arrive from a server-side cursor; only the chunks in flight are held in memory
+        rows = stack.enter_context(closing(_select_raw_html(sid, limit, days_back)))
+        # Parsing is CPU-bound: fan out across processes when asked to
+        parse = partial(_parse_one, keep_match=not dry_run)
+        if workers == 0:
+            workers = os.cpu_count() or 1
+        if workers > 1:
+            ex = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            parsed = _bounded_map(ex, parse, rows, PARSE_CHUNKSIZE, workers * PARSE_CHUNKS_IN_FLIGHT)
+        else:
+            parsed = map(parse, rows)
 
+        # One transaction for the whole batch; a savepoint per match keeps one bad
+        # scorecard from rolling back the others
+        conn = None if dry_run else stack.enter_context(get_database_engine().begin())
 
+        for rid, url, result, err in parsed:
+            if err is not None:
+                logger.warning(f"parse_failed raw_id={rid} url={url} err={err}")
+                continue
+            if conn is None:
+                summary = result
+            else:
+                match, warnings = result
+                summary = _summary(match, warnings)
+            summary.update({"raw_id": rid, "url": url})
+            logger.info(f"parsed raw_id={rid} url={url} match_key={summary.get('source_match_key')}")
+            if conn is not None:
+                try:
+                    with conn.begin_nested():
+                        match_id, stats = upsert_match_tree(conn, match)
+                    summary["match_id"] = match_id
+                    summary["upsert_stats"] = stats
+                except Exception as e:
+                    logger.warning(f"load_failed raw_id={rid} url={url} err={e}")
+            yield summary
@@ -1,6 +1,6 @@
 """Robust HTML parser for cricket scorecards.
 
-Converts raw HTML into structured Pydantic models with:
+Converts raw HTML into structured match dataclasses with:
 - Match details, teams, venue, officials
 - Innings with batting/bowling entries
 - Ball-by-ball deliveries when available
@@ -16,13 +16,19 @@ IMPORTANT NOTES:
 from __future__ import annotations
 
 import re
+import sys
 import unicodedata
-from typing import List, Tuple, Optional
+from dataclasses import asdict
+from functools import cache
+from io import BytesIO
+from typing import Dict, List, Tuple, Optional, Union
 
 from loguru import logger
-from lxml import html
+from lxml import etree
+from lxml.etree import XPath
 
 from .models import (
+    validate_match,
     MatchModel,
     InningsModel,
     BattingEntry,
@@ -31,17 +37,57 @@ from .models import (
     Delivery,
     PlayerRef,
     TeamRef,
+    TossInfo,
     VenueRef,
 )
 
 
+# Streaming HTML parse: no id index (never looked up), no comments/PIs in the tree
+_ITERPARSE_OPTIONS = dict(
+    events=("end",),
+    html=True,
+    encoding="utf-8",
+    collect_ids=False,
+    huge_tree=True,
+    remove_comments=True,
+    remove_pis=True,
+)
+
+# XPath expressions are compiled once at import and reused for every page/row
+_INNINGS_HEADER_XPATH = XPath('string(.//h3)')
+_INNINGS_SCORE_XPATH = XPath('string(.//*[contains(@class, "score")])')
+_INNINGS_OVERS_XPATH = XPath('string(.//*[contains(@class, "overs")])')
+_BAT_ROWS = XPath('.//table[contains(@class, "batting")]//tr')
+_BOW_ROWS = XPath('.//table[contains(@class, "bowling")]//tr')
+
+
+# Regexes compiled once; ASCII whitespace suffices since NFKD maps NBSP & co. to " "
+_WS_RE = re.compile(r"[ \t\n\r\f\v]+")
+_KEY_RE = re.compile(r"(\d{4,})")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)")
+_TOSS_RE = re.compile(r"Toss:\s*([^,]+),\s*(bat|bowl)", re.IGNORECASE)
+
+@cache
+def _combining_table() -> Dict[int, None]:
+    """Combining marks (the accents NFKD splits off) mapped to None for str.translate.
+
+    Built on the first non-ASCII cell rather than at import: scanning every code
+    point costs tens of milliseconds per process.
+    """
+    return dict.fromkeys(i for i in range(sys.maxunicode + 1) if unicodedata.combining(chr(i)))
+
+
 def _clean_text(text: Optional[str]) -> str:
     if not text:
         return ""
+    # Most cells are plain ASCII, where NFKD and accent stripping are no-ops
+    if text.isascii():
+        return _WS_RE.sub(" ", text).strip()
     # normalize unicode accents, collapse whitespace, strip
-    text = unicodedata.normalize("NFKD", text)
-    text = "".join(ch for ch in text if not unicodedata.combining(ch))
-    text = re.sub(r"\s+", " ", text)
+    if not unicodedata.is_normalized("NFKD", text):
+        text = unicodedata.normalize("NFKD", text)
+    text = text.translate(_combining_table())
+    text = _WS_RE.sub(" ", text)
     return text.strip()
 
 
@@ -49,45 +95,199 @@ def _int_or_none(s: str) -> Optional[int]:
     s = s.strip() if s else s
     if not s:
         return None
-    try:
-        return int(s)
-    except Exception:
-        return None
+    # Validate up front instead of try/except: non-numeric cells are common (e.g. "DNB")
+    digits = s[1:] if s[0] in "+-" else s
+    return int(s) if digits.isdecimal() else None
 
 
 def _float_or_none(s: str) -> Optional[float]:
     s = s.strip() if s else s
     if not s:
         return None
-    try:
-        return float(s)
-    except Exception:
-        return None
+    return float(s) if _FLOAT_RE.fullmatch(s) else None
+
+
+def _row_cells(tr) -> List[str]:
+    """Stripped, non-empty text of each ``<td>`` child of a table row.
+
+    Only the text columns need ``_clean_text``; numeric columns go straight to
+    ``_int_or_none``/``_float_or_none``, so cleaning is left to the caller.
+    """
+    cells = []
+    for td in tr.iterchildren("td"):
+        cell = "".join(td.itertext()).strip()
+        if cell:
+            cells.append(cell)
+    return cells
+
 
+def _player_ref(cache: Dict[str, PlayerRef], name: str) -> PlayerRef:
+    """One shared, interned PlayerRef per distinct name within a page."""
+    ref = cache.get(name)
+    if ref is None:
+        ref = cache[name] = PlayerRef(name=sys.intern(name))
+    return ref
 
-def parse_scorecard(html_text: str, page_url: Optional[str] = None) -> Tuple[MatchModel, List[str]]:
+
+def _team_ref(cache: Dict[str, TeamRef], name: str) -> TeamRef:
+    """One shared, interned TeamRef per distinct name within a page."""
+    ref = cache.get(name)
+    if ref is None:
+        ref = cache[name] = TeamRef(name=sys.intern(name))
+    return ref
+
+
+def _scan_metadata(tree) -> Tuple[str, str, str, List[str]]:
+    """Raw title, venue, match-info and team-header (first two) texts from one tree walk.
+
+    Each value is the first hit in document order, as with XPath ``string(//...)``;
+    the walk stops as soon as everything has been found.
+    """
+    title = venue = info = None
+    team_texts: List[str] = []
+    for el in tree.iter(etree.Element):
+        tag = el.tag
+        if title is None and tag == "title":
+            title = "".join(el.itertext())
+        cls = el.get("class")
+        if cls:
+            if venue is None and "venue" in cls:
+                venue = "".join(el.itertext())
+            if info is None and "match-info" in cls:
+                info = "".join(el.itertext())
+            if tag == "h2" and len(team_texts) < 2 and "team" in cls:
+                team_texts.append("".join(el.itertext()))
+        if title is not None and venue is not None and info is not None and len(team_texts) == 2:
+            break
+    return title or "", venue or "", info or "", team_texts
+
+
+def _is_innings_div(elem) -> bool:
+    return "innings" in (elem.get("class") or "")
+
+
+def _parse_innings(block, idx: int, players: Dict[str, PlayerRef]) -> Tuple[str, InningsModel]:
+    """Parse one innings block; teams are resolved by the caller once the page metadata is known."""
+    header = _clean_text(_INNINGS_HEADER_XPATH(block))
+    runs = _int_or_none(_clean_text(_INNINGS_SCORE_XPATH(block)))
+    overs = _float_or_none(_clean_text(_INNINGS_OVERS_XPATH(block)))
+    wickets = None
+    inn = InningsModel(
+        innings_no=idx,
+        batting_team=None,
+        bowling_team=None,
+        runs=runs,
+        wickets=wickets,
+        overs=overs,
+    )
+
+    # Batting rows
+    for tr in _BAT_ROWS(block):
+        cells = _row_cells(tr)
+        if len(cells) < 2:
+            continue
+        name = _clean_text(cells[0])
+        if name.lower().startswith("extras"):
+            continue
+        how_out = _clean_text(cells[1])
+        runs = _int_or_none(cells[2]) if len(cells) > 2 else None
+        balls = _int_or_none(cells[3]) if len(cells) > 3 else None
+        fours = _int_or_none(cells[4]) if len(cells) > 4 else None
+        sixes = _int_or_none(cells[5]) if len(cells) > 5 else None
+        inn.batting.append(
+            BattingEntry(
+                player=_player_ref(players, name),
+                runs=runs,
+                balls=balls,
+                fours=fours,
+                sixes=sixes,
+                how_out=how_out,
+            )
+        )
+
+    # Bowling rows
+    for tr in _BOW_ROWS(block):
+        cells = _row_cells(tr)
+        if len(cells) >= 5:
+            name = _clean_text(cells[0])
+            overs = _float_or_none(cells[1])
+            maidens = _int_or_none(cells[2])
+            runs_c = _int_or_none(cells[3])
+            wkts = _int_or_none(cells[4])
+            inn.bowling.append(
+                BowlingEntry(
+                    player=_player_ref(players, name),
+                    overs=overs,
+                    maidens=maidens,
+                    runs=runs_c,
+                    wickets=wkts,
+                )
+            )
+
+    return header, inn
+
+
+def parse_scorecard(
+    html_text: Union[str, bytes],
+    page_url: Optional[str] = None,
+    validate: bool = False,
+) -> Tuple[MatchModel, List[str]]:
     """Parse a scorecard HTML page into MatchModel and warnings list.
 
+    Accepts UTF-8 bytes (preferred, e.g. ``raw_html.body`` as stored) or text.
     Resilient to missing bits; emits warnings rather than raising.
+
+    The page is streamed with ``iterparse``: each innings block is parsed as soon as
+    it closes and then cleared, so the row-heavy tables are never all held at once.
+    Page metadata is read from the (now small) remaining tree afterwards, in one walk.
+
+    Models are plain dataclasses since every value has already been cleaned/coerced
+    here; pass ``validate=True`` to run full Pydantic validation on the result
+    (e.g. in tests).
     """
     warnings: List[str] = []
+    innings_warnings: List[str] = []
+    data = html_text.encode("utf-8", "replace") if isinstance(html_text, str) else html_text
+
+    # Innings tables (selectors to be adapted to the provider)
+    parsed_innings: List[Tuple[str, InningsModel]] = []
+    # Names repeat across batting/bowling rows: share one ref (and one string) per name
+    players: Dict[str, PlayerRef] = {}
+    teams_by_name: Dict[str, TeamRef] = {}
+    idx = 0
     try:
-        tree = html.fromstring(html_text)
+        context = etree.iterparse(BytesIO(data), tag="div", **_ITERPARSE_OPTIONS)
+        for _event, block in context:
+            if not _is_innings_div(block):
+                continue
+            idx += 1
+            try:
+                parsed_innings.append(_parse_innings(block, idx, players))
+            except Exception as e:
+                innings_warnings.append(f"innings_parse_failed_{idx}: {e}")
+            # Free the block unless an enclosing innings div still needs its rows
+            if not any(_is_innings_div(a) for a in block.iterancestors("div")):
+                block.clear(keep_tail=True)
+        tree = context.root
     except Exception as e:
         logger.error(f"HTML parse error: {e}")
         raise
+    if tree is None:
+        raise etree.ParserError("Document is empty")
 
     match = MatchModel()
 
     # Extract source match key from URL when possible (e.g., .../Scorecards/12345.html)
     if page_url:
-        m = re.search(r"(\d{4,})", page_url)
+        m = _KEY_RE.search(page_url)
         if m:
             match.source_match_key = m.group(1)
 
-    # Title/series/venue blocks (site-specific XPaths likely need tuning)
+    # Page metadata in a single pass over the residual tree (selectors likely need tuning)
+    title, venue_text, info_text, team_texts = _scan_metadata(tree)
+
+    # Title/series/venue blocks
     try:
-        title = tree.xpath('string(//title)')
         title = _clean_text(title)
         if title:
             match.aliases.append(title)
@@ -96,7 +296,6 @@ def parse_scorecard(html_text: str, page_url: Optional[str] = None) -> Tuple[Mat
 
     # Venue (very heuristic; adjust selectors as per actual DOM)
     try:
-        venue_text = tree.xpath('string(//*[contains(@class, "venue")])') or ""
         venue_text = _clean_text(venue_text)
         if venue_text:
             match.venue = VenueRef(name=venue_text)
@@ -105,12 +304,11 @@ def parse_scorecard(html_text: str, page_url: Optional[str] = None) -> Tuple[Mat
 
     # Teams
     try:
-        team_nodes = tree.xpath('//h2[contains(@class, "team")]')
         teams: List[TeamRef] = []
-        for tn in team_nodes[:2]:
-            tname = _clean_text(tn.text_content())
+        for tn in team_texts:
+            tname = _clean_text(tn)
             if tname:
-                teams.append(TeamRef(name=tname))
+                teams.append(_team_ref(teams_by_name, tname))
         if teams:
             match.teams = teams
     except Exception as e:
@@ -118,89 +316,29 @@ def parse_scorecard(html_text: str, page_url: Optional[str] = None) -> Tuple[Mat
 
     # Toss/result/day-night/follow-on/DL (heuristic extraction)
     try:
-        info_text = tree.xpath('string(//*[contains(@class, "match-info")])')
         info_text = _clean_text(info_text)
         if "day/night" in info_text.lower():
             match.day_night = True
         if "D/L" in info_text or "DLS" in info_text:
             match.dl_method = True
         # naive toss detection
-        mtoss = re.search(r"Toss:\s*([^,]+),\s*(bat|bowl)", info_text, re.IGNORECASE)
+        mtoss = _TOSS_RE.search(info_text)
         if mtoss:
-            match.toss.winner = TeamRef(name=_clean_text(mtoss.group(1)))
-            match.toss.decision = "bat" if mtoss.group(2).lower().startswith("bat") else "bowl"
+            match.toss = TossInfo(
+                winner=_team_ref(teams_by_name, _clean_text(mtoss.group(1))),
+                decision="bat" if mtoss.group(2).lower().startswith("bat") else "bowl",
+            )
     except Exception as e:
         warnings.append(f"meta_parse_failed: {e}")
 
-    # Innings tables (selectors to be adapted to the provider)
-    innings_blocks = tree.xpath('//div[contains(@class, "innings")]')
-    for idx, block in enumerate(innings_blocks, start=1):
-        try:
-            header = _clean_text(block.xpath('string(.//h3)'))
-            batting_team = TeamRef(name=_clean_text(header.split(" innings")[0])) if header else (match.teams[0] if match.teams else TeamRef(name="Unknown"))
-            bowling_team = (match.teams[1] if match.teams and len(match.teams) > 1 else TeamRef(name="Unknown"))
-            runs = _int_or_none(_clean_text(block.xpath('string(.//*[contains(@class, "score")])')))
-            overs = _float_or_none(_clean_text(block.xpath('string(.//*[contains(@class, "overs")])')))
-            wickets = None
-            inn = InningsModel(
-                innings_no=idx,
-                batting_team=batting_team,
-                bowling_team=bowling_team,
-                runs=runs,
-                wickets=wickets,
-                overs=overs,
-            )
-
-            # Batting rows
-            for tr in block.xpath('.//table[contains(@class, "batting")]//tr'):
-                cells = [
-                    _clean_text(x) for x in tr.xpath('./td//text()')
-                    if _clean_text(x)
-                ]
-                if len(cells) >= 2 and not cells[0].lower().startswith("extras"):
-                    name = cells[0]
-                    how_out = cells[1] if len(cells) > 1 else None
-                    runs = _int_or_none(cells[2]) if len(cells) > 2 else None
-                    balls = _int_or_none(cells[3]) if len(cells) > 3 else None
-                    fours = _int_or_none(cells[4]) if len(cells) > 4 else None
-                    sixes = _int_or_none(cells[5]) if len(cells) > 5 else None
-                    inn.batting.append(
-                        BattingEntry(
-                            player=PlayerRef(name=name),
-                            runs=runs,
-                            balls=balls,
-                            fours=fours,
-                            sixes=sixes,
-                            how_out=how_out,
-                        )
-                    )
-
-            # Bowling rows
-            for tr in block.xpath('.//table[contains(@class, "bowling")]//tr'):
-                cells = [
-                    _clean_text(x) for x in tr.xpath('./td//text()')
-                    if _clean_text(x)
-                ]
-                if len(cells) >= 5:
-                    name = cells[0]
-                    overs = _float_or_none(cells[1])
-                    maidens = _int_or_none(cells[2])
-                    runs_c = _int_or_none(cells[3])
-                    wkts = _int_or_none(cells[4])
-                    inn.bowling.append(
-                        BowlingEntry(
-                            player=PlayerRef(name=name),
-                            overs=overs,
-                            maidens=maidens,
-                            runs=runs_c,
-                            wickets=wkts,
-                        )
-                    )
-
-            match.innings.append(inn)
-        except Exception as e:
-            warnings.append(f"innings_parse_failed_{idx}: {e}")
+    for header, inn in parsed_innings:
+        inn.batting_team = _team_ref(teams_by_name, _clean_text(header.split(" innings")[0])) if header else (match.teams[0] if match.teams else _team_ref(teams_by_name, "Unknown"))
+        inn.bowling_team = (match.teams[1] if match.teams and len(match.teams) > 1 else _team_ref(teams_by_name, "Unknown"))
+        match.innings.append(inn)
+    warnings.extend(innings_warnings)
 
+    if validate:
+        match = validate_match(asdict(match))
     return match, warnings
 
 
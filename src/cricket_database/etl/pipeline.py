@@ -2,17 +2,46 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Tuple
 
 from .transformers import DataTransformer, DataValidator
 from .loaders import DatabaseLoader
 from .quality_checks import DataQualityChecker
-from ..scrapers import ESPNScraper, CricketAPIScraper
+from ..scrapers import BallBuffer, BaseScraper, ESPNScraper, CricketAPIScraper
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Concurrent match-detail requests per source when the rate limit does not size it
+MATCH_DETAILS_CONCURRENCY = 10
+# Extracted batches allowed to wait for transform/load before scraping pauses
+PIPELINE_QUEUE_DEPTH = 2
+
+RECORD_TYPES = ("teams", "players", "matches", "innings", "ball_by_ball", "player_stats")
+# Entity lists taken from a source's scrape_all() output
+SCRAPED_ENTITIES = ("teams", "players", "matches")
+
+
+def _select_entities(data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    return {key: data.get(key, []) for key in SCRAPED_ENTITIES}
+
+
+def _add_counts(counts: Dict[str, int], data: Dict[str, List[Dict[str, Any]]]) -> None:
+    for key in RECORD_TYPES:
+        counts[key] += len(data.get(key, []))
+
+
+def _merge_load_results(total: Dict[str, Any], batch: Dict[str, Any]) -> None:
+    """Sum per-table load stats across batches (dry-run markers are copied as-is)."""
+    for table, stats in batch.items():
+        if isinstance(stats, dict):
+            merged = total.setdefault(table, {})
+            for key, value in stats.items():
+                merged[key] = merged.get(key, 0) + value
+        else:
+            total[table] = stats
+
 
 class ETLPipeline:
     """Main ETL pipeline for cricket data processing."""
@@ -45,17 +74,9 @@ class ETLPipeline:
         start_time = datetime.now()
         
         try:
-            # Step 1: Extract data
-            logger.info("Step 1: Extracting data from sources")
-            raw_data = await self._extract_data()
-            
-            # Step 2: Transform data
-            logger.info("Step 2: Transforming data")
-            transformed_data = await self._transform_data(raw_data)
-            
-            # Step 3: Load data
-            logger.info("Step 3: Loading data to database")
-            load_results = await self._load_data(transformed_data)
+            # Steps 1-3: extract, transform and load, overlapped per source batch
+            logger.info("Steps 1-3: Extracting, transforming and loading data")
+            extracted, transformed, load_results = await self._run_batches(self._extract_batches())
             
             # Step 4: Quality checks
             logger.info("Step 4: Running data quality checks")
@@ -70,22 +91,8 @@ class ETLPipeline:
                 "start_time": start_time.isoformat(),
                 "end_time": end_time.isoformat(),
                 "duration_seconds": duration,
-                "extraction": {
-                    "teams": len(raw_data.get("teams", [])),
-                    "players": len(raw_data.get("players", [])),
-                    "matches": len(raw_data.get("matches", [])),
-                    "innings": len(raw_data.get("innings", [])),
-                    "ball_by_ball": len(raw_data.get("ball_by_ball", [])),
-                    "player_stats": len(raw_data.get("player_stats", []))
-                },
-                "transformation": {
-                    "teams": len(transformed_data.get("teams", [])),
-                    "players": len(transformed_data.get("players", [])),
-                    "matches": len(transformed_data.get("matches", [])),
-                    "innings": len(transformed_data.get("innings", [])),
-                    "ball_by_ball": len(transformed_data.get("ball_by_ball", [])),
-                    "player_stats": len(transformed_data.get("player_stats", []))
-                },
+                "extraction": extracted,
+                "transformation": transformed,
                 "loading": load_results,
                 "quality_checks": quality_results,
                 "dry_run": self.dry_run
@@ -114,17 +121,11 @@ class ETLPipeline:
             end_date = datetime.now().date()
             start_date = end_date - timedelta(days=days_back)
             
-            # Step 1: Extract recent data
-            logger.info("Step 1: Extracting recent data")
-            raw_data = await self._extract_recent_data(start_date, end_date)
-            
-            # Step 2: Transform data
-            logger.info("Step 2: Transforming recent data")
-            transformed_data = await self._transform_data(raw_data)
-            
-            # Step 3: Load data (upsert mode)
-            logger.info("Step 3: Loading recent data to database")
-            load_results = await self._load_data(transformed_data)
+            # Steps 1-3: extract, transform and load (upsert mode), overlapped per source batch
+            logger.info("Steps 1-3: Extracting, transforming and loading recent data")
+            extracted, transformed, load_results = await self._run_batches(
+                self._extract_recent_batches(start_date, end_date)
+            )
             
             # Step 4: Quality checks
             logger.info("Step 4: Running data quality checks")
@@ -144,22 +145,8 @@ class ETLPipeline:
                 "start_time": start_time.isoformat(),
                 "end_time": end_time.isoformat(),
                 "duration_seconds": duration,
-                "extraction": {
-                    "teams": len(raw_data.get("teams", [])),
-                    "players": len(raw_data.get("players", [])),
-                    "matches": len(raw_data.get("matches", [])),
-                    "innings": len(raw_data.get("innings", [])),
-                    "ball_by_ball": len(raw_data.get("ball_by_ball", [])),
-                    "player_stats": len(raw_data.get("player_stats", []))
-                },
-                "transformation": {
-                    "teams": len(transformed_data.get("teams", [])),
-                    "players": len(transformed_data.get("players", [])),
-                    "matches": len(transformed_data.get("matches", [])),
-                    "innings": len(transformed_data.get("innings", [])),
-                    "ball_by_ball": len(transformed_data.get("ball_by_ball", [])),
-                    "player_stats": len(transformed_data.get("player_stats", []))
-                },
+                "extraction": extracted,
+                "transformation": transformed,
                 "loading": load_results,
                 "quality_checks": quality_results,
                 "dry_run": self.dry_run
@@ -179,50 +166,77 @@ class ETLPipeline:
                 "dry_run": self.dry_run
             }
     
-    async def _extract_data(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Extract data from all sources."""
-        all_data = {
-            "teams": [],
-            "players": [],
-            "matches": [],
-            "innings": [],
-            "ball_by_ball": [],
-            "player_stats": []
-        }
-        
+    async def _run_batches(
+        self, batches: AsyncIterator[Dict[str, List[Dict[str, Any]]]]
+    ) -> Tuple[Dict[str, int], Dict[str, int], Dict[str, Any]]:
+        """Transform and load source batches while the next one is still being scraped.
+
+        Extraction feeds a queue of at most ``PIPELINE_QUEUE_DEPTH`` batches; the consumer
+        transforms each one in a worker thread (keeping the event loop free for scraper
+        I/O) and then loads it. Returns extracted counts, transformed counts and the
+        merged load results.
+        """
+        extracted = dict.fromkeys(RECORD_TYPES, 0)
+        transformed = dict.fromkeys(RECORD_TYPES, 0)
+        load_results: Dict[str, Any] = {}
+        queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_DEPTH)
+
+        async def produce() -> None:
+            async for raw in batches:
+                await queue.put(raw)
+            # Only on normal completion: on failure/cancellation the TaskGroup cancels
+            # the consumer, and a put() here could block forever on a full queue
+            await queue.put(None)
+
+        async def consume() -> None:
+            while (raw := await queue.get()) is not None:
+                _add_counts(extracted, raw)
+                batch = await asyncio.to_thread(self._transform_data, raw)
+                _add_counts(transformed, batch)
+                _merge_load_results(load_results, await self._load_data(batch))
+
+        # A failing consumer cancels the producer instead of leaving it blocked on put()
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(produce())
+                tg.create_task(consume())
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+        return extracted, transformed, load_results
+    
+    async def _extract_batches(self) -> AsyncIterator[Dict[str, List[Dict[str, Any]]]]:
+        """Extract data from all sources, yielding one batch per source."""
         # Extract from ESPN Cricinfo
         async with self.espn_scraper:
             try:
                 espn_data = await self.espn_scraper.scrape_all()
-                all_data["teams"].extend(espn_data.get("teams", []))
-                all_data["players"].extend(espn_data.get("players", []))
-                all_data["matches"].extend(espn_data.get("matches", []))
             except Exception as e:
                 logger.warning(f"ESPN scraper failed: {e}")
+            else:
+                yield _select_entities(espn_data)
         
         # Extract from Cricket API (if available)
         try:
             cricket_api_data = await self.cricket_api_scraper.scrape_all()
-            all_data["teams"].extend(cricket_api_data.get("teams", []))
-            all_data["players"].extend(cricket_api_data.get("players", []))
-            all_data["matches"].extend(cricket_api_data.get("matches", []))
         except Exception as e:
             logger.warning(f"Cricket API scraper failed: {e}")
+        else:
+            yield _select_entities(cricket_api_data)
+    
+    async def _extract_data(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Extract data from all sources into a single dict of record lists."""
+        all_data: Dict[str, List[Dict[str, Any]]] = {key: [] for key in RECORD_TYPES}
+        async for batch in self._extract_batches():
+            for key, records in batch.items():
+                all_data[key].extend(records)
         
         logger.info(f"Extracted data: {sum(len(v) for v in all_data.values())} total records")
         return all_data
     
-    async def _extract_recent_data(self, start_date: datetime.date, end_date: datetime.date) -> Dict[str, List[Dict[str, Any]]]:
-        """Extract recent data from sources."""
-        all_data = {
-            "teams": [],
-            "players": [],
-            "matches": [],
-            "innings": [],
-            "ball_by_ball": [],
-            "player_stats": []
-        }
-        
+    async def _extract_recent_batches(
+        self, start_date: date, end_date: date
+    ) -> AsyncIterator[Dict[str, List[Dict[str, Any]]]]:
+        """Extract recent data from sources, yielding one batch per source."""
         # Extract recent matches from ESPN Cricinfo
         async with self.espn_scraper:
             try:
@@ -230,16 +244,13 @@ class ETLPipeline:
                     start_date=start_date.isoformat(),
                     end_date=end_date.isoformat()
                 )
-                all_data["matches"].extend(recent_matches)
                 
                 # Extract detailed match data including ball-by-ball
-                for match in recent_matches:
-                    if match.get("espn_id"):
-                        match_details = await self.espn_scraper.scrape_match_details(match["espn_id"])
-                        all_data["ball_by_ball"].extend(match_details.get("ball_by_ball", []))
-                        
+                ball_by_ball = await self._scrape_ball_by_ball(self.espn_scraper, recent_matches, "espn_id")
             except Exception as e:
                 logger.warning(f"ESPN scraper failed for recent data: {e}")
+            else:
+                yield {"matches": recent_matches, "ball_by_ball": ball_by_ball}
         
         # Extract recent matches from Cricket API
         try:
@@ -247,21 +258,40 @@ class ETLPipeline:
                 start_date=start_date.isoformat(),
                 end_date=end_date.isoformat()
             )
-            all_data["matches"].extend(recent_matches)
             
             # Extract detailed match data
-            for match in recent_matches:
-                if match.get("cricket_api_id"):
-                    match_details = await self.cricket_api_scraper.scrape_match_details(match["cricket_api_id"])
-                    all_data["ball_by_ball"].extend(match_details.get("ball_by_ball", []))
-                    
+            ball_by_ball = await self._scrape_ball_by_ball(self.cricket_api_scraper, recent_matches, "cricket_api_id")
+            
         except Exception as e:
             logger.warning(f"Cricket API scraper failed for recent data: {e}")
-        
-        logger.info(f"Extracted recent data: {sum(len(v) for v in all_data.values())} total records")
-        return all_data
+        else:
+            yield {"matches": recent_matches, "ball_by_ball": ball_by_ball}
+    
+    async def _scrape_ball_by_ball(
+        self, scraper: BaseScraper, matches: List[Dict[str, Any]], id_key: str
+    ) -> BallBuffer:
+        """Fetch match details concurrently and collect their ball-by-ball records.
+
+        Requests are independent, so up to one second's worth of the configured
+        per-minute rate limit is kept in flight; a failed match is logged and skipped.
+        """
+        sem = asyncio.Semaphore(settings.scraper.max_requests_per_minute // 60 or MATCH_DETAILS_CONCURRENCY)
+        match_ids = [m[id_key] for m in matches if m.get(id_key)]
+
+        async def fetch(match_id: str) -> Dict[str, Any]:
+            async with sem:
+                return await scraper.scrape_match_details(match_id)
+
+        details = await asyncio.gather(*(fetch(i) for i in match_ids), return_exceptions=True)
+        ball_by_ball = BallBuffer(scraper.BALL_FIELDS)
+        for match_id, match_details in zip(match_ids, details):
+            if isinstance(match_details, Exception):
+                logger.warning(f"Match details failed for {match_id}: {match_details}")
+                continue
+            ball_by_ball.extend(match_details.get("ball_by_ball", []))
+        return ball_by_ball
     
-    async def _transform_data(self, raw_data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    def _transform_data(self, raw_data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
         """Transform raw data using transformers."""
         transformed_data = {}
         
@@ -289,7 +319,7 @@ class ETLPipeline:
         if raw_data.get("player_stats"):
             transformed_data["player_stats"] = self.transformer.transform_player_stats(raw_data["player_stats"])
         
-        logger.info(f"Transformed data: {sum(len(v) for v in transformed_data.values())} total records")
+        logger.debug(f"Transformed batch: {sum(len(v) for v in transformed_data.values())} total records")
         return transformed_data
     
     async def _load_data(self, transformed_data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, int]]:
@@ -316,39 +346,30 @@ class ETLPipeline:
             "cricket_api": {"status": "unknown", "error": None}
         }
         
-        # Test ESPN Cricinfo
-        try:
+        async def check_espn() -> Dict[str, Any]:
             async with self.espn_scraper:
                 # Try to scrape a small amount of data
                 teams = await self.espn_scraper.scrape_teams()
-                validation_results["espn_cricinfo"] = {
-                    "status": "success",
-                    "teams_found": len(teams)
-                }
-        except Exception as e:
-            validation_results["espn_cricinfo"] = {
-                "status": "failed",
-                "error": str(e)
-            }
-        
-        # Test Cricket API
-        try:
+                return {"status": "success", "teams_found": len(teams)}
+
+        async def check_cricket_api() -> Dict[str, Any]:
             # Try to scrape a small amount of data
             teams = await self.cricket_api_scraper.scrape_teams()
-            validation_results["cricket_api"] = {
-                "status": "success",
-                "teams_found": len(teams)
-            }
-        except Exception as e:
-            validation_results["cricket_api"] = {
-                "status": "failed",
-                "error": str(e)
-            }
+            return {"status": "success", "teams_found": len(teams)}
+
+        # Sources are independent, so probe them concurrently
+        sources = list(validation_results)
+        outcomes = await asyncio.gather(check_espn(), check_cricket_api(), return_exceptions=True)
+        for source, outcome in zip(sources, outcomes):
+            if isinstance(outcome, Exception):
+                validation_results[source] = {"status": "failed", "error": str(outcome)}
+            else:
+                validation_results[source] = outcome
         
         logger.info(f"Data source validation completed: {validation_results}")
         return validation_results
     
-    async def get_pipeline_status(self) -> Dict[str, Any]:
+    def get_pipeline_status(self) -> Dict[str, Any]:
         """Get current pipeline status and metrics."""
         return {
             "pipeline_config": {
@@ -1,25 +1,277 @@
 """Data quality checking components."""
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional, Set
-from datetime import datetime, date
-from sqlalchemy import select, func
-from sqlalchemy.orm import Session
+from functools import lru_cache
+from pathlib import Path
+from statistics import StatisticsError, fmean
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from datetime import datetime, date, timedelta
+from sqlalchemy import Date, DateTime, Integer, Select, bindparam, case, select, func
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from ..database import get_session
+from ..config import settings
+from ..database import get_async_session
 from ..models import Team, Player, Match, Inning, BallByBall, PlayerMatchStats
 
 logger = logging.getLogger(__name__)
 
 
+class _CountDistinct(FunctionElement):
+    """``COUNT(DISTINCT a, b, ...)``; MySQL rejects the row-constructor form ``COUNT(DISTINCT (a, b))``."""
+
+    name = "count_distinct"
+    type = Integer()
+    inherit_cache = True
+
+
+@compiles(_CountDistinct)
+def _compile_count_distinct(element, compiler, **kw):
+    return "COUNT(DISTINCT %s)" % compiler.process(element.clauses, **kw)
+
+
+# Keys of _count_rows results that are not issue counts
+_SUMMARY_COUNTS = ("total", "distinct_keys")
+
+
+def _count_statement(model, key: Sequence[Any] = (), **conditions) -> Select:
+    """Row count of ``model`` plus one count per named condition, all from a single scan.
+    
+    With ``key`` columns, ``distinct_keys`` counts distinct non-NULL key tuples in the
+    same pass; when it equals ``total`` the table cannot hold duplicate keys, so the
+    caller can skip its GROUP BY ... HAVING duplicate scan.
+    """
+    columns = [func.count(model.id).label("total")]
+    if key:
+        columns.append(_CountDistinct(*key).label("distinct_keys"))
+    columns += [
+        func.coalesce(func.sum(case((condition, 1), else_=0)), 0).label(name)
+        for name, condition in conditions.items()
+    ]
+    return select(*columns)
+
+
+def _duplicates_statement(model, key: Sequence[Any]) -> Select:
+    """``key`` values shared by more than one row of ``model``, with their row counts."""
+    return select(*key, func.count(model.id)).group_by(*key).having(func.count(model.id) > 1)
+
+
+@lru_cache(maxsize=None)
+def _compiled_counts(statement: Select, dialect) -> Tuple[str, Tuple[str, ...], Dict[str, Any], Tuple[str, ...]]:
+    """SQL text, positional bind names, literal bind values and result names of a count statement."""
+    compiled = statement.compile(dialect=dialect)
+    names = tuple(column.name for column in statement.selected_columns)
+    return compiled.string, tuple(compiled.positiontup), dict(compiled.params), names
+
+
+async def _count_rows(session: AsyncSession, statement: Select, **params) -> Dict[str, int]:
+    """Run a prebuilt single-row count statement straight on the DBAPI cursor.
+    
+    Counts need none of SQLAlchemy's result/row machinery, so the cached SQL is sent
+    as-is and the one row read back as plain integers.
+    """
+    conn = await session.connection()
+    sql, positions, binds, names = _compiled_counts(statement, conn.dialect)
+    binds = {**binds, **params}
+    raw = await conn.get_raw_connection()
+    async with raw.driver_connection.cursor() as cursor:
+        await cursor.execute(sql, [binds[name] for name in positions])
+        row = await cursor.fetchone()
+    return {name: int(value or 0) for name, value in zip(names, row)}
+
+
+def _score(issues: List[Dict[str, Any]], penalty: int = 10) -> int:
+    """100 minus ``penalty`` per issue, floored at 0."""
+    return 100 - min(len(issues) * penalty, 100)
+
+
+def _append_count_issues(issues: List[Dict[str, Any]], counts: Dict[str, int]) -> None:
+    """Add an issue for every non-zero condition count."""
+    for issue_type, count in counts.items():
+        if issue_type not in _SUMMARY_COUNTS and count > 0:
+            issues.append({"type": issue_type, "count": count})
+
+
+# Check statements are built once at import and reused on every run, so each
+# execution only binds parameters (SQLAlchemy also reuses their compiled SQL).
+# Date conditions bind :today at execution time.
+_TODAY = bindparam("today", type_=Date())
+
+_TEAM_KEY = (Team.name,)
+_TEAM_COUNTS = _count_statement(
+    Team,
+    key=_TEAM_KEY,
+    missing_names=(Team.name == "") | (Team.name.is_(None)),
+    invalid_countries=(Team.country == "") | (Team.country.is_(None)),
+)
+_TEAM_DUPLICATES = _duplicates_statement(Team, _TEAM_KEY)
+
+_PLAYER_KEY = (Player.name, Player.team_id)
+_PLAYER_COUNTS = _count_statement(
+    Player,
+    key=_PLAYER_KEY,
+    missing_names=(Player.name == "") | (Player.name.is_(None)),
+    invalid_team_references=Player.team_id.is_(None),
+    future_birth_dates=Player.date_of_birth > _TODAY,
+)
+_PLAYER_DUPLICATES = _duplicates_statement(Player, _PLAYER_KEY)
+
+_MATCH_KEY = (Match.home_team_id, Match.away_team_id, Match.match_date)
+_MATCH_COUNTS = _count_statement(
+    Match,
+    key=_MATCH_KEY,
+    future_completed_matches=(Match.match_date > _TODAY) & (Match.status == "completed"),
+    same_team_matches=Match.home_team_id == Match.away_team_id,
+)
+_MATCH_DUPLICATES = _duplicates_statement(Match, _MATCH_KEY)
+
+_INNING_KEY = (Inning.match_id, Inning.inning_number)
+_INNING_COUNTS = _count_statement(
+    Inning,
+    key=_INNING_KEY,
+    invalid_scores=(Inning.runs_scored < 0) | (Inning.wickets_lost < 0) | (Inning.wickets_lost > 10),
+    invalid_overs=(Inning.overs_bowled < 0) | (Inning.balls_bowled < 0) | (Inning.balls_bowled > 5),
+)
+_INNING_DUPLICATES = _duplicates_statement(Inning, _INNING_KEY)
+
+_BALL_KEY = (BallByBall.inning_id, BallByBall.over_number, BallByBall.ball_number)
+_BALL_COUNTS = _count_statement(
+    BallByBall,
+    key=_BALL_KEY,
+    invalid_runs=(BallByBall.runs_scored < 0) | (BallByBall.runs_scored > 6),
+    inconsistent_boundary_flags=(
+        ((BallByBall.is_six == True) & (BallByBall.runs_scored != 6)) |
+        ((BallByBall.is_four == True) & (BallByBall.runs_scored != 4))
+    ),
+)
+_BALL_DUPLICATES = _duplicates_statement(BallByBall, _BALL_KEY)
+
+_STATS_KEY = (PlayerMatchStats.player_id, PlayerMatchStats.match_id)
+_STATS_COUNTS = _count_statement(
+    PlayerMatchStats,
+    key=_STATS_KEY,
+    invalid_statistics=(
+        (PlayerMatchStats.runs_scored < 0) |
+        (PlayerMatchStats.balls_faced < 0) |
+        (PlayerMatchStats.wickets_taken < 0) |
+        (PlayerMatchStats.runs_conceded < 0)
+    ),
+)
+_STATS_DUPLICATES = _duplicates_statement(PlayerMatchStats, _STATS_KEY)
+
+
+def _orphan_counts_statement() -> Select:
+    """Orphaned rows via LEFT JOIN ... IS NULL anti-joins, all four counts in one SELECT.
+    
+    NULL foreign keys are not orphans (as with the NOT IN form).
+    """
+    home_team, away_team = aliased(Team), aliased(Team)
+    orphan_queries = {
+        "invalid_player_team_references": (
+            select(func.count(Player.id))
+            .outerjoin(Team, Player.team_id == Team.id)
+            .where(Player.team_id.is_not(None), Team.id.is_(None))
+        ),
+        "invalid_match_team_references": (
+            select(func.count(Match.id))
+            .outerjoin(home_team, Match.home_team_id == home_team.id)
+            .outerjoin(away_team, Match.away_team_id == away_team.id)
+            .where(
+                (Match.home_team_id.is_not(None) & home_team.id.is_(None)) |
+                (Match.away_team_id.is_not(None) & away_team.id.is_(None))
+            )
+        ),
+        "invalid_inning_match_references": (
+            select(func.count(Inning.id))
+            .outerjoin(Match, Inning.match_id == Match.id)
+            .where(Inning.match_id.is_not(None), Match.id.is_(None))
+        ),
+        "invalid_ball_inning_references": (
+            select(func.count(BallByBall.id))
+            .outerjoin(Inning, BallByBall.inning_id == Inning.id)
+            .where(BallByBall.inning_id.is_not(None), Inning.id.is_(None))
+        ),
+    }
+    return select(*(query.scalar_subquery().label(name) for name, query in orphan_queries.items()))
+
+
+_ORPHAN_COUNTS = _orphan_counts_statement()
+
+# Matches not updated in 30 days and players not updated in 90 (cutoffs bound per run)
+_FRESHNESS_COUNTS = select(
+    select(func.count(Match.id))
+    .where(Match.updated_at < bindparam("match_cutoff", type_=DateTime()))
+    .scalar_subquery().label("old_matches"),
+    select(func.count(Player.id))
+    .where(Player.updated_at < bindparam("player_cutoff", type_=DateTime()))
+    .scalar_subquery().label("inactive_players"),
+)
+
+
+QUALITY_CACHE_PATH = Path("data/cache/quality_check_cache.json")
+
+# Tables each check group reads; its cached result is reused while these are unchanged
+_CHECK_TABLES = {
+    "teams": (Team,),
+    "players": (Player,),
+    "matches": (Match,),
+    "innings": (Inning,),
+    "ball_by_ball": (BallByBall,),
+    "player_stats": (PlayerMatchStats,),
+    "referential_integrity": (Player, Team, Match, Inning, BallByBall),
+}
+
+# Groups whose counts compare against :today; their cached result only holds for that day
+_DATE_DEPENDENT_CHECKS = frozenset({"players", "matches"})
+
+
+async def _table_fingerprints(session: AsyncSession) -> Dict[str, List[Any]]:
+    """``[row count, latest updated_at]`` for every checked table, in one round-trip."""
+    models = {model for group in _CHECK_TABLES.values() for model in group}
+    columns = []
+    for model in models:
+        columns.append(select(func.count(model.id)).scalar_subquery().label(f"{model.__tablename__}__count"))
+        columns.append(select(func.max(model.updated_at)).scalar_subquery().label(f"{model.__tablename__}__updated"))
+    row = (await session.execute(select(*columns))).one()._mapping
+    fingerprints = {}
+    for model in models:
+        table = model.__tablename__
+        updated = row[f"{table}__updated"]
+        fingerprints[table] = [int(row[f"{table}__count"]), updated.isoformat() if updated else None]
+    return fingerprints
+
+
+def _json_safe(value: Any) -> Any:
+    """``value`` as it reads back from the JSON cache."""
+    return json.loads(json.dumps(value, default=str))
+
+
+def _database_fingerprint() -> str:
+    url = settings.database.url.render_as_string(hide_password=True)
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
 class DataQualityChecker:
     """Data quality checking component."""
     
-    def __init__(self, enable_checks: bool = True):
+    def __init__(self, enable_checks: bool = True, cache_path: Optional[Path] = QUALITY_CACHE_PATH):
         self.enable_checks = enable_checks
+        # Check results are reused while their tables are unchanged; None disables caching
+        self.cache_path = cache_path
+        self._cache: Optional[Dict[str, dict]] = None
     
-    async def check_data_quality(self) -> Dict[str, Any]:
-        """Run comprehensive data quality checks."""
+    async def check_data_quality(self, refresh: bool = False) -> Dict[str, Any]:
+        """Run comprehensive data quality checks.
+        
+        A check group whose tables still have the same row counts and latest
+        ``updated_at`` as on a previous run reuses that run's result; pass
+        ``refresh=True`` to recompute everything.
+        """
         if not self.enable_checks:
             return {"status": "disabled"}
         
@@ -30,27 +282,46 @@ class DataQualityChecker:
             "checks": {}
         }
         
-        with get_session() as session:
-            # Check teams
-            results["checks"]["teams"] = await self._check_teams_quality(session)
-            
-            # Check players
-            results["checks"]["players"] = await self._check_players_quality(session)
-            
-            # Check matches
-            results["checks"]["matches"] = await self._check_matches_quality(session)
-            
-            # Check innings
-            results["checks"]["innings"] = await self._check_innings_quality(session)
-            
-            # Check ball-by-ball
-            results["checks"]["ball_by_ball"] = await self._check_ball_by_ball_quality(session)
-            
-            # Check player stats
-            results["checks"]["player_stats"] = await self._check_player_stats_quality(session)
-            
-            # Check referential integrity
-            results["checks"]["referential_integrity"] = await self._check_referential_integrity(session)
+        checks = {
+            "teams": self._check_teams_quality,
+            "players": self._check_players_quality,
+            "matches": self._check_matches_quality,
+            "innings": self._check_innings_quality,
+            "ball_by_ball": self._check_ball_by_ball_quality,
+            "player_stats": self._check_player_stats_quality,
+            "referential_integrity": self._check_referential_integrity,
+        }
+        cache = self._load_cache()
+        fingerprints = {}
+        if cache is not None:
+            tables = await self._run_in_session(_table_fingerprints)
+            fingerprints = {
+                name: [tables[model.__tablename__] for model in _CHECK_TABLES[name]] for name in checks
+            }
+            today = date.today().isoformat()
+            for name in _DATE_DEPENDENT_CHECKS.intersection(fingerprints):
+                fingerprints[name].append(today)
+        
+        stale = {}
+        for name, check in checks.items():
+            entry = None if refresh or cache is None else cache.get(name)
+            if entry and entry.get("fingerprint") == fingerprints[name]:
+                results["checks"][name] = entry["result"]
+            else:
+                stale[name] = check
+        if len(stale) < len(checks):
+            logger.info(f"Reusing cached results for unchanged tables: {sorted(set(checks) - set(stale))}")
+        
+        # Check groups are independent: run them concurrently, each on its own session
+        outcomes = await asyncio.gather(*(self._run_in_session(check) for check in stale.values()))
+        # Same JSON shape as a cached result (dates as strings, tuples as lists), cached or not
+        results["checks"].update(zip(stale, map(_json_safe, outcomes)))
+        results["checks"] = {name: results["checks"][name] for name in checks}
+        
+        if cache is not None and stale:
+            for name in stale:
+                cache[name] = {"fingerprint": fingerprints[name], "result": results["checks"][name]}
+            self._save_cache(cache)
         
         # Calculate overall quality score
         results["overall_score"] = self._calculate_quality_score(results["checks"])
@@ -58,381 +329,216 @@ class DataQualityChecker:
         logger.info(f"Data quality check completed. Overall score: {results['overall_score']}")
         return results
     
-    async def _check_teams_quality(self, session: Session) -> Dict[str, Any]:
+    async def _check_teams_quality(self, session: AsyncSession) -> Dict[str, Any]:
         """Check teams data quality."""
         issues = []
         
+        # Totals, missing required fields and invalid countries in one scan
+        counts = await _count_rows(session, _TEAM_COUNTS)
+        
         # Check for duplicate team names
-        duplicate_names = session.execute(
-            select(Team.name, func.count(Team.id))
-            .group_by(Team.name)
-            .having(func.count(Team.id) > 1)
-        ).fetchall()
-        
-        if duplicate_names:
-            issues.append({
-                "type": "duplicate_names",
-                "count": len(duplicate_names),
-                "details": [{"name": name, "count": count} for name, count in duplicate_names]
-            })
-        
-        # Check for missing required fields
-        missing_names = session.execute(
-            select(func.count(Team.id))
-            .where((Team.name == "") | (Team.name.is_(None)))
-        ).scalar()
-        
-        if missing_names > 0:
-            issues.append({
-                "type": "missing_names",
-                "count": missing_names
-            })
-        
-        # Check for invalid countries
-        invalid_countries = session.execute(
-            select(func.count(Team.id))
-            .where((Team.country == "") | (Team.country.is_(None)))
-        ).scalar()
-        
-        if invalid_countries > 0:
-            issues.append({
-                "type": "invalid_countries",
-                "count": invalid_countries
-            })
+        if counts["distinct_keys"] < counts["total"]:
+            duplicate_names = (await session.execute(_TEAM_DUPLICATES)).fetchall()
+            
+            if duplicate_names:
+                issues.append({
+                    "type": "duplicate_names",
+                    "count": len(duplicate_names),
+                    "details": [{"name": name, "count": count} for name, count in duplicate_names]
+                })
+        
+        _append_count_issues(issues, counts)
         
         return {
-            "total_teams": session.execute(select(func.count(Team.id))).scalar(),
+            "total_teams": counts["total"],
             "issues": issues,
-            "quality_score": max(0, 100 - len(issues) * 10)
+            "quality_score": _score(issues)
         }
     
-    async def _check_players_quality(self, session: Session) -> Dict[str, Any]:
+    async def _check_players_quality(self, session: AsyncSession) -> Dict[str, Any]:
         """Check players data quality."""
         issues = []
         
-        # Check for duplicate players (same name and team)
-        duplicate_players = session.execute(
-            select(Player.name, Player.team_id, func.count(Player.id))
-            .group_by(Player.name, Player.team_id)
-            .having(func.count(Player.id) > 1)
-        ).fetchall()
-        
-        if duplicate_players:
-            issues.append({
-                "type": "duplicate_players",
-                "count": len(duplicate_players),
-                "details": [{"name": name, "team_id": team_id, "count": count} 
-                           for name, team_id, count in duplicate_players]
-            })
-        
-        # Check for missing required fields
-        missing_names = session.execute(
-            select(func.count(Player.id))
-            .where((Player.name == "") | (Player.name.is_(None)))
-        ).scalar()
+        # Totals, missing names, missing team references and future birth dates in one scan
+        counts = await _count_rows(session, _PLAYER_COUNTS, today=date.today())
         
-        if missing_names > 0:
-            issues.append({
-                "type": "missing_names",
-                "count": missing_names
-            })
-        
-        # Check for invalid team references
-        invalid_teams = session.execute(
-            select(func.count(Player.id))
-            .where(Player.team_id.is_(None))
-        ).scalar()
-        
-        if invalid_teams > 0:
-            issues.append({
-                "type": "invalid_team_references",
-                "count": invalid_teams
-            })
-        
-        # Check for future birth dates
-        future_birth_dates = session.execute(
-            select(func.count(Player.id))
-            .where(Player.date_of_birth > date.today())
-        ).scalar()
+        # Check for duplicate players (same name and team)
+        if counts["distinct_keys"] < counts["total"]:
+            duplicate_players = (await session.execute(_PLAYER_DUPLICATES)).fetchall()
+            
+            if duplicate_players:
+                issues.append({
+                    "type": "duplicate_players",
+                    "count": len(duplicate_players),
+                    "details": [{"name": name, "team_id": team_id, "count": count} 
+                               for name, team_id, count in duplicate_players]
+                })
         
-        if future_birth_dates > 0:
-            issues.append({
-                "type": "future_birth_dates",
-                "count": future_birth_dates
-            })
+        _append_count_issues(issues, counts)
         
         return {
-            "total_players": session.execute(select(func.count(Player.id))).scalar(),
+            "total_players": counts["total"],
             "issues": issues,
-            "quality_score": max(0, 100 - len(issues) * 10)
+            "quality_score": _score(issues)
         }
     
-    async def _check_matches_quality(self, session: Session) -> Dict[str, Any]:
+    async def _check_matches_quality(self, session: AsyncSession) -> Dict[str, Any]:
         """Check matches data quality."""
         issues = []
         
-        # Check for duplicate matches (same teams and date)
-        duplicate_matches = session.execute(
-            select(Match.home_team_id, Match.away_team_id, Match.match_date, func.count(Match.id))
-            .group_by(Match.home_team_id, Match.away_team_id, Match.match_date)
-            .having(func.count(Match.id) > 1)
-        ).fetchall()
-        
-        if duplicate_matches:
-            issues.append({
-                "type": "duplicate_matches",
-                "count": len(duplicate_matches),
-                "details": [{"home_team_id": home, "away_team_id": away, "date": date, "count": count}
-                           for home, away, date, count in duplicate_matches]
-            })
-        
-        # Check for future matches with completed status
-        future_completed = session.execute(
-            select(func.count(Match.id))
-            .where((Match.match_date > date.today()) & (Match.status == "completed"))
-        ).scalar()
-        
-        if future_completed > 0:
-            issues.append({
-                "type": "future_completed_matches",
-                "count": future_completed
-            })
+        # Totals, future matches marked completed, and matches with same home and away team
+        counts = await _count_rows(session, _MATCH_COUNTS, today=date.today())
         
-        # Check for matches with same home and away team
-        same_team_matches = session.execute(
-            select(func.count(Match.id))
-            .where(Match.home_team_id == Match.away_team_id)
-        ).scalar()
+        # Check for duplicate matches (same teams and date)
+        if counts["distinct_keys"] < counts["total"]:
+            duplicate_matches = (await session.execute(_MATCH_DUPLICATES)).fetchall()
+            
+            if duplicate_matches:
+                issues.append({
+                    "type": "duplicate_matches",
+                    "count": len(duplicate_matches),
+                    "details": [{"home_team_id": home, "away_team_id": away, "date": date, "count": count}
+                               for home, away, date, count in duplicate_matches]
+                })
         
-        if same_team_matches > 0:
-            issues.append({
-                "type": "same_team_matches",
-                "count": same_team_matches
-            })
+        _append_count_issues(issues, counts)
         
         return {
-            "total_matches": session.execute(select(func.count(Match.id))).scalar(),
+            "total_matches": counts["total"],
             "issues": issues,
-            "quality_score": max(0, 100 - len(issues) * 10)
+            "quality_score": _score(issues)
         }
     
-    async def _check_innings_quality(self, session: Session) -> Dict[str, Any]:
+    async def _check_innings_quality(self, session: AsyncSession) -> Dict[str, Any]:
         """Check innings data quality."""
         issues = []
         
-        # Check for duplicate innings (same match and inning number)
-        duplicate_innings = session.execute(
-            select(Inning.match_id, Inning.inning_number, func.count(Inning.id))
-            .group_by(Inning.match_id, Inning.inning_number)
-            .having(func.count(Inning.id) > 1)
-        ).fetchall()
-        
-        if duplicate_innings:
-            issues.append({
-                "type": "duplicate_innings",
-                "count": len(duplicate_innings),
-                "details": [{"match_id": match_id, "inning_number": inning_num, "count": count}
-                           for match_id, inning_num, count in duplicate_innings]
-            })
-        
-        # Check for invalid scores
-        invalid_scores = session.execute(
-            select(func.count(Inning.id))
-            .where((Inning.runs_scored < 0) | (Inning.wickets_lost < 0) | (Inning.wickets_lost > 10))
-        ).scalar()
+        # Totals, invalid scores and invalid overs in one scan
+        counts = await _count_rows(session, _INNING_COUNTS)
         
-        if invalid_scores > 0:
-            issues.append({
-                "type": "invalid_scores",
-                "count": invalid_scores
-            })
-        
-        # Check for invalid overs
-        invalid_overs = session.execute(
-            select(func.count(Inning.id))
-            .where((Inning.overs_bowled < 0) | (Inning.balls_bowled < 0) | (Inning.balls_bowled > 5))
-        ).scalar()
+        # Check for duplicate innings (same match and inning number)
+        if counts["distinct_keys"] < counts["total"]:
+            duplicate_innings = (await session.execute(_INNING_DUPLICATES)).fetchall()
+            
+            if duplicate_innings:
+                issues.append({
+                    "type": "duplicate_innings",
+                    "count": len(duplicate_innings),
+                    "details": [{"match_id": match_id, "inning_number": inning_num, "count": count}
+                               for match_id, inning_num, count in duplicate_innings]
+                })
         
-        if invalid_overs > 0:
-            issues.append({
-                "type": "invalid_overs",
-                "count": invalid_overs
-            })
+        _append_count_issues(issues, counts)
         
         return {
-            "total_innings": session.execute(select(func.count(Inning.id))).scalar(),
+            "total_innings": counts["total"],
             "issues": issues,
-            "quality_score": max(0, 100 - len(issues) * 10)
+            "quality_score": _score(issues)
         }
     
-    async def _check_ball_by_ball_quality(self, session: Session) -> Dict[str, Any]:
+    async def _check_ball_by_ball_quality(self, session: AsyncSession) -> Dict[str, Any]:
         """Check ball-by-ball data quality."""
         issues = []
         
-        # Check for duplicate balls (same inning, over, and ball number)
-        duplicate_balls = session.execute(
-            select(BallByBall.inning_id, BallByBall.over_number, BallByBall.ball_number, func.count(BallByBall.id))
-            .group_by(BallByBall.inning_id, BallByBall.over_number, BallByBall.ball_number)
-            .having(func.count(BallByBall.id) > 1)
-        ).fetchall()
-        
-        if duplicate_balls:
-            issues.append({
-                "type": "duplicate_balls",
-                "count": len(duplicate_balls),
-                "details": [{"inning_id": inning_id, "over": over, "ball": ball, "count": count}
-                           for inning_id, over, ball, count in duplicate_balls]
-            })
-        
-        # Check for invalid runs
-        invalid_runs = session.execute(
-            select(func.count(BallByBall.id))
-            .where((BallByBall.runs_scored < 0) | (BallByBall.runs_scored > 6))
-        ).scalar()
+        # Totals, invalid runs and inconsistent boundary flags in one scan
+        counts = await _count_rows(session, _BALL_COUNTS)
         
-        if invalid_runs > 0:
-            issues.append({
-                "type": "invalid_runs",
-                "count": invalid_runs
-            })
-        
-        # Check for inconsistent boundary flags
-        inconsistent_boundaries = session.execute(
-            select(func.count(BallByBall.id))
-            .where(
-                ((BallByBall.is_six == True) & (BallByBall.runs_scored != 6)) |
-                ((BallByBall.is_four == True) & (BallByBall.runs_scored != 4))
-            )
-        ).scalar()
+        # Check for duplicate balls (same inning, over, and ball number)
+        if counts["distinct_keys"] < counts["total"]:
+            duplicate_balls = (await session.execute(_BALL_DUPLICATES)).fetchall()
+            
+            if duplicate_balls:
+                issues.append({
+                    "type": "duplicate_balls",
+                    "count": len(duplicate_balls),
+                    "details": [{"inning_id": inning_id, "over": over, "ball": ball, "count": count}
+                               for inning_id, over, ball, count in duplicate_balls]
+                })
         
-        if inconsistent_boundaries > 0:
-            issues.append({
-                "type": "inconsistent_boundary_flags",
-                "count": inconsistent_boundaries
-            })
+        _append_count_issues(issues, counts)
         
         return {
-            "total_balls": session.execute(select(func.count(BallByBall.id))).scalar(),
+            "total_balls": counts["total"],
             "issues": issues,
-            "quality_score": max(0, 100 - len(issues) * 10)
+            "quality_score": _score(issues)
         }
     
-    async def _check_player_stats_quality(self, session: Session) -> Dict[str, Any]:
+    async def _check_player_stats_quality(self, session: AsyncSession) -> Dict[str, Any]:
         """Check player statistics data quality."""
         issues = []
         
+        # Totals and invalid statistics in one scan
+        counts = await _count_rows(session, _STATS_COUNTS)
+        
         # Check for duplicate stats (same player and match)
-        duplicate_stats = session.execute(
-            select(PlayerMatchStats.player_id, PlayerMatchStats.match_id, func.count(PlayerMatchStats.id))
-            .group_by(PlayerMatchStats.player_id, PlayerMatchStats.match_id)
-            .having(func.count(PlayerMatchStats.id) > 1)
-        ).fetchall()
-        
-        if duplicate_stats:
-            issues.append({
-                "type": "duplicate_stats",
-                "count": len(duplicate_stats),
-                "details": [{"player_id": player_id, "match_id": match_id, "count": count}
-                           for player_id, match_id, count in duplicate_stats]
-            })
-        
-        # Check for invalid statistics
-        invalid_stats = session.execute(
-            select(func.count(PlayerMatchStats.id))
-            .where(
-                (PlayerMatchStats.runs_scored < 0) |
-                (PlayerMatchStats.balls_faced < 0) |
-                (PlayerMatchStats.wickets_taken < 0) |
-                (PlayerMatchStats.runs_conceded < 0)
-            )
-        ).scalar()
+        if counts["distinct_keys"] < counts["total"]:
+            duplicate_stats = (await session.execute(_STATS_DUPLICATES)).fetchall()
+            
+            if duplicate_stats:
+                issues.append({
+                    "type": "duplicate_stats",
+                    "count": len(duplicate_stats),
+                    "details": [{"player_id": player_id, "match_id": match_id, "count": count}
+                               for player_id, match_id, count in duplicate_stats]
+                })
         
-        if invalid_stats > 0:
-            issues.append({
-                "type": "invalid_statistics",
-                "count": invalid_stats
-            })
+        _append_count_issues(issues, counts)
         
         return {
-            "total_stats": session.execute(select(func.count(PlayerMatchStats.id))).scalar(),
+            "total_stats": counts["total"],
             "issues": issues,
-            "quality_score": max(0, 100 - len(issues) * 10)
+            "quality_score": _score(issues)
         }
     
-    async def _check_referential_integrity(self, session: Session) -> Dict[str, Any]:
+    async def _check_referential_integrity(self, session: AsyncSession) -> Dict[str, Any]:
         """Check referential integrity between tables."""
         issues = []
         
-        # Check for players with invalid team references
-        invalid_player_teams = session.execute(
-            select(func.count(Player.id))
-            .where(~Player.team_id.in_(select(Team.id)))
-        ).scalar()
-        
-        if invalid_player_teams > 0:
-            issues.append({
-                "type": "invalid_player_team_references",
-                "count": invalid_player_teams
-            })
-        
-        # Check for matches with invalid team references
-        invalid_match_teams = session.execute(
-            select(func.count(Match.id))
-            .where(
-                ~Match.home_team_id.in_(select(Team.id)) |
-                ~Match.away_team_id.in_(select(Team.id))
-            )
-        ).scalar()
-        
-        if invalid_match_teams > 0:
-            issues.append({
-                "type": "invalid_match_team_references",
-                "count": invalid_match_teams
-            })
-        
-        # Check for innings with invalid match references
-        invalid_inning_matches = session.execute(
-            select(func.count(Inning.id))
-            .where(~Inning.match_id.in_(select(Match.id)))
-        ).scalar()
-        
-        if invalid_inning_matches > 0:
-            issues.append({
-                "type": "invalid_inning_match_references",
-                "count": invalid_inning_matches
-            })
-        
-        # Check for ball-by-ball with invalid inning references
-        invalid_ball_innings = session.execute(
-            select(func.count(BallByBall.id))
-            .where(~BallByBall.inning_id.in_(select(Inning.id)))
-        ).scalar()
-        
-        if invalid_ball_innings > 0:
-            issues.append({
-                "type": "invalid_ball_inning_references",
-                "count": invalid_ball_innings
-            })
+        # All four orphan counts come back in one round-trip
+        _append_count_issues(issues, await _count_rows(session, _ORPHAN_COUNTS))
         
         return {
             "issues": issues,
-            "quality_score": max(0, 100 - len(issues) * 15)
+            "quality_score": _score(issues, penalty=15)
         }
     
+    def _load_cache(self) -> Optional[Dict[str, dict]]:
+        if self.cache_path is None:
+            return None
+        if self._cache is None:
+            try:
+                stored = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                stored = {}
+            # Results are only valid for the database they were computed against
+            self._cache = stored.get("checks", {}) if stored.get("database") == _database_fingerprint() else {}
+        return self._cache
+    
+    def _save_cache(self, cache: Dict[str, dict]) -> None:
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {"database": _database_fingerprint(), "checks": cache}
+            self.cache_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not write quality check cache {self.cache_path}: {e}")
+    
+    @staticmethod
+    async def _run_in_session(check: Callable[[AsyncSession], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Run one check group on its own async session, so groups overlap on the event loop."""
+        async with get_async_session() as session:
+            return await check(session)
+    
     def _calculate_quality_score(self, checks: Dict[str, Any]) -> float:
         """Calculate overall data quality score."""
-        if not checks:
-            return 0.0
-        
-        scores = []
-        for check_name, check_result in checks.items():
-            if isinstance(check_result, dict) and "quality_score" in check_result:
-                scores.append(check_result["quality_score"])
-        
-        if not scores:
+        try:
+            return round(fmean(
+                check_result["quality_score"]
+                for check_result in checks.values()
+                if isinstance(check_result, dict) and "quality_score" in check_result
+            ), 2)
+        except StatisticsError:
+            # No scored checks
             return 0.0
-        
-        return round(sum(scores) / len(scores), 2)
     
     async def check_duplicates(self, table_name: str, fields: List[str]) -> List[Dict[str, Any]]:
         """Check for duplicate records in a specific table."""
@@ -452,21 +558,18 @@ class DataQualityChecker:
         
         logger.info("Checking data freshness")
         
-        with get_session() as session:
-            # Check for old matches without recent updates
-            old_matches = session.execute(
-                select(func.count(Match.id))
-                .where(Match.updated_at < datetime.now() - timedelta(days=30))
-            ).scalar()
-            
-            # Check for players without recent activity
-            inactive_players = session.execute(
-                select(func.count(Player.id))
-                .where(Player.updated_at < datetime.now() - timedelta(days=90))
-            ).scalar()
+        # Both stale-record counts in one round-trip
+        now = datetime.now()
+        async with get_async_session() as session:
+            counts = await _count_rows(
+                session,
+                _FRESHNESS_COUNTS,
+                match_cutoff=now - timedelta(days=30),
+                player_cutoff=now - timedelta(days=90),
+            )
             
             return {
-                "old_matches": old_matches,
-                "inactive_players": inactive_players,
+                "old_matches": counts["old_matches"],
+                "inactive_players": counts["inactive_players"],
                 "last_check": datetime.now().isoformat()
             }
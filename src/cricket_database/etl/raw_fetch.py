@@ -5,7 +5,7 @@ Features:
 - Robots.txt check (informational)
 - Randomized delays, max RPS enforcement
 - Retries with jitter using tenacity
-- Persists every response into raw_html with SHA256 + ETag dedupe
+- Persists every response (zlib-compressed) into raw_html with SHA256 + ETag dedupe
 
 IMPORTANT NOTES:
 - CricketArchive may require logged-in sessions and restrict automated access
@@ -18,27 +18,37 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import importlib.util
 import random
 import time
+import zlib
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import re
 
 import httpx
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
 
-from sqlalchemy import select, insert
+from sqlalchemy import (
+    BigInteger, Column, DateTime, Insert, Integer, MetaData, Row, Select, String, Table, bindparam, select,
+)
+from sqlalchemy.dialects.mysql import LONGBLOB
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.orm import Session
 
+from . import raw_store
 from ..etl.config import get_etl_config
 from ..database import get_database_engine
-from ..models.base import Base
 from ..models import matches  # noqa: F401 (ensure models import side effects if needed)
 
 
 cfg = get_etl_config()
 
+# httpx only speaks HTTP/2 with the optional h2 package (pip install httpx[http2])
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 
 def _join_url(base: str, url: str) -> str:
     if url.startswith("http://") or url.startswith("https://"):
@@ -46,44 +56,84 @@ def _join_url(base: str, url: str) -> str:
     return base.rstrip("/") + "/" + url.lstrip("/")
 
 
+def _compile_patterns(patterns: Tuple[str, ...], kind: str) -> Tuple[re.Pattern, ...]:
+    # Compiled once per fetcher; invalid patterns are reported here and then ignored
+    compiled = []
+    for pat in patterns:
+        try:
+            compiled.append(re.compile(pat))
+        except re.error:
+            logger.warning(f"Invalid {kind} pattern: {pat}")
+    return tuple(compiled)
+
+
 class RateLimiter:
-    def __init__(self, rps: float):
-        self.min_interval = 1.0 / max(rps, 0.0001)
-        self._last_ts = 0.0
+    """Token bucket: up to ``burst`` requests pass at once, then ``rps`` on average.
+
+    Each caller reserves its token before sleeping (the balance may go negative),
+    so concurrent waiters are spaced out by the deficit instead of polling.
+    """
+
+    def __init__(self, rps: float, burst: int = 1):
+        self.rate = max(rps, 0.0001)
+        self.capacity = float(max(burst, 1))
+        self._tokens = self.capacity
+        self._last_ts = time.monotonic()
 
     async def wait(self):
-        now = time.perf_counter()
-        delta = now - self._last_ts
-        if delta < self.min_interval:
-            await asyncio.sleep(self.min_interval - delta)
-        self._last_ts = time.perf_counter()
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_ts) * self.rate)
+        self._last_ts = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+def _shuffled_user_agents() -> Iterator[str]:
+    # Every agent once per pass, in a fresh random order each pass
+    agents = list(cfg.scraper.user_agents)
+    while True:
+        random.shuffle(agents)
+        yield from agents
+
+
+_UA_STREAM = _shuffled_user_agents()
 
 
 def _ua() -> str:
-    uas = cfg.scraper.user_agents
-    return random.choice(uas)
+    return next(_UA_STREAM)
 
 
-def _hash_sha256(data: bytes) -> str:
-    h = hashlib.sha256()
-    h.update(data)
-    return h.hexdigest()
+def _content_hash(data: bytes) -> str:
+    # Always SHA-256: raw_html.sha256 is the dedupe key and the raw_store file name
+    return hashlib.sha256(data).hexdigest()
 
 
 async def _robots_txt_check(client: httpx.AsyncClient, base_url: str) -> None:
     try:
         robots_url = _join_url(base_url, "/robots.txt")
-        r = await client.get(robots_url, timeout=10)
+        r = await client.get(robots_url, headers={"User-Agent": _ua()}, timeout=10)
         logger.info(f"robots.txt status={r.status_code} for {robots_url}")
     except Exception as e:
         logger.warning(f"robots.txt fetch failed: {e}")
 
 
-async def _fetch_httpx(url: str, rate_limiter: RateLimiter, etag: Optional[str] = None, headers_only: bool = False) -> Tuple[int, bytes, Optional[str]]:
+async def _fetch_httpx(url: str, rate_limiter: RateLimiter, etag: Optional[str] = None, headers_only: bool = False, client: Optional[httpx.AsyncClient] = None) -> Tuple[int, bytes, Optional[str]]:
     headers = {"User-Agent": _ua()}
     if etag:
         headers["If-None-Match"] = etag
 
+    async def _send(c: httpx.AsyncClient) -> Tuple[int, bytes, Optional[str]]:
+        if headers_only:
+            resp = await c.head(url, headers=headers, timeout=30)
+        else:
+            resp = await c.get(url, headers=headers, timeout=30)
+        if resp.status_code == 304:
+            # Unchanged since the stored copy: nothing to download or persist
+            return 304, b"", resp.headers.get("ETag", etag)
+        resp.raise_for_status()
+        return resp.status_code, (b"" if headers_only else resp.content), resp.headers.get("ETag")
+
     @retry(
         reraise=True,
         stop=stop_after_attempt(cfg.scraper.max_retries),
@@ -93,20 +143,16 @@ async def _fetch_httpx(url: str, rate_limiter: RateLimiter, etag: Optional[str]
     async def _do() -> Tuple[int, bytes, Optional[str]]:
         await rate_limiter.wait()
         await asyncio.sleep(random.uniform(0.1, 0.5))  # randomized politeness delay
-        async with httpx.AsyncClient(follow_redirects=True, headers=headers) as client:
-            if headers_only:
-                resp = await client.head(url, timeout=30)
-            else:
-                resp = await client.get(url, timeout=30)
-            resp.raise_for_status()
-            return resp.status_code, (b"" if headers_only else resp.content), resp.headers.get("ETag")
+        if client is not None:
+            return await _send(client)
+        async with httpx.AsyncClient(follow_redirects=True) as own_client:
+            return await _send(own_client)
 
     return await _do()
 
 
-async def _fetch_playwright(url: str, rate_limiter: RateLimiter) -> Tuple[int, bytes, Optional[str]]:
-    # Lazy import to avoid heavy init
-    from playwright.async_api import async_playwright
+async def _fetch_playwright(url: str, rate_limiter: RateLimiter, contexts: asyncio.Queue) -> Tuple[int, bytes, Optional[str]]:
+    """Render ``url`` in a page of a pooled browser context (see ``RawFetcher._ensure_browser``)."""
 
     @retry(
         reraise=True,
@@ -116,140 +162,273 @@ async def _fetch_playwright(url: str, rate_limiter: RateLimiter) -> Tuple[int, b
     async def _do() -> Tuple[int, bytes, Optional[str]]:
         await rate_limiter.wait()
         await asyncio.sleep(random.uniform(0.1, 0.5))
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=cfg.playwright.run_headless)
-            context = await browser.new_context(user_agent=_ua())
+        context = await contexts.get()
+        try:
             page = await context.new_page()
-            resp = await page.goto(url, wait_until="networkidle")
-            content = await page.content()
-            await browser.close()
-            status = resp.status if resp else 200
-            return status, content.encode("utf-8"), None
+            try:
+                resp = await page.goto(url, wait_until="networkidle")
+                content = await page.content()
+            finally:
+                await page.close()
+        finally:
+            contexts.put_nowait(context)
+        status = resp.status if resp else 200
+        return status, content.encode("utf-8"), None
 
     return await _do()
 
 
-def _persist_raw(session: Session, source_id: int, url: str, status: int, body: bytes, etag: Optional[str]) -> Tuple[int, str]:
-    sha = _hash_sha256(body)
-    # Dedup: check existing sha
-    row = session.execute(
-        "SELECT id FROM raw_html WHERE sha256 = %s LIMIT 1",
-        (sha,),
-    ).fetchone()
-    if row:
-        return int(row[0]), sha
-
-    result = session.execute(
-        insert(Base.metadata.tables["raw_html"]).values(
-            source_id=source_id,
-            url=url,
-            fetched_at=datetime.now(timezone.utc),
-            http_status=status,
-            body=body.decode("utf-8", errors="ignore"),
-            etag=etag,
-            sha256=sha,
-        )
+# Fetched pages are buffered and written to raw_html in batches of this many rows
+PERSIST_BATCH_SIZE = 64
+# Bodies are stored zlib-compressed (HTML shrinks ~5-10x); readers inflate via parse_load.decode_raw_body
+RAW_BODY_ZLIB_LEVEL = 6
+
+
+def _raw_row(source_id: int, url: str, status: int, body: bytes, etag: Optional[str]) -> Dict[str, Any]:
+    sha = _content_hash(body)
+    stored = zlib.compress(body, RAW_BODY_ZLIB_LEVEL)
+    root = raw_store.body_dir()
+    if root is not None:
+        # Body goes to the external store; the row keeps only metadata
+        raw_store.write_body(root, sha, stored)
+        stored = None
+    return {
+        "source_id": source_id,
+        "url": url,
+        "fetched_at": datetime.now(timezone.utc),
+        "http_status": status,
+        "body": stored,
+        "etag": etag,
+        "sha256": sha,
+    }
+
+
+# raw_html is created by the SQL schema, not the ORM models: described here on its own
+# MetaData so setup-db's create_all never touches it
+_RAW_HTML = Table(
+    "raw_html",
+    MetaData(),
+    Column("id", BigInteger, primary_key=True, autoincrement=True),
+    Column("source_id", Integer),
+    Column("url", String(1024)),
+    Column("fetched_at", DateTime),
+    Column("http_status", Integer),
+    Column("body", LONGBLOB, nullable=True),
+    Column("etag", String(255)),
+    Column("sha256", String(64), unique=True),
+)
+
+
+@lru_cache(maxsize=None)
+def _sha_lookup() -> Select:
+    """Prebuilt ``sha256 IN (:shas)`` lookup, so SQLAlchemy reuses its compiled form on every batch."""
+    return select(_RAW_HTML.c.sha256, _RAW_HTML.c.id).where(_RAW_HTML.c.sha256.in_(bindparam("shas", expanding=True)))
+
+
+@lru_cache(maxsize=None)
+def _raw_upsert() -> Insert:
+    """Multi-row raw_html insert; a page already stored (same sha256) gets its fetched_at and ETag refreshed."""
+    stmt = mysql_insert(_RAW_HTML)
+    return stmt.on_duplicate_key_update(fetched_at=stmt.inserted.fetched_at, etag=stmt.inserted.etag)
+
+
+@lru_cache(maxsize=None)
+def _latest_version_lookup() -> Select:
+    """Prebuilt lookup of the newest stored copy of a URL: (id, etag, sha256)."""
+    return (
+        select(_RAW_HTML.c.id, _RAW_HTML.c.etag, _RAW_HTML.c.sha256)
+        .where(_RAW_HTML.c.url == bindparam("url"))
+        .order_by(_RAW_HTML.c.fetched_at.desc())
+        .limit(1)
     )
-    raw_id = result.inserted_primary_key[0]
-    return int(raw_id), sha
+
+
+def _latest_version(url: str) -> Optional[Row]:
+    with Session(get_database_engine()) as session:
+        return session.execute(_latest_version_lookup(), {"url": url}).first()
+
+
+def _persist_raw(session: Session, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Upsert raw_html rows (deduped on the unique sha256); returns sha256 -> raw_id.
+
+    One multi-row INSERT ... ON DUPLICATE KEY UPDATE and one id lookup per batch,
+    however many rows it holds. Needs the unique key from db/ddl/902_uq_raw_html_sha256.sql.
+    """
+    session.execute(_raw_upsert(), rows)
+    # MySQL has no RETURNING: read the ids back by sha
+    shas = list({row["sha256"]: None for row in rows})
+    return {sha: int(raw_id) for sha, raw_id in session.execute(_sha_lookup(), {"shas": shas})}
 
 
 class RawFetcher:
-    def __init__(self, use_browser: bool = False, dry_run: bool = False, headers_only: bool = False) -> None:
+    def __init__(self, use_browser: bool = False, dry_run: bool = False, headers_only: bool = False, batch_size: int = PERSIST_BATCH_SIZE) -> None:
         self.use_browser = use_browser
-        self.rate_limiter = RateLimiter(cfg.scraper.rate_limit_rps)
+        self.rate_limiter = RateLimiter(cfg.scraper.rate_limit_rps, cfg.scraper.rate_limit_burst)
         self.base_url = str(cfg.scraper.cricketarchive_base_url)
         self.source_id = cfg.sources.cricketarchive_source_id
         self.dry_run = dry_run
         self.headers_only = headers_only
+        self._client: Optional[httpx.AsyncClient] = None
+        # Caps in-flight requests; with HTTP/2 many can share one pooled connection
+        self._slots = asyncio.Semaphore(max(cfg.scraper.concurrency, 1))
+        # Playwright is started on the first browser fetch and kept for the fetcher's lifetime
+        self._playwright = None
+        self._browser = None
+        self._contexts: Optional[asyncio.Queue] = None
+        self._browser_lock = asyncio.Lock()
+        self.batch_size = max(batch_size, 1)
+        self._pending: List[Dict[str, Any]] = []
+        self._block_res = _compile_patterns(cfg.scraper.blocklist, "blocklist")
+        self._allow_res = _compile_patterns(cfg.scraper.allowlist, "allowlist")
+        # sha256 -> raw_id for every row persisted by this fetcher
+        self.raw_ids: Dict[str, int] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # One pooled client per fetcher so concurrent fetches share keep-alive connections
+        if self._client is None:
+            limit = max(cfg.scraper.concurrency, 1)
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2,
+                follow_redirects=True,
+                timeout=30,
+                limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+            )
+        return self._client
+
+    def flush(self) -> Dict[str, int]:
+        """Write buffered pages to raw_html in one transaction; returns sha256 -> raw_id for them."""
+        if not self._pending:
+            return {}
+        rows, self._pending = self._pending, []
+        with Session(get_database_engine()) as session:
+            ids = _persist_raw(session, rows)
+            session.commit()
+        self.raw_ids.update(ids)
+        return ids
+
+    def _queue(self, url: str, status: int, body: bytes, etag: Optional[str]) -> str:
+        row = _raw_row(self.source_id, url, status, body, etag)
+        self._pending.append(row)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        return row["sha256"]
+
+    async def _ensure_browser(self) -> asyncio.Queue:
+        """Launch Chromium once and fill a pool of reusable contexts (one per concurrent fetch)."""
+        async with self._browser_lock:
+            if self._contexts is None:
+                # Lazy import to avoid heavy init
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=cfg.playwright.run_headless)
+                contexts: asyncio.Queue = asyncio.Queue()
+                for _ in range(max(cfg.scraper.concurrency, 1)):
+                    contexts.put_nowait(await self._browser.new_context(user_agent=_ua()))
+                self._contexts = contexts
+        return self._contexts
+
+    async def _close_browser(self) -> None:
+        # Closing the browser closes its contexts too
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        self._contexts = None
+
+    async def aclose(self) -> None:
+        self.flush()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        await self._close_browser()
+
+    async def __aenter__(self) -> "RawFetcher":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
 
     def _allowed(self, url: str) -> bool:
         # Blocklist takes precedence
-        for pat in cfg.scraper.blocklist:
-            try:
-                if re.search(pat, url):
-                    return False
-            except re.error:
-                logger.warning(f"Invalid blocklist pattern: {pat}")
+        if any(r.search(url) for r in self._block_res):
+            return False
         # If allowlist present, must match at least one
         if cfg.scraper.allowlist:
-            for pat in cfg.scraper.allowlist:
-                try:
-                    if re.search(pat, url):
-                        return True
-                except re.error:
-                    logger.warning(f"Invalid allowlist pattern: {pat}
-                    ")
-            return False
+            return any(r.search(url) for r in self._allow_res)
         return True
 
     async def _fetch(self, url: str, etag: Optional[str] = None) -> Tuple[int, bytes, Optional[str]]:
         if not self._allowed(url):
             logger.warning(f"URL blocked by list rules: {url}")
             return 0, b"", None
-        if self.use_browser:
-            return await _fetch_playwright(url, self.rate_limiter)
-        return await _fetch_httpx(url, self.rate_limiter, etag=etag, headers_only=self.headers_only)
+        async with self._slots:
+            if self.use_browser:
+                return await _fetch_playwright(url, self.rate_limiter, await self._ensure_browser())
+            return await _fetch_httpx(url, self.rate_limiter, etag=etag, headers_only=self.headers_only, client=self._get_client())
+
+    async def _stored_version(self, url: str) -> Optional[Row]:
+        # Only the httpx path can send If-None-Match, and dry runs may have no database
+        if self.use_browser or self.dry_run:
+            return None
+        # Sync driver: query in a worker thread so concurrent fetches keep running
+        return await asyncio.to_thread(_latest_version, url)
+
+    async def _fetch_and_queue(self, url: str) -> str:
+        """Fetch ``url`` (conditionally, if a copy with an ETag is stored) and queue it for persisting.
+
+        Returns the page's content hash; a 304 returns the stored copy's hash without writing anything.
+        """
+        stored = await self._stored_version(url)
+        status, body, etag = await self._fetch(url, etag=stored.etag if stored else None)
+        if self.dry_run:
+            logger.info(f"[dry-run] fetched status={status} url={url}")
+            return ""
+        if status == 304 and stored is not None:
+            self.raw_ids[stored.sha256] = int(stored.id)
+            return stored.sha256
+        return self._queue(url, status, body, etag)
 
-    async def fetch_series_index(self, *, year: Optional[int] = None, competition: Optional[str] = None, relative_url: Optional[str] = None) -> Tuple[int, str]:
+    async def fetch_series_index(self, *, year: Optional[int] = None, competition: Optional[str] = None, relative_url: Optional[str] = None) -> str:
         url = _join_url(self.base_url, relative_url) if relative_url else self.base_url
         if year is not None:
             url = _join_url(self.base_url, f"/Archive/Events/{year}.html")
         if competition:
             url = _join_url(self.base_url, f"/Archive/Events/{competition}.html")
-        status, body, etag = await self._fetch(url)
-        if self.dry_run:
-            logger.info(f"[dry-run] fetched status={status} url={url}")
-            return 0, ""
-        with Session(get_database_engine()) as session:
-            raw_id, sha = _persist_raw(session, self.source_id, url, status, body, etag)
-            session.commit()
-        return raw_id, sha
+        return await self._fetch_and_queue(url)
 
-    async def fetch_match_list(self, *, series_id: str | int, relative_url: Optional[str] = None) -> Tuple[int, str]:
+    async def fetch_match_list(self, *, series_id: str | int, relative_url: Optional[str] = None) -> str:
         if relative_url:
             url = _join_url(self.base_url, relative_url)
         else:
             url = _join_url(self.base_url, f"/Archive/Events/{series_id}.html")
-        status, body, etag = await self._fetch(url)
-        if self.dry_run:
-            logger.info(f"[dry-run] fetched status={status} url={url}")
-            return 0, ""
-        with Session(get_database_engine()) as session:
-            raw_id, sha = _persist_raw(session, self.source_id, url, status, body, etag)
-            session.commit()
-        return raw_id, sha
+        return await self._fetch_and_queue(url)
 
-    async def fetch_scorecard(self, *, match_url: str) -> Tuple[int, str]:
+    async def fetch_scorecard(self, *, match_url: str) -> str:
         url = _join_url(self.base_url, match_url)
-        status, body, etag = await self._fetch(url)
-        if self.dry_run:
-            logger.info(f"[dry-run] fetched status={status} url={url}")
-            return 0, ""
-        with Session(get_database_engine()) as session:
-            raw_id, sha = _persist_raw(session, self.source_id, url, status, body, etag)
-            session.commit()
-        return raw_id, sha
+        return await self._fetch_and_queue(url)
 
 
 # CLI integration helper (will be wired through Typer in main CLI)
 async def cli_fetch(series_key: Optional[str], from_date: Optional[str], max_pages: Optional[int], dry_run: bool, use_browser: bool, headers_only: bool = False, max_new_matches: Optional[int] = None) -> None:
     fetcher = RawFetcher(use_browser=use_browser, dry_run=dry_run, headers_only=headers_only)
-    async with httpx.AsyncClient(headers={"User-Agent": _ua()}) as client:
-        await _robots_txt_check(client, fetcher.base_url)
-
-    # For demo: fetch series index by key/year
-    if series_key and series_key.isdigit():
-        year = int(series_key)
-        status, sha = (0, "")
-        rid, sha = await fetcher.fetch_series_index(year=year)
-        logger.info(f"Fetched series index for {year}: raw_id={rid} sha={sha}")
-    elif series_key:
-        rid, sha = await fetcher.fetch_series_index(competition=series_key)
-        logger.info(f"Fetched series index for competition={series_key}: raw_id={rid} sha={sha}")
-    else:
-        rid, sha = await fetcher.fetch_series_index()
-        logger.info(f"Fetched default series index: raw_id={rid} sha={sha}")
+    async with fetcher:
+        await _robots_txt_check(fetcher._get_client(), fetcher.base_url)
+
+        # For demo: fetch series index by key/year
+        if series_key and series_key.isdigit():
+            year = int(series_key)
+            sha = await fetcher.fetch_series_index(year=year)
+            label = f"series index for {year}"
+        elif series_key:
+            sha = await fetcher.fetch_series_index(competition=series_key)
+            label = f"series index for competition={series_key}"
+        else:
+            sha = await fetcher.fetch_series_index()
+            label = "default series index"
+    logger.info(f"Fetched {label}: raw_id={fetcher.raw_ids.get(sha, 0)} sha={sha}")
 
     # Apply safety cap on new matches/pages per run
     cap = max_new_matches or cfg.scraper.max_new_matches
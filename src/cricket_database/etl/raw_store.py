@@ -0,0 +1,54 @@
+"""Content-addressed store for raw page bodies kept outside the database.
+
+With ``RAW_BODY_DIR`` set, the raw fetcher writes each compressed body once to
+``{RAW_BODY_DIR}/{sha[:2]}/{sha}`` and raw_html keeps only the metadata row
+(``body`` NULL). Readers resolve a NULL body by its content hash via ``read_body``.
+The directory can be local disk or a mounted bucket (S3/MinIO via s3fs or
+mountpoint-s3); the key layout is the same either way.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from .config import get_etl_config
+
+
+def body_dir() -> Optional[Path]:
+    return get_etl_config().scraper.raw_body_dir
+
+
+def body_path(root: Path, sha: str) -> Path:
+    # Two-character fan-out keeps directories small
+    return root / sha[:2] / sha
+
+
+def write_body(root: Path, sha: str, data: bytes) -> bool:
+    """Store ``data`` under its hash unless already present (content-addressed dedup).
+
+    Written to a temp file and renamed into place, so readers never see a partial body.
+    Returns whether a new object was written.
+    """
+    path = body_path(root, sha)
+    if path.exists():
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{sha}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return True
+
+
+def read_body(sha: str) -> bytes:
+    root = body_dir()
+    if root is None:
+        raise FileNotFoundError(f"raw_html body for {sha} is external but RAW_BODY_DIR is not set")
+    return body_path(root, sha).read_bytes()
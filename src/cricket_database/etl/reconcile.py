@@ -1,22 +1,36 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import json
 import os
+import time
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 
 from loguru import logger
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from difflib import SequenceMatcher
 
 from ..database import get_database_engine
 
+try:
+    # C++ best-match search; the difflib loop below is the fallback
+    from rapidfuzz import fuzz
+    from rapidfuzz.process import extractOne
+except ImportError:
+    extractOne = None
+
 
 @dataclass
 class ReconcileConfig:
     cricinfo_dsn: str
     repo_root: Path
+    cache_ttl_seconds: int = 900
 
 
 def load_config() -> ReconcileConfig:
@@ -24,14 +38,61 @@ def load_config() -> ReconcileConfig:
     if not dsn:
         raise RuntimeError("CRICINFO_RO_DSN not set in environment")
     root = Path(os.getcwd())
-    return ReconcileConfig(cricinfo_dsn=dsn, repo_root=root)
+    ttl = int(os.environ.get("RECONCILE_CACHE_TTL", "900"))
+    return ReconcileConfig(cricinfo_dsn=dsn, repo_root=root, cache_ttl_seconds=ttl)
+
+
+CACHE_FILENAME = ".reconcile_cache.json"
+# Rows per server-side cursor fetch when reading the players tables
+PLAYER_YIELD_PER = 10_000
+
+
+@lru_cache(maxsize=4)
+def _old_engine(dsn: str) -> Engine:
+    """One pooled engine per old-schema DSN, shared by every report in the process."""
+    return create_engine(dsn, pool_size=5, pool_pre_ping=True, future=True)
+
+
+def _cache_fingerprint(cfg: ReconcileConfig, key: str, threshold: float, exact: bool = False) -> str:
+    # Hash rather than store the DSN, which carries credentials
+    raw = f"{key}|{threshold}|{cfg.cricinfo_dsn}" + ("|exact" if exact else "")
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _load_cache(cache_path: Path) -> Dict[str, dict]:
+    try:
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
 
 
-def profile_old_schema(cfg: ReconcileConfig) -> Dict[str, int]:
-    """Return row counts per table from old Cricinfo DB."""
-    engine = create_engine(cfg.cricinfo_dsn, pool_pre_ping=True, future=True)
+def _cached_output(cache: Dict[str, dict], key: str, fingerprint: str, ttl: int) -> Optional[str]:
+    """Return a previously generated report path if it is still fresh for the same source."""
+    entry = cache.get(key)
+    if not entry or entry.get("fingerprint") != fingerprint:
+        return None
+    if time.time() - float(entry.get("created_at", 0)) > ttl:
+        return None
+    path = entry.get("path")
+    if not path or not Path(path).exists():
+        return None
+    return path
+
+
+def profile_old_schema(cfg: ReconcileConfig, exact: bool = False) -> Dict[str, int]:
+    """Return row counts per table from old Cricinfo DB.
+
+    By default one ``information_schema`` query returns InnoDB's ``TABLE_ROWS`` estimate
+    for every table; ``exact=True`` runs a ``COUNT(*)`` per table instead (a full scan each).
+    """
+    engine = _old_engine(cfg.cricinfo_dsn)
     counts: Dict[str, int] = {}
     with engine.connect() as conn:
+        if not exact:
+            rows = conn.exec_driver_sql(
+                "SELECT TABLE_NAME, TABLE_ROWS FROM information_schema.tables WHERE table_schema = DATABASE()"
+            ).fetchall()
+            return {str(r[0]): int(r[1] or 0) for r in rows}
         tables = conn.exec_driver_sql("SHOW TABLES").fetchall()
         for (tname,) in tables:
             try:
@@ -74,7 +135,7 @@ COMMIT;
 
 def generate_duplicate_players_report(cfg: ReconcileConfig, out_dir: Path) -> Path:
     """Example: detect potential duplicate players by (full_name, born_date)."""
-    engine = create_engine(cfg.cricinfo_dsn, pool_pre_ping=True, future=True)
+    engine = _old_engine(cfg.cricinfo_dsn)
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / "cricinfo_dup_players.csv"
     with engine.connect() as conn, out_path.open("w", newline="", encoding="utf-8") as f:
@@ -92,18 +153,110 @@ def _norm_name(name: str) -> str:
     return " ".join(name.lower().strip().split())
 
 
+def _player_block(norm: str) -> str:
+    # First two letters of the surname (last token)
+    return norm.rsplit(" ", 1)[-1][:2]
+
+
+def _team_block(norm: str) -> str:
+    return norm[:3]
+
+
+def _matchers(choices: List[str]) -> Optional[List[SequenceMatcher]]:
+    """difflib fallback only: one matcher per choice with it as ``seq2``.
+
+    SequenceMatcher indexes ``seq2`` when it is set, so each choice is indexed once
+    and every query only swaps in ``seq1``.
+    """
+    if extractOne is not None:
+        return None
+    matchers = []
+    for choice in choices:
+        m = SequenceMatcher(None)
+        m.set_seq2(choice)
+        matchers.append(m)
+    return matchers
+
+
+def _best_match(
+    query: str, choices: List[str], threshold: float, matchers: Optional[List[SequenceMatcher]] = None
+) -> Tuple[int, float]:
+    if extractOne is not None:
+        # O(len(choices)) memory instead of a full score matrix, and the cutoff lets
+        # rapidfuzz skip choices that cannot beat the best so far
+        found = extractOne(query, choices, scorer=fuzz.ratio, processor=None, score_cutoff=threshold * 100)
+        return (found[2], found[1] / 100) if found else (-1, 0.0)
+    best_score, best_idx = 0.0, -1
+    for j, m in enumerate(matchers):
+        m.set_seq1(query)
+        score = m.ratio()
+        if score > best_score:
+            best_score, best_idx = score, j
+    return (best_idx, best_score) if best_idx >= 0 and best_score >= threshold else (-1, 0.0)
+
+
+def _best_matches(
+    queries: List[str],
+    choices: List[str],
+    threshold: float,
+    block_key: Optional[Callable[[str], str]] = None,
+) -> List[Tuple[int, float]]:
+    """For each query, the index of its most similar choice and that similarity (0-1).
+
+    Similarity is the SequenceMatcher-style ratio (rapidfuzz ``fuzz.ratio`` when
+    installed). Ties go to the earliest choice; queries with no choice scoring
+    at least ``threshold`` get ``(-1, 0.0)``.
+
+    With ``block_key``, a query is only compared with the choices sharing its key
+    (record-linkage blocking); the full list is searched only when that block is empty.
+    """
+    if not choices:
+        return [(-1, 0.0)] * len(queries)
+    # Identical normalised names (most teams, many players) are a perfect score:
+    # resolve them by dict lookup and skip the fuzzy search
+    exact: Dict[str, int] = {}
+    for j, choice in enumerate(choices):
+        exact.setdefault(choice, j)
+    all_matchers = _matchers(choices)
+    if block_key is None:
+        return [
+            (exact[query], 1.0) if query in exact else _best_match(query, choices, threshold, all_matchers)
+            for query in queries
+        ]
+
+    blocks: Dict[str, List[int]] = defaultdict(list)
+    for j, choice in enumerate(choices):
+        blocks[block_key(choice)].append(j)
+    block_choices = {key: [choices[j] for j in idx] for key, idx in blocks.items()}
+    block_matchers = {key: [all_matchers[j] for j in idx] for key, idx in blocks.items()} if all_matchers else {}
+
+    matches = []
+    for query in queries:
+        if query in exact:
+            matches.append((exact[query], 1.0))
+            continue
+        key = block_key(query)
+        if key not in blocks:
+            matches.append(_best_match(query, choices, threshold, all_matchers))
+            continue
+        j, score = _best_match(query, block_choices[key], threshold, block_matchers.get(key))
+        matches.append((blocks[key][j], score) if j >= 0 else (-1, 0.0))
+    return matches
+
+
 def _fetch_old_players(cfg: ReconcileConfig) -> List[Tuple[str, Optional[str]]]:
-    engine = create_engine(cfg.cricinfo_dsn, pool_pre_ping=True, future=True)
-    with engine.connect() as conn:
-        rows = conn.exec_driver_sql("SELECT full_name, born_date FROM players").fetchall()
-    return [(str(r[0]), str(r[1]) if r[1] is not None else None) for r in rows]
+    engine = _old_engine(cfg.cricinfo_dsn)
+    # Server-side cursor: only PLAYER_YIELD_PER raw rows are buffered besides the result list
+    with engine.connect().execution_options(stream_results=True, yield_per=PLAYER_YIELD_PER) as conn:
+        result = conn.exec_driver_sql("SELECT full_name, born_date FROM players")
+        return [(str(r[0]), str(r[1]) if r[1] is not None else None) for r in result]
 
 
 def _fetch_new_players() -> List[Tuple[str, Optional[str]]]:
     engine = get_database_engine()
-    with engine.connect() as conn:
-        rows = conn.exec_driver_sql("SELECT full_name, NULL as born_date FROM players").fetchall()
-    return [(str(r[0]), None) for r in rows]
+    with engine.connect().execution_options(stream_results=True, yield_per=PLAYER_YIELD_PER) as conn:
+        result = conn.exec_driver_sql("SELECT full_name FROM players")
+        return [(str(r[0]), None) for r in result]
 
 
 def generate_player_mapping_candidates(cfg: ReconcileConfig, out_dir: Path, threshold: float = 0.9) -> Path:
@@ -114,21 +267,20 @@ def generate_player_mapping_candidates(cfg: ReconcileConfig, out_dir: Path, thre
     with out_path.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(["old_full_name", "old_born_date", "new_full_name", "sim_score"])
-        new_norm = [(_norm_name(n), n, dob) for (n, dob) in new_players]
-        for oname, odob in old_players:
-            onorm = _norm_name(oname)
-            best: Tuple[float, Optional[str]] = (0.0, None)
-            for nnorm, nname, ndob in new_norm:
-                score = SequenceMatcher(None, onorm, nnorm).ratio()
-                if score > best[0]:
-                    best = (score, nname)
-            if best[0] >= threshold:
-                w.writerow([oname, odob or "", best[1], f"{best[0]:.3f}"])
+        matches = _best_matches(
+            [_norm_name(n) for n, _ in old_players],
+            [_norm_name(n) for n, _ in new_players],
+            threshold,
+            block_key=_player_block,
+        )
+        for (oname, odob), (j, score) in zip(old_players, matches):
+            if j >= 0:
+                w.writerow([oname, odob or "", new_players[j][0], f"{score:.3f}"])
     return out_path
 
 
 def _fetch_old_teams(cfg: ReconcileConfig) -> List[str]:
-    engine = create_engine(cfg.cricinfo_dsn, pool_pre_ping=True, future=True)
+    engine = _old_engine(cfg.cricinfo_dsn)
     with engine.connect() as conn:
         rows = conn.exec_driver_sql("SELECT DISTINCT name FROM teams").fetchall()
     return [str(r[0]) for r in rows]
@@ -149,46 +301,54 @@ def generate_team_mapping_candidates(cfg: ReconcileConfig, out_dir: Path, thresh
     with out_path.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(["old_team", "new_team", "sim_score"])
-        new_norm = [(_norm_name(n), n) for n in new_teams]
-        for oname in old_teams:
-            onorm = _norm_name(oname)
-            best: Tuple[float, Optional[str]] = (0.0, None)
-            for nnorm, nname in new_norm:
-                score = SequenceMatcher(None, onorm, nnorm).ratio()
-                if score > best[0]:
-                    best = (score, nname)
-            if best[0] >= threshold:
-                w.writerow([oname, best[1], f"{best[0]:.3f}"])
+        matches = _best_matches(
+            [_norm_name(n) for n in old_teams], [_norm_name(n) for n in new_teams], threshold, block_key=_team_block
+        )
+        for oname, (j, score) in zip(old_teams, matches):
+            if j >= 0:
+                w.writerow([oname, new_teams[j], f"{score:.3f}"])
     return out_path
 
 
-def reconcile_main(reports: List[str], threshold: float = 0.9) -> Dict[str, str]:
+def reconcile_main(reports: List[str], threshold: float = 0.9, refresh: bool = False, exact: bool = False) -> Dict[str, str]:
+    """Generate the requested reports, reusing outputs younger than RECONCILE_CACHE_TTL seconds.
+
+    Cached outputs are only reused for the same report key, threshold and source DSN; pass
+    ``refresh=True`` to regenerate regardless. ``exact=True`` makes the counts report use
+    ``COUNT(*)`` rather than the table-statistics estimate.
+    """
     cfg = load_config()
     reports_dir = cfg.repo_root / "docs" / "reports"
     migrations_dir = cfg.repo_root / "db" / "migrations"
+    cache_path = reports_dir / CACHE_FILENAME
+    cache = _load_cache(cache_path)
     outputs: Dict[str, str] = {}
 
-    if "counts" in reports:
-        counts = profile_old_schema(cfg)
-        path = write_counts_report(counts, reports_dir)
-        outputs["counts"] = str(path)
-
-    if "missing_matches" in reports:
-        path = generate_missing_matches_sql("", migrations_dir)
-        outputs["missing_matches"] = str(path)
-
-    if "dup_players" in reports:
-        path = generate_duplicate_players_report(cfg, reports_dir)
-        outputs["dup_players"] = str(path)
-
-    if "players_map" in reports:
-        path = generate_player_mapping_candidates(cfg, reports_dir, threshold=threshold)
-        outputs["players_map"] = str(path)
-
-    if "teams_map" in reports:
-        path = generate_team_mapping_candidates(cfg, reports_dir, threshold=threshold)
-        outputs["teams_map"] = str(path)
-
+    generators = {
+        "counts": lambda: write_counts_report(profile_old_schema(cfg, exact=exact), reports_dir),
+        "missing_matches": lambda: generate_missing_matches_sql("", migrations_dir),
+        "dup_players": lambda: generate_duplicate_players_report(cfg, reports_dir),
+        "players_map": lambda: generate_player_mapping_candidates(cfg, reports_dir, threshold=threshold),
+        "teams_map": lambda: generate_team_mapping_candidates(cfg, reports_dir, threshold=threshold),
+    }
+
+    dirty = False
+    for key, generate in generators.items():
+        if key not in reports:
+            continue
+        fingerprint = _cache_fingerprint(cfg, key, threshold, exact=exact and key == "counts")
+        cached = None if refresh else _cached_output(cache, key, fingerprint, cfg.cache_ttl_seconds)
+        if cached:
+            logger.info(f"reconcile: reusing cached {key} report {cached}")
+            outputs[key] = cached
+            continue
+        path = str(generate())
+        outputs[key] = path
+        cache[key] = {"fingerprint": fingerprint, "path": path, "created_at": time.time()}
+        dirty = True
+
+    if dirty:
+        reports_dir.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
     return outputs
 
-
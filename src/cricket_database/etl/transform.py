@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from .models import MatchModel, InningsModel, BattingEntry, BowlingEntry, FieldingEntry, Delivery
 
@@ -28,6 +28,15 @@ def to_rows(match: MatchModel, source_id: int) -> Dict[str, List[dict]]:
         "player_alias": [],
         "source_keys": [],
     }
+    # The same ~22 players fill every batting/bowling/delivery row: emit each once
+    seen_players: Set[str] = set()
+    seen_teams: Set[str] = set()
+
+    def add_player(name: Optional[str]) -> None:
+        if name and name not in seen_players:
+            seen_players.add(name)
+            rows["players"].append({"full_name": name, "country_name": None})
+            rows["player_alias"].append({"alias": name, "source_id": source_id})
 
     # Venue
     if match.venue and match.venue.name:
@@ -46,8 +55,9 @@ def to_rows(match: MatchModel, source_id: int) -> Dict[str, List[dict]]:
 
     # Teams + aliases
     for t in match.teams:
-        if not t.name:
+        if not t.name or t.name in seen_teams:
             continue
+        seen_teams.add(t.name)
         rows["teams"].append({"name": t.name, "country_name": None})
         rows["team_alias"].append({"alias": t.name, "source_id": source_id})
 
@@ -87,8 +97,7 @@ def to_rows(match: MatchModel, source_id: int) -> Dict[str, List[dict]]:
             "follow_on_enforced": int(bool(inn.follow_on_enforced)),
         })
         for be in inn.batting:
-            rows["players"].append({"full_name": be.player.name, "country_name": None})
-            rows["player_alias"].append({"alias": be.player.name, "source_id": source_id})
+            add_player(be.player.name)
             rows["batting_innings"].append({
                 "player_full_name": be.player.name,
                 "position": be.position,
@@ -102,8 +111,7 @@ def to_rows(match: MatchModel, source_id: int) -> Dict[str, List[dict]]:
                 "fielder_full_name": be.fielder.name if be.fielder else None,
             })
         for bw in inn.bowling:
-            rows["players"].append({"full_name": bw.player.name, "country_name": None})
-            rows["player_alias"].append({"alias": bw.player.name, "source_id": source_id})
+            add_player(bw.player.name)
             rows["bowling_innings"].append({
                 "player_full_name": bw.player.name,
                 "overs": bw.overs,
@@ -115,13 +123,11 @@ def to_rows(match: MatchModel, source_id: int) -> Dict[str, List[dict]]:
                 "econ": bw.econ,
             })
         for d in inn.deliveries:
-            rows["players"].extend([
-                {"full_name": d.striker.name, "country_name": None},
-                {"full_name": d.non_striker.name, "country_name": None},
-                {"full_name": d.bowler.name, "country_name": None},
-            ])
+            add_player(d.striker.name)
+            add_player(d.non_striker.name)
+            add_player(d.bowler.name)
             if d.dismissal_player:
-                rows["players"].append({"full_name": d.dismissal_player.name, "country_name": None})
+                add_player(d.dismissal_player.name)
             rows["deliveries"].append({
                 "over_no": d.over_no,
                 "ball_no": d.ball_no,
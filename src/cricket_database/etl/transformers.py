@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime, date
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from pydantic import ValidationError
 
@@ -178,8 +178,8 @@ class DataTransformer:
         logger.info(f"Transformed {len(transformed_innings)} innings")
         return transformed_innings
     
-    def transform_ball_by_ball(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Transform raw ball-by-ball data."""
+    def transform_ball_by_ball(self, raw_data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Transform raw ball-by-ball data (a list of dicts or a scraper ``BallBuffer``)."""
         transformed_balls = []
         
         for ball_data in raw_data:
@@ -1,6 +1,6 @@
 """Ball-by-ball model for cricket database."""
 
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Index, Text
+from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Index, UniqueConstraint, Text
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -56,12 +56,13 @@ class BallByBall(Base):
     wicket_player = relationship("Player", foreign_keys=[wicket_player_id])
     
     __table_args__ = (
-        Index("idx_ball_inning_over", "inning_id", "over_number", "ball_number"),
+        UniqueConstraint("inning_id", "over_number", "ball_number", name="uq_ball_inning_over_ball"),
         Index("idx_ball_batsman", "batsman_id", "runs_scored"),
         Index("idx_ball_bowler", "bowler_id", "is_wicket"),
         Index("idx_ball_wickets", "is_wicket", "wicket_type"),
         Index("idx_ball_boundaries", "is_boundary", "is_six", "is_four"),
         Index("idx_ball_extras", "is_wide", "is_no_ball", "is_bye", "is_leg_bye"),
+        Index("idx_ball_updated_at", "updated_at"),
     )
     
     @property
@@ -2,7 +2,7 @@
 
 from enum import Enum
 
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Index, Enum as SQLEnum
+from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Index, UniqueConstraint, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -61,9 +61,10 @@ class Inning(Base):
     
     # Indexes for common queries
     __table_args__ = (
-        Index("idx_inning_match_number", "match_id", "inning_number"),
+        UniqueConstraint("match_id", "inning_number", name="uq_inning_match_number"),
         Index("idx_inning_teams", "batting_team_id", "bowling_team_id"),
         Index("idx_inning_status", "status"),
+        Index("idx_inning_updated_at", "updated_at"),
     )
     
     @property
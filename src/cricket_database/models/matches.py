@@ -3,7 +3,7 @@
 from datetime import datetime, date
 from enum import Enum
 
-from sqlalchemy import Column, String, Integer, DateTime, Date, Boolean, ForeignKey, Text, Index, Enum as SQLEnum
+from sqlalchemy import Column, String, Integer, DateTime, Date, Boolean, ForeignKey, Text, Index, UniqueConstraint, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -95,10 +95,11 @@ class Match(Base):
     # Indexes for common queries
     __table_args__ = (
         Index("idx_match_date_type", "match_date", "match_type"),
-        Index("idx_match_teams_date", "home_team_id", "away_team_id", "match_date"),
+        UniqueConstraint("home_team_id", "away_team_id", "match_date", name="uq_match_teams_date"),
         Index("idx_match_series", "series_name", "match_number"),
         Index("idx_match_venue_date", "venue_name", "match_date"),
         Index("idx_match_status_date", "status", "match_date"),
+        Index("idx_match_updated_at", "updated_at"),
     )
     
     @property
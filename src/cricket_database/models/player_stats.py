@@ -1,6 +1,6 @@
 """Player statistics models for cricket database."""
 
-from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, Index, Date
+from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, Index, UniqueConstraint, Date
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -51,9 +51,10 @@ class PlayerMatchStats(Base):
     
     # Indexes for common queries
     __table_args__ = (
-        Index("idx_player_match", "player_id", "match_id"),
+        UniqueConstraint("player_id", "match_id", name="uq_player_match"),
         Index("idx_player_team_date", "player_id", "team_id", "match_date"),
         Index("idx_match_type_date", "match_type", "match_date"),
+        Index("idx_player_stats_updated_at", "updated_at"),
     )
     
     @property
@@ -3,7 +3,7 @@
 from datetime import date
 from typing import Optional
 
-from sqlalchemy import Column, String, Integer, Date, Boolean, ForeignKey, Index
+from sqlalchemy import Column, String, Integer, Date, Boolean, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -52,9 +52,11 @@ class Player(Base):
     
     # Indexes for common queries
     __table_args__ = (
+        UniqueConstraint("name", "team_id", name="uq_player_name_team"),
         Index("idx_player_team_active", "team_id", "is_active"),
         Index("idx_player_role_nationality", "primary_role", "nationality"),
         Index("idx_player_birth_year", "date_of_birth"),
+        Index("idx_player_updated_at", "updated_at"),
     )
     
     @property
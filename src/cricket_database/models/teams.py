@@ -36,6 +36,7 @@ class Team(Base):
     __table_args__ = (
         Index("idx_team_country_active", "country", "is_active"),
         Index("idx_team_playing_formats", "is_test_playing", "is_odi_playing", "is_t20_playing"),
+        Index("idx_team_updated_at", "updated_at"),
     )
     
     def __repr__(self) -> str:
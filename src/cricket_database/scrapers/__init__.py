@@ -1,10 +1,11 @@
 """Cricket data scrapers."""
 
-from .base import BaseScraper, ScrapingError
+from .base import BallBuffer, BaseScraper, ScrapingError
 from .espn_scraper import ESPNScraper
 from .cricket_api_scraper import CricketAPIScraper
 
 __all__ = [
+    "BallBuffer",
     "BaseScraper",
     "ScrapingError", 
     "ESPNScraper",
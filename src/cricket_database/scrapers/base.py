@@ -4,7 +4,7 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
 import httpx
@@ -57,9 +57,46 @@ class RateLimiter:
         self.hour_requests.append(now)
 
 
+class BallBuffer:
+    """Column-oriented buffer for raw ball-by-ball records.
+
+    Keeps one list per field instead of one dict per delivery, so a large
+    extraction stays compact; rows are rebuilt one at a time when iterated.
+    """
+
+    __slots__ = ("fields", "columns")
+
+    def __init__(self, fields: Sequence[str]):
+        self.fields = tuple(fields)
+        self.columns: Dict[str, List[Any]] = {name: [] for name in self.fields}
+
+    def append(self, record: Dict[str, Any]) -> None:
+        for name, column in self.columns.items():
+            column.append(record.get(name))
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        if isinstance(records, BallBuffer) and records.fields == self.fields:
+            for name, column in self.columns.items():
+                column.extend(records.columns[name])
+        else:
+            for record in records:
+                self.append(record)
+
+    def __len__(self) -> int:
+        return len(self.columns[self.fields[0]]) if self.fields else 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        fields = self.fields
+        for values in zip(*self.columns.values()):
+            yield dict(zip(fields, values))
+
+
 class BaseScraper(ABC):
     """Base scraper class with common functionality."""
     
+    # Fields of the records in a BallBuffer returned by scrape_match_details
+    BALL_FIELDS: Tuple[str, ...] = ()
+    
     def __init__(
         self,
         base_url: str,
@@ -4,12 +4,20 @@ import asyncio
 from datetime import datetime, date
 from typing import Any, Dict, List, Optional
 
-from .base import BaseScraper, ScrapingError
+from .base import BallBuffer, BaseScraper, ScrapingError
 
 
 class CricketAPIScraper(BaseScraper):
     """Cricket API scraper for structured cricket data."""
     
+    BALL_FIELDS = (
+        "inning_id", "over_number", "ball_number", "batsman_id", "bowler_id",
+        "non_striker_id", "runs_scored", "is_wicket", "wicket_type",
+        "wicket_player_id", "is_wide", "is_no_ball", "is_bye", "is_leg_bye",
+        "ball_type", "shot_type", "fielding_position", "is_boundary", "is_six",
+        "is_four", "commentary", "notes", "cricket_api_id", "source",
+    )
+    
     def __init__(self, api_key: Optional[str] = None, dry_run: bool = False):
         super().__init__(
             base_url="https://api.cricket.com",
@@ -153,13 +161,13 @@ class CricketAPIScraper(BaseScraper):
             if isinstance(ball_by_ball_response, dict) and "data" in ball_by_ball_response:
                 match_details["ball_by_ball"] = self._process_ball_by_ball_data(ball_by_ball_response["data"])
             else:
-                match_details["ball_by_ball"] = []
+                match_details["ball_by_ball"] = BallBuffer(self.BALL_FIELDS)
             
             return match_details
             
         except Exception as e:
             logger.error(f"Failed to scrape match details for {match_id}: {e}")
-            return {"match_id": match_id, "ball_by_ball": []}
+            return {"match_id": match_id, "ball_by_ball": BallBuffer(self.BALL_FIELDS)}
     
     def _process_team_data(self, team_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Process raw team data from API."""
@@ -293,9 +301,9 @@ class CricketAPIScraper(BaseScraper):
             logger.warning(f"Failed to process match data: {e}")
             return None
     
-    def _process_ball_by_ball_data(self, ball_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _process_ball_by_ball_data(self, ball_data: List[Dict[str, Any]]) -> BallBuffer:
         """Process raw ball-by-ball data from API."""
-        processed_balls = []
+        processed_balls = BallBuffer(self.BALL_FIELDS)
         
         for ball in ball_data:
             try:
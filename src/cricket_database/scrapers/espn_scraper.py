@@ -7,12 +7,17 @@ from urllib.parse import urljoin
 
 from lxml import html, etree
 
-from .base import BaseScraper, ScrapingError
+from .base import BallBuffer, BaseScraper, ScrapingError
 
 
 class ESPNScraper(BaseScraper):
     """ESPN Cricinfo scraper for cricket data."""
     
+    BALL_FIELDS = (
+        "over_number", "ball_number", "runs_scored", "is_wicket",
+        "wicket_type", "is_wide", "is_no_ball", "commentary",
+    )
+    
     def __init__(self, dry_run: bool = False):
         super().__init__(
             base_url="https://www.espncricinfo.com",
@@ -373,11 +378,11 @@ class ESPNScraper(BaseScraper):
                 "source": "espn_cricinfo"
             }
         
-        return {"match_id": match_id, "ball_by_ball": []}
+        return {"match_id": match_id, "ball_by_ball": BallBuffer(self.BALL_FIELDS)}
     
-    def _extract_ball_by_ball_data(self, tree: etree._Element) -> List[Dict[str, Any]]:
+    def _extract_ball_by_ball_data(self, tree: etree._Element) -> BallBuffer:
         """Extract ball-by-ball data from match page."""
-        balls = []
+        balls = BallBuffer(self.BALL_FIELDS)
         
         # Look for ball-by-ball data in the page
         ball_elements = tree.xpath('//div[contains(@class, "ball")]')
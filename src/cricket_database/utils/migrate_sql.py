@@ -1,6 +1,6 @@
 """SQL migration runner for applying .sql files in db/ddl in lexical order.
 
-Uses SQLAlchemy engine (mysql+mysqlconnector) to execute raw SQL statements.
+Uses the SQLAlchemy engine (mysqlclient or mysql-connector) to execute raw SQL statements.
 """
 
 from __future__ import annotations
@@ -36,8 +36,7 @@ def split_sql_batches(sql_text: str) -> Iterable[str]:
     - For typical schema files without custom delimiters, splits on semicolons.
     """
     # Simple heuristic: if we see DELIMITER, execute whole text as one batch
-    upper = sql_text.upper()
-    if "\nDELIMITER " in upper or upper.startswith("DELIMITER "):
+    if _has_delimiter_blocks(sql_text):
         yield sql_text
         return
 
@@ -55,16 +54,50 @@ def split_sql_batches(sql_text: str) -> Iterable[str]:
         yield tail
 
 
+def _has_delimiter_blocks(sql_text: str) -> bool:
+    upper = sql_text.upper()
+    return "\nDELIMITER " in upper or upper.startswith("DELIMITER ")
+
+
+def _execute_multi(cursor, sql_text: str) -> None:
+    """Send several statements in one round-trip and drain every result set."""
+    try:
+        # mysql-connector < 9.2 only accepts multi-statement text via multi=True
+        for result in cursor.execute(sql_text, multi=True) or ():
+            if result.with_rows:
+                result.fetchall()
+        return
+    except TypeError:
+        pass
+    # mysqlclient / newer mysql-connector: plain execute + nextset()
+    cursor.execute(sql_text)
+    while True:
+        if cursor.description is not None:
+            cursor.fetchall()
+        if not cursor.nextset():
+            break
+
+
 def apply_sql_file(engine: Engine, file_path: Path) -> Tuple[str, int]:
-    """Apply a single SQL file; returns (filename, statements_executed)."""
+    """Apply a single SQL file; returns (filename, statements_executed).
+
+    Plain schema files are shipped to the server as one multi-statement batch inside
+    a single transaction rather than one round-trip per statement.
+    """
     sql_text = read_sql_file(file_path)
-    executed = 0
+    batches = list(split_sql_batches(sql_text))
     with engine.begin() as conn:
-        for batch in split_sql_batches(sql_text):
-            # Use exec_driver_sql to allow DDL and multiple dialect-specific statements
-            conn.exec_driver_sql(batch)
-            executed += 1
-    return (file_path.name, executed)
+        if len(batches) <= 1 or _has_delimiter_blocks(sql_text):
+            for batch in batches:
+                # Use exec_driver_sql to allow DDL and multiple dialect-specific statements
+                conn.exec_driver_sql(batch)
+        else:
+            cursor = conn.connection.dbapi_connection.cursor()
+            try:
+                _execute_multi(cursor, "\n".join(batches))
+            finally:
+                cursor.close()
+    return (file_path.name, len(batches))
 
 
 def ensure_migrations_table(engine: Engine) -> None:
@@ -11,6 +11,8 @@ from rich.table import Table
 from cricket_database.etl.config import get_etl_config
 from cricket_database.etl.raw_fetch import RawFetcher
 from cricket_database.etl.parse_scorecard import parse_scorecard
+from cricket_database.etl.parse_load import decode_raw_body
+from cricket_database.etl.models import dump_match_json
 from cricket_database.etl.transform import to_rows
 from cricket_database.etl.load import load_rows
 from cricket_database.database import get_database_engine
@@ -71,17 +73,18 @@ def fetch(max_items: int = typer.Option(50, "--max-items"), use_browser: bool =
         return
 
     async def run():
-        for p in items:
-            payload = json.loads(p.read_text(encoding="utf-8"))
-            url = payload.get("url")
-            if not url:
+        async with fetcher:
+            for p in items:
+                payload = json.loads(p.read_text(encoding="utf-8"))
+                url = payload.get("url")
+                if not url:
+                    _dequeue(p)
+                    continue
+                status, body, etag = await fetcher._fetch(url)
+                # Persist handled by RawFetcher helpers in separate flows; here we only fetch & let parse/load use DB
+                # Keep item for parse stage; dequeue now to avoid re-fetch loops
                 _dequeue(p)
-                continue
-            status, body, etag = await fetcher._fetch(url)
-            # Persist handled by RawFetcher helpers in separate flows; here we only fetch & let parse/load use DB
-            # Keep item for parse stage; dequeue now to avoid re-fetch loops
-            _dequeue(p)
-            console.print(f"[green]Fetched[/green] {url} status={status}")
+                console.print(f"[green]Fetched[/green] {url} status={status}")
 
     asyncio.run(run())
 
@@ -158,15 +161,15 @@ def parse(max_items: int = typer.Option(50, "--max-items")):
     engine = get_database_engine()
     with engine.connect() as conn:
         rows = conn.exec_driver_sql(
-            "SELECT id, url, body FROM raw_html ORDER BY fetched_at DESC LIMIT %s", (max_items,)
+            "SELECT id, url, body, sha256 FROM raw_html ORDER BY fetched_at DESC LIMIT %s", (max_items,)
         ).fetchall()
     count = 0
-    for rid, url, body in rows:
+    for rid, url, body, sha in rows:
         try:
-            match, warnings = parse_scorecard(str(body), page_url=str(url))
+            match, warnings = parse_scorecard(decode_raw_body(body, sha), page_url=str(url))
             key = match.source_match_key or f"raw{rid}"
             out_path = CACHE_DIR / f"{key}.json"
-            out_path.write_text(match.model_dump_json(indent=2), encoding="utf-8")
+            out_path.write_text(dump_match_json(match, indent=2), encoding="utf-8")
             count += 1
         except Exception as e:
             console.print(f"[red]Parse failed raw_id={rid}[/red] {e}")
@@ -187,8 +190,8 @@ def load(max_items: int = typer.Option(20, "--max-items")):
         try:
             data = json.loads(f.read_text(encoding="utf-8"))
             # Reconstruct MatchModel via Pydantic (lazy import to avoid cycles)
-            from cricket_database.etl.models import MatchModel
-            m = MatchModel.model_validate(data)
+            from cricket_database.etl.models import validate_match
+            m = validate_match(data)
             rows = to_rows(m, cfg.sources.cricketarchive_source_id)
             load_rows(engine, rows)
             loaded += 1